@@ -1,6 +1,42 @@
 use std::env;
 use std::fs::File;
-use std::io::Read;
+use std::io::{self, BufWriter, Read, Write};
+
+/// Find the first occurrence of `needle` lying entirely within `data[start..end]`
+fn find_bytes(data: &[u8], start: usize, end: usize, needle: &[u8]) -> Option<usize> {
+    data.get(start..end)?
+        .windows(needle.len())
+        .position(|window| window == needle)
+        .map(|offset| start + offset)
+}
+
+/// Integer decoders for one TIFF byte order, chosen once per header
+#[derive(Clone, Copy)]
+struct ByteOrder {
+    u16: fn([u8; 2]) -> u16,
+    u32: fn([u8; 4]) -> u32,
+}
+
+const LITTLE_ENDIAN: ByteOrder = ByteOrder {
+    u16: u16::from_le_bytes,
+    u32: u32::from_le_bytes,
+};
+
+const BIG_ENDIAN: ByteOrder = ByteOrder {
+    u16: u16::from_be_bytes,
+    u32: u32::from_be_bytes,
+};
+
+/// Decode a 12-byte IFD entry into (tag, type, count, value/offset)
+fn read_ifd_entry(entry: &[u8], order: ByteOrder) -> (u16, u16, u32, u32) {
+    let entry: &[u8; 12] = entry.try_into().expect("IFD entry is 12 bytes");
+    (
+        (order.u16)([entry[0], entry[1]]),
+        (order.u16)([entry[2], entry[3]]),
+        (order.u32)([entry[4], entry[5], entry[6], entry[7]]),
+        (order.u32)([entry[8], entry[9], entry[10], entry[11]]),
+    )
+}
 
 fn main() -> Result<(), Box<dyn std::error::Error>> {
     let args: Vec<String> = env::args().collect();
@@ -10,7 +46,9 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
     }
 
     let file_path = &args[1];
-    println!("Analyzing EXIF segments in file: {}", file_path);
+    let stdout = io::stdout();
+    let mut out = BufWriter::new(stdout.lock());
+    writeln!(out, "Analyzing EXIF segments in file: {}", file_path)?;
 
     // Read the file as bytes
     let mut file = File::open(file_path)?;
@@ -31,100 +69,88 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
 
             // Look for "Exif" identifier
             let segment_start = pos + 4;
-            for exif_start in segment_start..segment_end.saturating_sub(4) {
-                if &data[exif_start..exif_start + 4] == b"Exif" {
-                    segment_count += 1;
-                    println!("\n=== EXIF Segment {} ===", segment_count);
-                    println!("Position: {}", pos);
-                    println!("Length: {} bytes", length);
-                    println!("EXIF data length: {} bytes", segment_end - exif_start - 4);
+            if let Some(exif_start) =
+                find_bytes(&data, segment_start, segment_end.saturating_sub(1), b"Exif")
+            {
+                segment_count += 1;
+                writeln!(out, "\n=== EXIF Segment {} ===", segment_count)?;
+                writeln!(out, "Position: {}", pos)?;
+                writeln!(out, "Length: {} bytes", length)?;
+                writeln!(out, "EXIF data length: {} bytes", segment_end - exif_start - 4)?;
+                
+                let exif_data_start = exif_start + 4;
+                if exif_data_start < segment_end {
+                    let exif_data = &data[exif_data_start..segment_end];
                     
-                    let exif_data_start = exif_start + 4;
-                    if exif_data_start < segment_end {
-                        let exif_data = &data[exif_data_start..segment_end];
-                        
-                        // Look for TIFF header
-                        for i in 0..exif_data.len().saturating_sub(8) {
-                            if &exif_data[i..i + 2] == b"II" || &exif_data[i..i + 2] == b"MM" {
-                                let byte_order = if &exif_data[i..i + 2] == b"II" {
-                                    "Little-endian"
-                                } else {
-                                    "Big-endian"
-                                };
-                                println!("TIFF header found at offset {}: {}", i, byte_order);
-                                
-                                // Read TIFF version
-                                if i + 4 < exif_data.len() {
-                                    let version = u16::from_le_bytes([exif_data[i + 2], exif_data[i + 3]]);
-                                    println!("TIFF version: {}", version);
-                                }
+                    // Look for TIFF header
+                    for i in 0..exif_data.len().saturating_sub(8) {
+                        if &exif_data[i..i + 2] == b"II" || &exif_data[i..i + 2] == b"MM" {
+                            let (byte_order, order) = if &exif_data[i..i + 2] == b"II" {
+                                ("Little-endian", LITTLE_ENDIAN)
+                            } else {
+                                ("Big-endian", BIG_ENDIAN)
+                            };
+                            writeln!(out, "TIFF header found at offset {}: {}", i, byte_order)?;
+                            
+                            // Read TIFF version
+                            if i + 4 < exif_data.len() {
+                                let version = (order.u16)([exif_data[i + 2], exif_data[i + 3]]);
+                                writeln!(out, "TIFF version: {}", version)?;
+                            }
+                            
+                            // Read IFD offset
+                            if i + 8 < exif_data.len() {
+                                let ifd_offset = (order.u32)([
+                                    exif_data[i + 4], exif_data[i + 5], 
+                                    exif_data[i + 6], exif_data[i + 7]
+                                ]);
+                                writeln!(out, "IFD offset: {}", ifd_offset)?;
                                 
-                                // Read IFD offset
-                                if i + 8 < exif_data.len() {
-                                    let ifd_offset = u32::from_le_bytes([
-                                        exif_data[i + 4], exif_data[i + 5], 
-                                        exif_data[i + 6], exif_data[i + 7]
+                                // Try to read IFD
+                                let ifd_pos = i + ifd_offset as usize;
+                                if ifd_pos + 2 < exif_data.len() {
+                                    let entry_count = (order.u16)([
+                                        exif_data[ifd_pos], exif_data[ifd_pos + 1]
                                     ]);
-                                    println!("IFD offset: {}", ifd_offset);
+                                    writeln!(out, "IFD entry count: {}", entry_count)?;
                                     
-                                    // Try to read IFD
-                                    let ifd_pos = i + ifd_offset as usize;
-                                    if ifd_pos + 2 < exif_data.len() {
-                                        let entry_count = u16::from_le_bytes([
-                                            exif_data[ifd_pos], exif_data[ifd_pos + 1]
-                                        ]);
-                                        println!("IFD entry count: {}", entry_count);
-                                        
-                                        // Look for DateTimeOriginal tag (0x9003)
-                                        for entry_idx in 0..entry_count {
-                                            let entry_pos = ifd_pos + 2 + (entry_idx as usize * 12);
-                                            if entry_pos + 12 <= exif_data.len() {
-                                                let tag_id = u16::from_le_bytes([
-                                                    exif_data[entry_pos], exif_data[entry_pos + 1]
-                                                ]);
-                                                if tag_id == 0x9003 { // DateTimeOriginal
-                                                    println!("Found DateTimeOriginal tag!");
-                                                    let data_type = u16::from_le_bytes([
-                                                        exif_data[entry_pos + 2], exif_data[entry_pos + 3]
-                                                    ]);
-                                                    let count = u32::from_le_bytes([
-                                                        exif_data[entry_pos + 4], exif_data[entry_pos + 5],
-                                                        exif_data[entry_pos + 6], exif_data[entry_pos + 7]
-                                                    ]);
-                                                    let value_offset = u32::from_le_bytes([
-                                                        exif_data[entry_pos + 8], exif_data[entry_pos + 9],
-                                                        exif_data[entry_pos + 10], exif_data[entry_pos + 11]
-                                                    ]);
-                                                    println!("  Data type: {}", data_type);
-                                                    println!("  Count: {}", count);
-                                                    println!("  Value offset: {}", value_offset);
-                                                    
-                                                    // Read the actual string value
-                                                    let value_pos = i + value_offset as usize;
-                                                    if value_pos + count as usize <= exif_data.len() {
-                                                        let value_bytes = &exif_data[value_pos..value_pos + count as usize];
-                                                        if let Ok(value_str) = std::str::from_utf8(value_bytes) {
-                                                            println!("  DateTimeOriginal value: '{}'", value_str.trim_end_matches('\0'));
-                                                        }
-                                                    }
+                                    // Look for DateTimeOriginal tag (0x9003)
+                                    let table_start = ifd_pos + 2;
+                                    let table_end = (table_start + entry_count as usize * 12).min(exif_data.len());
+                                    for entry in exif_data[table_start..table_end].chunks_exact(12) {
+                                        let (tag_id, data_type, count, value_offset) =
+                                            read_ifd_entry(entry, order);
+                                        if tag_id == 0x9003 { // DateTimeOriginal
+                                            writeln!(out, "Found DateTimeOriginal tag!")?;
+                                            writeln!(out, "  Data type: {}", data_type)?;
+                                            writeln!(out, "  Count: {}", count)?;
+                                            writeln!(out, "  Value offset: {}", value_offset)?;
+                                            
+                                            // Read the actual string value
+                                            let value_pos = i + value_offset as usize;
+                                            if value_pos + count as usize <= exif_data.len() {
+                                                let value_bytes = &exif_data[value_pos..value_pos + count as usize];
+                                                if let Ok(value_str) = std::str::from_utf8(value_bytes) {
+                                                    writeln!(out, "  DateTimeOriginal value: '{}'", value_str.trim_end_matches('\0'))?;
                                                 }
                                             }
                                         }
                                     }
                                 }
-                                break;
                             }
+                            break;
                         }
                     }
-                    break;
                 }
             }
             pos = segment_end;
         } else {
-            pos += 1;
+            // Skip straight to the next 0xFF marker byte
+            pos = find_bytes(&data, pos + 1, data.len(), &[0xFF]).unwrap_or(data.len());
         }
     }
 
-    println!("\nTotal EXIF segments found: {}", segment_count);
+    writeln!(out, "\nTotal EXIF segments found: {}", segment_count)?;
+    out.flush()?;
     Ok(())
 }
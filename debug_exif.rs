@@ -1,104 +1,125 @@
 use fast_exif_reader::FastExifReader;
+use memmap2::Mmap;
 use std::env;
 use std::fs::File;
-use std::io::Read;
+use std::io::{self, BufWriter, Write};
+
+/// Find the first occurrence of `needle` lying entirely within `data[start..end]`
+fn find_bytes(data: &[u8], start: usize, end: usize, needle: &[u8]) -> Option<usize> {
+    data.get(start..end)?
+        .windows(needle.len())
+        .position(|window| window == needle)
+        .map(|offset| start + offset)
+}
 
 fn main() -> Result<(), Box<dyn std::error::Error>> {
     let args: Vec<String> = env::args().collect();
-    if args.len() != 2 {
-        eprintln!("Usage: {} <image_file>", args[0]);
+    // Hex dumps are only printed with --verbose
+    let verbose = args.iter().skip(1).any(|arg| arg == "--verbose" || arg == "-v");
+    let positional: Vec<&String> = args
+        .iter()
+        .skip(1)
+        .filter(|arg| *arg != "--verbose" && *arg != "-v")
+        .collect();
+    if positional.len() != 1 {
+        eprintln!("Usage: {} [--verbose] <image_file>", args[0]);
         std::process::exit(1);
     }
 
-    let file_path = &args[1];
-    println!("Debugging fast-exif-rs with file: {}", file_path);
+    let file_path = positional[0];
+    let stdout = io::stdout();
+    let mut out = BufWriter::new(stdout.lock());
+    writeln!(out, "Debugging fast-exif-rs with file: {}", file_path)?;
 
-    // Read the file as bytes to debug EXIF segment detection
-    let mut file = File::open(file_path)?;
-    let mut data = Vec::new();
-    file.read_to_end(&mut data)?;
-    println!("File size: {} bytes", data.len());
+    // Map the file to debug EXIF segment detection without copying it
+    let file = File::open(file_path)?;
+    let data = unsafe { Mmap::map(&file)? };
+    writeln!(out, "File size: {} bytes", data.len())?;
 
     // Look for EXIF segment manually
     let mut pos = 2;
     let mut exif_found = false;
     while pos < data.len().saturating_sub(6) {
         if data[pos] == 0xFF && data[pos + 1] == 0xE1 {
-            println!("Found APP1 segment at position {}", pos);
+            writeln!(out, "Found APP1 segment at position {}", pos)?;
             let length = ((data[pos + 2] as u16) << 8) | (data[pos + 3] as u16);
-            println!("APP1 segment length: {}", length);
+            writeln!(out, "APP1 segment length: {}", length)?;
             let segment_end = pos + 2 + length as usize;
             
             if segment_end > data.len() {
-                println!("Segment extends beyond file end");
+                writeln!(out, "Segment extends beyond file end")?;
                 break;
             }
 
             // Look for "Exif" identifier
             let segment_start = pos + 4;
-            for exif_start in segment_start..segment_end.saturating_sub(4) {
-                if &data[exif_start..exif_start + 4] == b"Exif" {
-                    println!("Found EXIF identifier at position {}", exif_start);
-                    exif_found = true;
-                    
-                    // Show some bytes around the EXIF identifier
+            if let Some(exif_start) =
+                find_bytes(&data, segment_start, segment_end.saturating_sub(1), b"Exif")
+            {
+                writeln!(out, "Found EXIF identifier at position {}", exif_start)?;
+                exif_found = true;
+                
+                // Show some bytes around the EXIF identifier
+                if verbose {
                     let start = exif_start.saturating_sub(10);
                     let end = (exif_start + 50).min(data.len());
-                    println!("Bytes around EXIF identifier:");
-                    for i in start..end {
-                        print!("{:02X} ", data[i]);
-                        if (i - start + 1) % 16 == 0 {
-                            println!();
+                    writeln!(out, "Bytes around EXIF identifier:")?;
+                    for (n, byte) in data[start..end].iter().enumerate() {
+                        write!(out, "{:02X} ", byte)?;
+                        if (n + 1) % 16 == 0 {
+                            writeln!(out)?;
                         }
                     }
-                    println!();
+                    writeln!(out)?;
+                }
+                
+                // Try to find TIFF header
+                let exif_data_start = exif_start + 4;
+                if exif_data_start < segment_end {
+                    let exif_data = &data[exif_data_start..segment_end];
+                    writeln!(out, "EXIF data length: {} bytes", exif_data.len())?;
                     
-                    // Try to find TIFF header
-                    let exif_data_start = exif_start + 4;
-                    if exif_data_start < segment_end {
-                        let exif_data = &data[exif_data_start..segment_end];
-                        println!("EXIF data length: {} bytes", exif_data.len());
-                        
-                        // Look for TIFF header
-                        for i in 0..exif_data.len().saturating_sub(8) {
-                            if &exif_data[i..i + 2] == b"II" || &exif_data[i..i + 2] == b"MM" {
-                                println!("Found TIFF header at EXIF offset {}", i);
-                                let byte_order = if &exif_data[i..i + 2] == b"II" {
-                                    "Little-endian"
-                                } else {
-                                    "Big-endian"
-                                };
-                                println!("Byte order: {}", byte_order);
-                                
-                                // Show TIFF header bytes
+                    // Look for TIFF header
+                    for i in 0..exif_data.len().saturating_sub(8) {
+                        if &exif_data[i..i + 2] == b"II" || &exif_data[i..i + 2] == b"MM" {
+                            writeln!(out, "Found TIFF header at EXIF offset {}", i)?;
+                            let byte_order = if &exif_data[i..i + 2] == b"II" {
+                                "Little-endian"
+                            } else {
+                                "Big-endian"
+                            };
+                            writeln!(out, "Byte order: {}", byte_order)?;
+                            
+                            // Show TIFF header bytes
+                            if verbose {
                                 let end = (i + 20).min(exif_data.len());
-                                println!("TIFF header bytes:");
-                                for j in i..end {
-                                    print!("{:02X} ", exif_data[j]);
+                                writeln!(out, "TIFF header bytes:")?;
+                                for byte in &exif_data[i..end] {
+                                    write!(out, "{:02X} ", byte)?;
                                 }
-                                println!();
-                                break;
+                                writeln!(out)?;
                             }
+                            break;
                         }
                     }
-                    break;
                 }
             }
             pos = segment_end;
         } else {
-            pos += 1;
+            // Skip straight to the next 0xFF marker byte
+            pos = find_bytes(&data, pos + 1, data.len(), &[0xFF]).unwrap_or(data.len());
         }
     }
 
     if !exif_found {
-        println!("No EXIF segment found in file");
+        writeln!(out, "No EXIF segment found in file")?;
     }
 
     // Now test with fast-exif-rs
     let mut reader = FastExifReader::new();
     match reader.read_file(file_path) {
         Ok(metadata) => {
-            println!("\nFast-exif-rs extracted {} metadata fields:", metadata.len());
+            writeln!(out, "\nFast-exif-rs extracted {} metadata fields:", metadata.len())?;
             
             // Look for timestamp-related fields
             let timestamp_fields = [
@@ -113,10 +134,10 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
                 "TimeZone"
             ];
             
-            println!("\nTimestamp-related fields:");
+            writeln!(out, "\nTimestamp-related fields:")?;
             for field in &timestamp_fields {
                 if let Some(value) = metadata.get(*field) {
-                    println!("  {}: {}", field, value);
+                    writeln!(out, "  {}: {}", field, value)?;
                 }
             }
         }
@@ -125,5 +146,6 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
         }
     }
 
+    out.flush()?;
     Ok(())
 }
@@ -12,8 +12,9 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
     for entry in WalkDir::new(test_dir) {
         let entry = entry?;
         if entry.file_type().is_file() {
-            if let Some(ext) = entry.path().extension() {
-                if ext == "jpg" || ext == "jpeg" {
+            // Fold case on the entry's extension so .JPG and .Jpeg count as well
+            if let Some(ext) = entry.path().extension().and_then(|ext| ext.to_str()) {
+                if ext.eq_ignore_ascii_case("jpg") || ext.eq_ignore_ascii_case("jpeg") {
                     jpeg_files.push(entry.path().to_path_buf());
                 }
             }
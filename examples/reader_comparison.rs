@@ -0,0 +1,167 @@
+//! Compare FastExifReader and OptimalExifParser on the same set of files
+//!
+//! Usage: cargo run --release --example reader_comparison -- [--no-warmup] <directory>
+//!
+//! Both readers parse each file back to back before moving on to the next one,
+//! alternating which of them goes first. Running one reader over every file and
+//! then the other would hand the second run a page cache already warmed by the
+//! first, and the comparison would measure the cache rather than the parsers.
+//!
+//! Before timing, both readers go once over the first few files untimed, so the
+//! lookup tables built on first use and the cold code paths are not charged to
+//! whichever reader happens to run first. Pass `--no-warmup` to time from cold.
+//!
+//! For repeatable numbers, pin the run to one core and fix the CPU frequency:
+//!
+//!     sudo cpupower frequency-set -g performance
+//!     taskset -c 3 cargo run --release --example reader_comparison -- <directory>
+
+use fast_exif_reader::{FastExifReader, OptimalExifParser, TimingHistogram};
+use std::time::{Duration, Instant};
+use walkdir::WalkDir;
+
+/// Number of files each reader parses untimed before the comparison starts
+const WARMUP_FILES: usize = 32;
+
+/// Timings and success count for one reader, kept as a fixed-size histogram
+/// so memory does not grow with the number of files
+struct ReaderResults {
+    name: &'static str,
+    histogram: TimingHistogram,
+    total: Duration,
+    fastest: Duration,
+    slowest: Duration,
+    successful_files: usize,
+}
+
+impl ReaderResults {
+    fn new(name: &'static str) -> Self {
+        Self {
+            name,
+            histogram: TimingHistogram::new(),
+            total: Duration::ZERO,
+            fastest: Duration::MAX,
+            slowest: Duration::ZERO,
+            successful_files: 0,
+        }
+    }
+
+    /// Time one read and record whether it succeeded
+    fn record(&mut self, read: impl FnOnce() -> bool) {
+        let start = Instant::now();
+        let ok = read();
+        let time = start.elapsed();
+
+        self.histogram.record(time);
+        self.total += time;
+        self.fastest = self.fastest.min(time);
+        self.slowest = self.slowest.max(time);
+        if ok {
+            self.successful_files += 1;
+        }
+    }
+
+    /// Percentile of the per-file times in milliseconds
+    fn percentile_ms(&self, p: u64) -> f64 {
+        self.histogram.percentile(p).as_secs_f64() * 1000.0
+    }
+
+    fn print(&self) {
+        println!("🔍 {}", self.name);
+        println!("   Files processed: {}/{}", self.successful_files, self.histogram.count());
+        println!("   Total time: {:.3}s", self.total.as_secs_f64());
+        println!("   Mean per file: {:.3} ms", self.total.as_secs_f64() * 1000.0 / self.histogram.count() as f64);
+        println!(
+            "   P50 / P90 / P99 per file: {:.3} / {:.3} / {:.3} ms",
+            self.percentile_ms(50),
+            self.percentile_ms(90),
+            self.percentile_ms(99)
+        );
+        println!("   Fastest / slowest: {:.3} / {:.3} ms", self.fastest.as_secs_f64() * 1000.0, self.slowest.as_secs_f64() * 1000.0);
+        println!();
+    }
+}
+
+/// Warn when CPU frequency scaling may skew the timings; turbo and power-saving
+/// governors change clock speed between and even during runs
+fn check_cpu_governor() {
+    let governor_path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor";
+    if let Ok(governor) = std::fs::read_to_string(governor_path) {
+        let governor = governor.trim();
+        if governor != "performance" {
+            println!("⚠️  CPU frequency governor is '{}', not 'performance'; timings may vary between runs", governor);
+        }
+    }
+}
+
+/// Warn when the process may migrate between cores, which moves it away from its
+/// warm caches and onto cores running at different clock speeds
+fn check_cpu_affinity() {
+    let Ok(status) = std::fs::read_to_string("/proc/self/status") else {
+        return;
+    };
+    if let Some(allowed) = status.lines().find_map(|line| line.strip_prefix("Cpus_allowed_list:")) {
+        let allowed = allowed.trim();
+        if allowed.contains(',') || allowed.contains('-') {
+            println!("⚠️  Not pinned to a single CPU (allowed: {}); consider running under taskset -c <cpu>", allowed);
+        }
+    }
+}
+
+fn main() -> Result<(), Box<dyn std::error::Error>> {
+    let mut warmup = true;
+    let mut directory = ".".to_string();
+    for arg in std::env::args().skip(1) {
+        if arg == "--no-warmup" {
+            warmup = false;
+        } else {
+            directory = arg;
+        }
+    }
+
+    let files: Vec<String> = WalkDir::new(&directory)
+        .into_iter()
+        .filter_map(Result::ok)
+        .filter(|entry| entry.file_type().is_file())
+        .map(|entry| entry.path().to_string_lossy().into_owned())
+        .collect();
+
+    if files.is_empty() {
+        println!("❌ No files found in {}", directory);
+        return Ok(());
+    }
+
+    check_cpu_governor();
+    check_cpu_affinity();
+    println!("📁 Comparing readers on {} files", files.len());
+    println!();
+
+    let mut reader = FastExifReader::new();
+    let mut parser = OptimalExifParser::new();
+
+    if warmup {
+        for file_path in files.iter().take(WARMUP_FILES) {
+            let _ = reader.read_file(file_path);
+            let _ = parser.parse_file(file_path);
+        }
+    }
+
+    let mut reader_results = ReaderResults::new("FastExifReader::read_file");
+    let mut parser_results = ReaderResults::new("OptimalExifParser::parse_file");
+
+    for (index, file_path) in files.iter().enumerate() {
+        // Swap the order on every file so neither reader always gets the warm cache
+        if index % 2 == 0 {
+            reader_results.record(|| reader.read_file(file_path).is_ok());
+            parser_results.record(|| parser.parse_file(file_path).is_ok());
+        } else {
+            parser_results.record(|| parser.parse_file(file_path).is_ok());
+            reader_results.record(|| reader.read_file(file_path).is_ok());
+        }
+    }
+
+    reader_results.print();
+    parser_results.print();
+
+    Ok(())
+}
@@ -8,9 +8,15 @@
 
 use clap::{Parser, Subcommand};
 use colored::*;
-use fast_exif_reader::FastExifReader;
+use fast_exif_reader::{min_files_per_task, ExifError, FastExifReader, TimingHistogram};
+use rayon::prelude::*;
+use std::borrow::Cow;
 use std::collections::HashMap;
-use std::path::Path;
+use std::fs;
+use std::io::{self, BufWriter, Write};
+use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
+use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 use walkdir::WalkDir;
 
 /// A fast EXIF metadata extraction tool written in Rust
@@ -55,6 +61,22 @@ enum Commands {
         /// Quiet mode (minimal output)
         #[arg(short, long)]
         quiet: bool,
+        
+        /// Process only a random sample of at most N of the files found
+        #[arg(long, value_name = "N")]
+        sample: Option<usize>,
+        
+        /// Print per-file timing statistics to stderr
+        #[arg(long)]
+        stats: bool,
+        
+        /// Read every file once, untimed, before the timed pass
+        #[arg(long)]
+        warmup: bool,
+        
+        /// Write one CSV row per file (path, extension, time, field count, error) to FILE
+        #[arg(long, value_name = "FILE")]
+        timings: Option<PathBuf>,
     },
     /// List known EXIF tags
     ListTags {
@@ -75,6 +97,8 @@ enum OutputFormat {
     Text,
     Json,
     Csv,
+    /// Only count each file's fields; no metadata is kept for output
+    Count,
 }
 
 fn main() -> Result<(), Box<dyn std::error::Error>> {
@@ -88,9 +112,13 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
             recursive, 
             tags, 
             filenames, 
-            quiet 
+            quiet,
+            sample,
+            stats,
+            warmup,
+            timings,
         } => {
-            extract_exif_data(inputs, short, format, recursive, tags, filenames, quiet)?;
+            extract_exif_data(inputs, short, format, recursive, tags, filenames, quiet, sample, stats, warmup, timings)?;
         }
         Commands::ListTags { short, category } => {
             list_known_tags(short, category)?;
@@ -109,79 +137,351 @@ fn extract_exif_data(
     format: OutputFormat,
     recursive: bool,
     tags: Option<Vec<String>>,
-    filenames: bool,
+    _filenames: bool,
     quiet: bool,
+    sample: Option<usize>,
+    stats: bool,
+    warmup: bool,
+    timings: Option<PathBuf>,
 ) -> Result<(), Box<dyn std::error::Error>> {
-    let mut reader = FastExifReader::new();
-    let mut all_results = Vec::new();
+    // Querying the pool builds it, so its worker threads start up while the
+    // inputs are being walked rather than at the start of the timed pass
+    rayon::current_num_threads();
+    
+    // Without --sample the reservoir never fills, so it keeps every file
+    let mut files = Reservoir::new(sample.unwrap_or(usize::MAX));
     
     for input in inputs {
         let path = Path::new(&input);
         
-        if path.is_file() {
-            process_file(&mut reader, path, &mut all_results, short, &tags, filenames, quiet)?;
-        } else if path.is_dir() {
-            process_directory(&mut reader, path, &mut all_results, short, &tags, filenames, quiet, recursive)?;
-        } else {
-            eprintln!("{}: File or directory not found", input.red());
+        // Stat each input once rather than once per is_file()/is_dir() probe
+        match fs::metadata(path) {
+            Ok(meta) if meta.is_file() => {
+                files.push(FoundFile {
+                    path: path.to_path_buf(),
+                    inode: metadata_inode(&meta),
+                    slot: extension_slot(path),
+                });
+            }
+            Ok(meta) if meta.is_dir() => {
+                collect_directory(path, &mut files, recursive)?;
+            }
+            _ => {
+                eprintln!("{}: File or directory not found", input.red());
+            }
+        }
+    }
+    
+    let files = files.into_items();
+    
+    // Read in inode order, which roughly follows the on-disk layout and spares
+    // rotational disks from seeking back and forth between directories
+    let mut read_order: Vec<usize> = (0..files.len()).collect();
+    read_order.sort_unstable_by_key(|&index| files[index].inode);
+    
+    // Files are independent, so parse them across all cores; each worker reuses
+    // one reader instead of building one per file
+    let keep_metadata = !matches!(format, OutputFormat::Count);
+    let time_files = stats || timings.is_some();
+    // Workers take runs of files rather than single ones, so each run stays on
+    // neighbouring inodes; the run length is the library's own read_files policy
+    let files_per_task = min_files_per_task(read_order.len());
+    
+    // A first pass pulls the files into the page cache and gets the thread pool
+    // and allocator going, so the timed pass measures parsing rather than cold I/O
+    if warmup {
+        read_order.par_iter().with_min_len(files_per_task).for_each_init(FastExifReader::new, |reader, &index| {
+            let _ = process_file(reader, &files[index].path, &tags);
+        });
+    }
+    
+    // Wait until every worker has picked up a job, so none of them is still
+    // being scheduled for the first time once the clock is running
+    rayon::broadcast(|_| ());
+    
+    let start_time = Instant::now();
+    let extracted: Vec<_> = read_order
+        .par_iter()
+        .with_min_len(files_per_task)
+        .map_init(FastExifReader::new, |reader, &index| {
+            // Per-file times only feed --stats and --timings; otherwise the pass
+            // is timed once as a whole and the clock is not read per file
+            let file_start = time_files.then(Instant::now);
+            let result = process_file(reader, &files[index].path, &tags);
+            let file_time = file_start.map_or(Duration::ZERO, |file_start| file_start.elapsed());
+            // Without an output that needs it, the metadata is dropped here on the
+            // worker and only its field count is held until the report
+            let result = result.map(|metadata| (metadata.len(), keep_metadata.then_some(metadata)));
+            (index, result, file_time)
+        })
+        .collect();
+    let total_time = start_time.elapsed();
+    
+    // Report in input order regardless of the order the files were read in; the
+    // read order holds every index once, so each result drops straight into its
+    // slot instead of the whole batch being sorted
+    let mut in_order: Vec<Option<_>> = std::iter::repeat_with(|| None).take(files.len()).collect();
+    for (index, result, file_time) in extracted {
+        in_order[index] = Some((result, file_time));
+    }
+    
+    let mut all_results = Vec::with_capacity(files.len());
+    let mut timing_stats = TimingStats::new();
+    let mut format_stats = FormatStats::new();
+    // Per-file progress lines go through one locked, buffered writer; println!
+    // would take the lock and flush stdout once for every file
+    let mut progress = stdout_writer();
+    // Per-file rows are streamed to the timings file as they are reported
+    let mut timings_out = match &timings {
+        Some(timings_path) => {
+            let mut out = BufWriter::new(fs::File::create(timings_path)?);
+            writeln!(out, "path,extension,time_ns,fields,error")?;
+            Some(out)
+        }
+        None => None,
+    };
+    for (file, (result, file_time)) in files.iter().zip(in_order.into_iter().flatten()) {
+        if stats {
+            timing_stats.record(file_time);
+            format_stats.record(file.slot, file_time.as_secs_f64(), result.as_ref().ok().map(|&(fields, _)| fields));
+        }
+        
+        // Render the path once and use it for both the message and the result
+        let filename = file.path.to_string_lossy().into_owned();
+        if let Some(out) = timings_out.as_mut() {
+            write_timing_row(out, &filename, file.slot, file_time, result.as_ref().map(|&(fields, _)| fields))?;
         }
+        
+        match result {
+            Ok((fields, metadata)) => {
+                if !quiet {
+                    writeln!(progress, "{}: {} EXIF fields extracted", 
+                        filename.green(), 
+                        fields
+                    )?;
+                }
+                
+                if let Some(metadata) = metadata {
+                    all_results.push(FileResult {
+                        filename,
+                        metadata,
+                    });
+                }
+            }
+            Err(e) => {
+                eprintln!("{}: Error reading EXIF data: {}", filename.red(), e);
+            }
+        }
+    }
+    progress.flush()?;
+    drop(progress);
+    if let Some(mut out) = timings_out {
+        out.flush()?;
     }
     
     // Output results in requested format
     match format {
-        OutputFormat::Text => output_text_format(&all_results, short, quiet),
+        OutputFormat::Text => output_text_format(&all_results, short, quiet)?,
         OutputFormat::Json => output_json_format(&all_results)?,
         OutputFormat::Csv => output_csv_format(&all_results)?,
+        OutputFormat::Count => {}
+    }
+    
+    if stats {
+        timing_stats.print(total_time);
+        format_stats.print();
     }
     
     Ok(())
 }
 
-fn process_file(
-    reader: &mut FastExifReader,
-    path: &Path,
-    results: &mut Vec<FileResult>,
-    _short: bool,
-    tags: &Option<Vec<String>>,
-    _filenames: bool,
-    quiet: bool,
-) -> Result<(), Box<dyn std::error::Error>> {
-    match reader.read_file(path.to_str().unwrap()) {
-        Ok(metadata) => {
-            let filtered_metadata = if let Some(tag_list) = tags {
-                filter_tags(&metadata, tag_list)
-            } else {
-                metadata
-            };
-            
-            if !quiet {
-                println!("{}: {} EXIF fields extracted", 
-                    path.display().to_string().green(), 
-                    filtered_metadata.len()
-                );
-            }
-            
-            results.push(FileResult {
-                filename: path.to_string_lossy().to_string(),
-                metadata: filtered_metadata,
-            });
+/// Streaming per-file timing summary for `--stats`: exact integer sums of the
+/// nanosecond times and their squares, from which the mean and variance are
+/// derived once at the end, plus a histogram for percentiles, so memory stays
+/// the same however many files are read
+struct TimingStats {
+    count: u64,
+    sum_nanos: u128,
+    sum_squared_nanos: u128,
+    histogram: TimingHistogram,
+}
+
+impl TimingStats {
+    fn new() -> Self {
+        Self {
+            count: 0,
+            sum_nanos: 0,
+            sum_squared_nanos: 0,
+            histogram: TimingHistogram::new(),
         }
-        Err(e) => {
-            eprintln!("{}: Error reading EXIF data: {}", path.display().to_string().red(), e);
+    }
+    
+    fn record(&mut self, file_time: Duration) {
+        let nanos = file_time.as_nanos().min(u64::MAX as u128) as u64;
+        
+        // Plain sums keep each record to a few integer adds, with no division
+        // or chain of floating-point updates from one file to the next
+        self.count += 1;
+        self.sum_nanos += nanos as u128;
+        self.sum_squared_nanos += nanos as u128 * nanos as u128;
+        
+        self.histogram.record(file_time);
+    }
+    
+    /// Mean time per file in nanoseconds
+    fn mean_nanos(&self) -> f64 {
+        self.sum_nanos as f64 / self.count as f64
+    }
+    
+    /// Sample standard deviation in nanoseconds, once there are two files
+    fn std_dev_nanos(&self) -> Option<f64> {
+        if self.count < 2 {
+            return None;
         }
+        // n * sum(x^2) - sum(x)^2 is n^2 times the population variance, taken
+        // in integers so nothing cancels out
+        let count = self.count as u128;
+        let spread = count * self.sum_squared_nanos - self.sum_nanos * self.sum_nanos;
+        Some((spread as f64 / (count * (count - 1)) as f64).sqrt())
     }
     
-    Ok(())
+    /// Print the summary to stderr
+    fn print(&self, total_time: Duration) {
+        let total_secs = total_time.as_secs_f64();
+        
+        eprintln!("\n{}", "=== Timing ===".bold().blue());
+        eprintln!("Files: {}", self.count);
+        eprintln!("Total time: {:.3}s", total_secs);
+        if self.count == 0 {
+            return;
+        }
+        
+        if total_secs > 0.0 {
+            eprintln!("Files per second: {:.1}", self.count as f64 / total_secs);
+        }
+        eprintln!("Mean per file: {:.3} ms", self.mean_nanos() / 1e6);
+        if let Some(std_dev) = self.std_dev_nanos() {
+            eprintln!("Std dev per file: {:.3} ms", std_dev / 1e6);
+        }
+        for p in [50, 90, 95, 99] {
+            eprintln!("P{} per file: {:.3} ms", p, self.histogram.percentile(p).as_secs_f64() * 1000.0);
+        }
+    }
+}
+
+/// Number of per-format slots: one per known extension plus one for the rest
+const FORMAT_SLOTS: usize = IMAGE_EXTENSIONS.len() + 1;
+
+/// Per-format totals for `--stats`, kept as parallel arrays indexed by the
+/// extension's slot so recording a file is a few array increments
+struct FormatStats {
+    counts: [usize; FORMAT_SLOTS],
+    times: [f64; FORMAT_SLOTS],
+    fields: [usize; FORMAT_SLOTS],
+    errors: [usize; FORMAT_SLOTS],
+}
+
+impl FormatStats {
+    fn new() -> Self {
+        Self {
+            counts: [0; FORMAT_SLOTS],
+            times: [0.0; FORMAT_SLOTS],
+            fields: [0; FORMAT_SLOTS],
+            errors: [0; FORMAT_SLOTS],
+        }
+    }
+    
+    /// Record one file; `field_count` is `None` when the read failed
+    fn record(&mut self, slot: usize, file_time: f64, field_count: Option<usize>) {
+        self.counts[slot] += 1;
+        self.times[slot] += file_time;
+        match field_count {
+            Some(count) => self.fields[slot] += count,
+            None => self.errors[slot] += 1,
+        }
+    }
+    
+    fn print(&self) {
+        eprintln!("\n{}", "=== By format ===".bold().blue());
+        for slot in (0..FORMAT_SLOTS).filter(|&slot| self.counts[slot] > 0) {
+            let name = IMAGE_EXTENSIONS.get(slot).map_or("other".to_string(), |ext| ext.to_ascii_uppercase());
+            let count = self.counts[slot];
+            let successes = (count - self.errors[slot]).max(1);
+            eprintln!(
+                "{}: {} files, {:.3} ms avg, {:.1} fields avg, {} errors",
+                name,
+                count,
+                self.times[slot] / count as f64 * 1000.0,
+                self.fields[slot] as f64 / successes as f64,
+                self.errors[slot]
+            );
+        }
+    }
+}
+
+/// Write one file's row of the `--timings` CSV
+fn write_timing_row(
+    out: &mut impl Write,
+    filename: &str,
+    slot: usize,
+    file_time: Duration,
+    result: Result<usize, &ExifError>,
+) -> io::Result<()> {
+    let extension = IMAGE_EXTENSIONS.get(slot).copied().unwrap_or("");
+    let (fields, error) = match result {
+        Ok(fields) => (fields, String::new()),
+        Err(e) => (0, e.to_string()),
+    };
+    writeln!(
+        out,
+        "{},{},{},{},{}",
+        csv_field(filename),
+        extension,
+        file_time.as_nanos(),
+        fields,
+        csv_field(&error)
+    )
+}
+
+/// Quote a CSV field if it contains a separator, quote or line break
+fn csv_field(value: &str) -> Cow<'_, str> {
+    if value.contains([',', '"', '\n', '\r']) {
+        Cow::Owned(format!("\"{}\"", value.replace('"', "\"\"")))
+    } else {
+        Cow::Borrowed(value)
+    }
 }
 
-fn process_directory(
+fn process_file(
     reader: &mut FastExifReader,
     path: &Path,
-    results: &mut Vec<FileResult>,
-    short: bool,
     tags: &Option<Vec<String>>,
-    filenames: bool,
-    quiet: bool,
+) -> Result<HashMap<String, String>, ExifError> {
+    // The reader takes a &str, so a name that is not valid UTF-8 is reported
+    // like any other unreadable file instead of taking the run down with it
+    let path_str = path.to_str().ok_or_else(|| {
+        io::Error::new(io::ErrorKind::InvalidInput, "file name is not valid UTF-8")
+    })?;
+    let metadata = reader.read_file(path_str)?;
+    
+    Ok(match tags {
+        Some(tag_list) => filter_tags(metadata, tag_list),
+        None => metadata,
+    })
+}
+
+/// A file to read, along with what was learned about it while finding it
+struct FoundFile {
+    path: PathBuf,
+    /// Inode number, used to order reads by their likely position on disk
+    inode: u64,
+    /// Index of the file's extension in IMAGE_EXTENSIONS, found once at walk time
+    slot: usize,
+}
+
+fn collect_directory(
+    path: &Path,
+    files: &mut Reservoir<FoundFile>,
     recursive: bool,
 ) -> Result<(), Box<dyn std::error::Error>> {
     let walker = if recursive {
@@ -194,72 +494,209 @@ fn process_directory(
         let entry = entry?;
         let path = entry.path();
         
-        if path.is_file() && is_image_file(path) {
-            process_file(reader, path, results, short, tags, filenames, quiet)?;
+        // The walker already knows each entry's type from the directory listing, so
+        // only symlinks with an image extension need an extra stat to see what they
+        // point at
+        let slot = extension_slot(path);
+        if slot == IMAGE_EXTENSIONS.len() {
+            continue;
+        }
+        let file_type = entry.file_type();
+        if file_type.is_file() || (file_type.is_symlink() && path.is_file()) {
+            let inode = entry_inode(&entry);
+            files.push(FoundFile {
+                path: entry.into_path(),
+                inode,
+                slot,
+            });
         }
     }
     
     Ok(())
 }
 
-fn is_image_file(path: &Path) -> bool {
-    if let Some(ext) = path.extension() {
-        if let Some(ext_str) = ext.to_str() {
-            let ext_lower = ext_str.to_lowercase();
-            return matches!(ext_lower.as_str(), 
-                "jpg" | "jpeg" | "tiff" | "tif" | "png" | "bmp" | "gif" | "webp" | 
-                "cr2" | "nef" | "arw" | "raf" | "srw" | "pef" | "rw2" | "orf" | 
-                "dng" | "heic" | "heif" | "mov" | "mp4" | "3gp" | "avi" | "wmv" | 
-                "webm" | "mkv"
-            );
+/// Inode number of a file, used to order reads by their likely position on disk
+#[cfg(unix)]
+fn metadata_inode(meta: &fs::Metadata) -> u64 {
+    std::os::unix::fs::MetadataExt::ino(meta)
+}
+
+#[cfg(not(unix))]
+fn metadata_inode(_meta: &fs::Metadata) -> u64 {
+    0
+}
+
+/// Inode number of a directory entry, as reported by the directory listing itself
+#[cfg(unix)]
+fn entry_inode(entry: &walkdir::DirEntry) -> u64 {
+    walkdir::DirEntryExt::ino(entry)
+}
+
+#[cfg(not(unix))]
+fn entry_inode(_entry: &walkdir::DirEntry) -> u64 {
+    0
+}
+
+/// Uniform random sample of at most `capacity` items, kept while walking
+/// (Algorithm R) so a large tree never has to be held in memory in full
+struct Reservoir<T> {
+    capacity: usize,
+    seen: u64,
+    rng_state: u64,
+    items: Vec<T>,
+}
+
+impl<T> Reservoir<T> {
+    /// Sample with a seed taken from the clock, so each run picks different files
+    fn new(capacity: usize) -> Self {
+        let seed = SystemTime::now()
+            .duration_since(UNIX_EPOCH)
+            .map_or(0, |elapsed| elapsed.as_nanos() as u64);
+        Self::with_seed(capacity, seed)
+    }
+    
+    /// Sample with a fixed seed, so the same input always gives the same sample
+    fn with_seed(capacity: usize, seed: u64) -> Self {
+        // Spread the seed's bits first (the SplitMix64 finalizer): xorshift's
+        // first outputs from a small or slowly changing seed are far from uniform,
+        // and skew which of the early files get replaced
+        let mut state = seed.wrapping_add(0x9E37_79B9_7F4A_7C15);
+        state = (state ^ (state >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+        state = (state ^ (state >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+        state ^= state >> 31;
+        Self {
+            capacity,
+            seen: 0,
+            // xorshift never leaves an all-zero state
+            rng_state: state | 1,
+            items: Vec::new(),
+        }
+    }
+    
+    fn push(&mut self, item: T) {
+        self.seen += 1;
+        if self.items.len() < self.capacity {
+            self.items.push(item);
+            return;
         }
+        
+        // Keep the new item with probability capacity / seen
+        let slot = self.next_random() % self.seen;
+        if slot < self.capacity as u64 {
+            self.items[slot as usize] = item;
+        }
+    }
+    
+    /// xorshift64; sampling for benchmarks does not need a stronger generator
+    fn next_random(&mut self) -> u64 {
+        let mut x = self.rng_state;
+        x ^= x << 13;
+        x ^= x >> 7;
+        x ^= x << 17;
+        self.rng_state = x;
+        x
+    }
+    
+    fn into_items(self) -> Vec<T> {
+        self.items
     }
-    false
 }
 
-fn filter_tags(metadata: &HashMap<String, String>, tags: &[String]) -> HashMap<String, String> {
-    let mut filtered = HashMap::new();
+/// Size of the stdout buffer used for the extracted report
+const OUTPUT_BUFFER_SIZE: usize = 256 * 1024;
+
+/// Lowercase extensions of the image and video formats the reader understands
+const IMAGE_EXTENSIONS: &[&str] = &[
+    "jpg", "jpeg", "tiff", "tif", "png", "bmp", "gif", "webp",
+    "cr2", "nef", "arw", "raf", "srw", "pef", "rw2", "orf",
+    "dng", "heic", "heif", "mov", "mp4", "3gp", "avi", "wmv",
+    "webm", "mkv",
+];
+
+/// Index of a path's extension in IMAGE_EXTENSIONS, or `IMAGE_EXTENSIONS.len()`
+/// when it is not one of them
+fn extension_slot(path: &Path) -> usize {
+    // Work on the file name's raw bytes: every extension is ASCII, so there is
+    // no need to validate the name as UTF-8, and comparing case-insensitively
+    // in place avoids lowercasing a copy of every directory entry's extension
+    let name = path.file_name().map_or(&[][..], |name| name.as_encoded_bytes());
+    match name.iter().rposition(|&byte| byte == b'.') {
+        // A leading dot marks a hidden file, not an extension
+        Some(dot) if dot > 0 => {
+            let ext = &name[dot + 1..];
+            IMAGE_EXTENSIONS
+                .iter()
+                .position(|known| ext.eq_ignore_ascii_case(known.as_bytes()))
+                .unwrap_or(IMAGE_EXTENSIONS.len())
+        }
+        _ => IMAGE_EXTENSIONS.len(),
+    }
+}
+
+fn filter_tags(mut metadata: HashMap<String, String>, tags: &[String]) -> HashMap<String, String> {
+    let mut filtered = HashMap::with_capacity(tags.len());
     
+    // The full map is thrown away afterwards, so move the wanted entries out of
+    // it instead of cloning their names and values
     for tag in tags {
-        if let Some(value) = metadata.get(tag) {
-            filtered.insert(tag.clone(), value.clone());
+        if let Some((name, value)) = metadata.remove_entry(tag) {
+            filtered.insert(name, value);
         }
     }
     
     filtered
 }
 
-fn output_text_format(results: &[FileResult], short: bool, quiet: bool) {
+/// Buffered stdout for the report; a large buffer keeps a big JSON or CSV
+/// document down to a handful of write syscalls
+fn stdout_writer() -> BufWriter<io::StdoutLock<'static>> {
+    BufWriter::with_capacity(OUTPUT_BUFFER_SIZE, io::stdout().lock())
+}
+
+fn output_text_format(results: &[FileResult], short: bool, quiet: bool) -> Result<(), Box<dyn std::error::Error>> {
+    let mut out = stdout_writer();
+    
     for result in results {
         if !quiet {
-            println!("\n{}", format!("=== {} ===", result.filename).bold().blue());
+            writeln!(out, "\n{}", format!("=== {} ===", result.filename).bold().blue())?;
         }
         
         for (key, value) in &result.metadata {
             let display_key = if short {
                 get_short_tag(key)
             } else {
-                key.clone()
+                key.as_str()
             };
             
-            println!("{}: {}", display_key.cyan(), value);
+            writeln!(out, "{}: {}", display_key.cyan(), value)?;
         }
     }
+    
+    out.flush()?;
+    Ok(())
 }
 
 fn output_json_format(results: &[FileResult]) -> Result<(), Box<dyn std::error::Error>> {
-    println!("{}", serde_json::to_string_pretty(results)?);
+    // Serialize straight into stdout rather than building the whole document in memory
+    let mut out = stdout_writer();
+    serde_json::to_writer_pretty(&mut out, results)?;
+    writeln!(out)?;
+    out.flush()?;
     Ok(())
 }
 
 fn output_csv_format(results: &[FileResult]) -> Result<(), Box<dyn std::error::Error>> {
-    // Simple CSV output
-    println!("filename,tag,value");
+    // Values such as GPS coordinates and lens names contain commas, so every
+    // field is quoted as needed to keep one tag per row
+    let mut out = stdout_writer();
+    writeln!(out, "filename,tag,value")?;
     for result in results {
+        let filename = csv_field(&result.filename);
         for (tag, value) in &result.metadata {
-            println!("{},{},{}", result.filename, tag, value);
+            writeln!(out, "{},{},{}", filename, csv_field(tag), csv_field(value))?;
         }
     }
+    out.flush()?;
     Ok(())
 }
 
@@ -315,12 +752,14 @@ fn show_info() -> Result<(), Box<dyn std::error::Error>> {
     Ok(())
 }
 
-fn get_short_tag(tag: &str) -> String {
-    let tags = get_known_exif_tags();
+fn get_short_tag(tag: &str) -> &str {
+    // Built once and shared, rather than rebuilt for every tag of every file
+    static KNOWN_TAGS: OnceLock<HashMap<String, ExifTagInfo>> = OnceLock::new();
+    let tags = KNOWN_TAGS.get_or_init(get_known_exif_tags);
     if let Some(info) = tags.get(tag) {
-        info.short_name.clone()
+        &info.short_name
     } else {
-        tag.to_string()
+        tag
     }
 }
 
@@ -529,3 +968,149 @@ fn get_known_exif_tags() -> HashMap<String, ExifTagInfo> {
     
     tags
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    
+    #[test]
+    fn test_timing_stats_summary() {
+        let mut stats = TimingStats::new();
+        for ms in [1, 2, 3, 4] {
+            stats.record(Duration::from_millis(ms));
+        }
+        
+        assert_eq!(stats.mean_nanos(), 2_500_000.0);
+        // Sample variance of 1, 2, 3, 4 ms is 5/3 ms^2
+        let expected_std_dev = (5.0f64 / 3.0).sqrt() * 1e6;
+        assert!((stats.std_dev_nanos().unwrap() - expected_std_dev).abs() < 1.0);
+        
+        // Percentiles come from the histogram, within 1/16 of the nearest-rank value
+        for (p, ms) in [(25, 1), (50, 2), (75, 3), (99, 4)] {
+            let nanos = stats.histogram.percentile(p).as_nanos() as f64;
+            let expected = ms as f64 * 1e6;
+            assert!((nanos - expected).abs() <= expected / 16.0, "P{} was {}ns", p, nanos);
+        }
+    }
+    
+    fn sample(capacity: usize, seen: usize, seed: u64) -> Vec<usize> {
+        let mut reservoir = Reservoir::with_seed(capacity, seed);
+        for item in 0..seen {
+            reservoir.push(item);
+        }
+        reservoir.into_items()
+    }
+    
+    #[test]
+    fn test_reservoir_capacity_edges() {
+        // --sample 0 keeps nothing
+        assert!(sample(0, 100, 1).is_empty());
+        
+        // With room for everything, every item is kept in walk order
+        assert_eq!(sample(10, 10, 1), (0..10).collect::<Vec<_>>());
+        assert_eq!(sample(usize::MAX, 5, 1), (0..5).collect::<Vec<_>>());
+        
+        for capacity in [0, 1, 3, 10, 50] {
+            for seen in [0, 1, 3, 10, 50, 200] {
+                assert_eq!(sample(capacity, seen, 7).len(), capacity.min(seen));
+            }
+        }
+    }
+    
+    #[test]
+    fn test_reservoir_sampling() {
+        // A fixed seed gives a fixed sample of distinct items from the input
+        let picked = sample(5, 100, 42);
+        assert_eq!(picked, sample(5, 100, 42));
+        let mut distinct = picked.clone();
+        distinct.sort_unstable();
+        distinct.dedup();
+        assert_eq!(distinct.len(), 5);
+        assert!(picked.iter().all(|&item| item < 100));
+        
+        // Every item is kept about capacity / seen of the time
+        let mut kept = [0u32; 10];
+        for seed in 0..3000 {
+            for item in sample(3, 10, seed) {
+                kept[item] += 1;
+            }
+        }
+        for (item, &count) in kept.iter().enumerate() {
+            assert!((750..=1050).contains(&count), "item {} kept {} times", item, count);
+        }
+    }
+    
+    #[test]
+    fn test_timing_stats_single_file() {
+        let mut stats = TimingStats::new();
+        stats.record(Duration::from_micros(750));
+        
+        assert_eq!(stats.mean_nanos(), 750_000.0);
+        assert_eq!(stats.std_dev_nanos(), None);
+    }
+    
+    #[test]
+    fn test_csv_field() {
+        assert!(matches!(csv_field("plain value"), Cow::Borrowed("plain value")));
+        assert!(matches!(csv_field(""), Cow::Borrowed("")));
+        assert_eq!(csv_field("a,b"), "\"a,b\"");
+        assert_eq!(csv_field("say \"hi\""), "\"say \"\"hi\"\"\"");
+        assert_eq!(csv_field("line\nbreak"), "\"line\nbreak\"");
+        assert_eq!(csv_field("carriage\rreturn"), "\"carriage\rreturn\"");
+    }
+    
+    #[test]
+    fn test_extension_slot() {
+        let slot = |name: &str| extension_slot(Path::new(name));
+        let jpg = IMAGE_EXTENSIONS.iter().position(|&ext| ext == "jpg").unwrap();
+        let jpeg = IMAGE_EXTENSIONS.iter().position(|&ext| ext == "jpeg").unwrap();
+        let other = IMAGE_EXTENSIONS.len();
+        
+        assert_eq!(slot("photo.jpg"), jpg);
+        assert_eq!(slot("photo.JPG"), jpg);
+        assert_eq!(slot("photo.Jpeg"), jpeg);
+        assert_eq!(slot("dir.jpg/archive.tar.gz"), other);
+        assert_eq!(slot("/pictures/2019/photo.backup.jpg"), jpg);
+        
+        // A leading dot marks a hidden file, not an extension
+        assert_eq!(slot(".jpg"), other);
+        assert_eq!(slot(".hidden.jpg"), jpg);
+        
+        assert_eq!(slot("README"), other);
+        assert_eq!(slot("photo."), other);
+        assert_eq!(slot(""), other);
+    }
+    
+    #[cfg(unix)]
+    #[test]
+    fn test_extension_slot_non_utf8() {
+        use std::ffi::OsStr;
+        use std::os::unix::ffi::OsStrExt;
+        
+        let jpg = IMAGE_EXTENSIONS.iter().position(|&ext| ext == "jpg").unwrap();
+        let name = OsStr::from_bytes(b"caf\xe9-\xff.JPG");
+        assert!(name.to_str().is_none());
+        assert_eq!(extension_slot(Path::new(name)), jpg);
+    }
+    
+    #[cfg(unix)]
+    #[test]
+    fn test_non_utf8_file_name_is_an_error() {
+        use std::ffi::OsStr;
+        use std::os::unix::ffi::OsStrExt;
+        
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join(OsStr::from_bytes(b"caf\xe9.jpg"));
+        fs::write(&path, b"\xFF\xD8\xFF\xD9").unwrap();
+        
+        let mut reader = FastExifReader::new();
+        assert!(process_file(&mut reader, &path, &None).is_err());
+        
+        // Walking a directory that holds such a file still finishes the run
+        let input = dir.path().to_str().unwrap().to_string();
+        let result = extract_exif_data(
+            vec![input], false, OutputFormat::Count, true, None, false, true, None, true, true, None,
+        );
+        assert!(result.is_ok());
+    }
+}
@@ -1,28 +1,32 @@
-use fast_exif_reader::FastExifReader;
+use fast_exif_reader::{ExifError, FastExifReader};
+use std::collections::HashMap;
 use std::env;
 
-fn main() {
-    let args: Vec<String> = env::args().collect();
-    if args.len() != 2 {
-        eprintln!("Usage: {} <file_path>", args[0]);
-        std::process::exit(1);
-    }
-    
-    let mut reader = FastExifReader::new();
-    let file_path = &args[1];
-    
-    match reader.read_file(file_path) {
+/// Lowercase fragments that mark a date-like field name
+const DATE_FIELD_HINTS: &[&str] = &["date", "time", "create", "modify"];
+
+/// Lowercase fragments of the file system dates, which are not EXIF dates
+const FILE_SYSTEM_DATE_HINTS: &[&str] = &["filemodify", "fileaccess", "fileinode"];
+
+/// Case-insensitive substring test that avoids lowercasing the field name
+fn contains_ignore_ascii_case(haystack: &str, needle: &str) -> bool {
+    haystack
+        .as_bytes()
+        .windows(needle.len())
+        .any(|window| window.eq_ignore_ascii_case(needle.as_bytes()))
+}
+
+fn is_meaningful_date_field(key: &str) -> bool {
+    DATE_FIELD_HINTS.iter().any(|hint| contains_ignore_ascii_case(key, hint))
+        && !FILE_SYSTEM_DATE_HINTS.iter().any(|hint| contains_ignore_ascii_case(key, hint))
+}
+
+fn report_dates(result: Result<HashMap<String, String>, ExifError>) {
+    match result {
         Ok(metadata) => {
             // Look for meaningful date fields (exclude file system dates)
             let meaningful_dates: Vec<_> = metadata.iter()
-                .filter(|(key, _)| {
-                    let key_lower = key.to_lowercase();
-                    (key_lower.contains("date") || key_lower.contains("time") || 
-                     key_lower.contains("create") || key_lower.contains("modify")) &&
-                    !key_lower.contains("filemodify") && 
-                    !key_lower.contains("fileaccess") && 
-                    !key_lower.contains("fileinode")
-                })
+                .filter(|(key, _)| is_meaningful_date_field(key))
                 .filter(|(_, value)| !value.is_empty())
                 .collect();
             
@@ -40,3 +44,25 @@ fn main() {
         }
     }
 }
+
+fn main() {
+    let args: Vec<String> = env::args().collect();
+    if args.len() < 2 {
+        eprintln!("Usage: {} <file_path>...", args[0]);
+        std::process::exit(1);
+    }
+    
+    // Parse the whole batch at once across all cores, then report the
+    // results in the order the files were given
+    let mut reader = FastExifReader::new();
+    let file_paths = &args[1..];
+    let results = reader.read_files(file_paths);
+    
+    for (file_path, result) in file_paths.iter().zip(results) {
+        // Like exiftool, only label each file's output when given several
+        if file_paths.len() > 1 {
+            println!("======== {}", file_path);
+        }
+        report_dates(result);
+    }
+}
@@ -1,4 +1,16 @@
 use std::collections::HashMap;
+use crate::value_formatter::ValueFormatter;
+
+/// Fields exiftool always reports, with the value used when a file lacks them
+const DEFAULT_FIELDS: &[(&str, &str)] = &[
+    ("PhotometricInterpretation", "RGB"),
+    ("PlanarConfiguration", "Chunky"),
+    ("BlueBalance", "1.0"),
+    ("AutoFocus", "Off"),
+    ("PictureControlVersion", "1.0"),
+    ("MultiExposureShots", "1"),
+    ("FocusMode", "Auto"),
+];
 
 /// Computed fields that exiftool provides but fast-exif-rs doesn't extract directly
 pub struct ComputedFields;
@@ -15,17 +27,24 @@ impl ComputedFields {
         // Light value calculation
         Self::add_light_value(metadata);
         
-        // Scale factor for 35mm equivalent
-        Self::add_scale_factor_35efl(metadata);
-        
-        // Circle of confusion
-        Self::add_circle_of_confusion(metadata);
-        
-        // Field of view
-        Self::add_fov(metadata);
+        // Focal length feeds several computations below, so parse it only once
+        let focal_length = metadata
+            .get("FocalLength")
+            .and_then(|fl| Self::parse_focal_length(fl).ok());
         
-        // Hyperfocal distance
-        Self::add_hyperfocal_distance(metadata);
+        if let Some(fl) = focal_length {
+            // Scale factor for 35mm equivalent
+            Self::add_scale_factor_35efl(metadata, fl);
+            
+            // Circle of confusion
+            Self::add_circle_of_confusion(metadata, fl);
+            
+            // Field of view
+            Self::add_fov(metadata, fl);
+            
+            // Hyperfocal distance
+            Self::add_hyperfocal_distance(metadata, fl);
+        }
         
         // Lens specification
         Self::add_lens_specification(metadata);
@@ -101,15 +120,9 @@ impl ComputedFields {
     }
     
     /// Add scale factor for 35mm equivalent focal length
-    fn add_scale_factor_35efl(metadata: &mut HashMap<String, String>) {
-        if let (Some(focal_length), Some(focal_35mm)) = (
-            metadata.get("FocalLength"),
-            metadata.get("FocalLengthIn35mmFilm")
-        ) {
-            if let (Ok(fl), Ok(fl35)) = (
-                Self::parse_focal_length(focal_length),
-                Self::parse_focal_length(focal_35mm)
-            ) {
+    fn add_scale_factor_35efl(metadata: &mut HashMap<String, String>, fl: f64) {
+        if let Some(focal_35mm) = metadata.get("FocalLengthIn35mmFilm") {
+            if let Ok(fl35) = Self::parse_focal_length(focal_35mm) {
                 if fl > 0.0 && fl35 > 0.0 {
                     let scale_factor = fl35 / fl;
                     metadata.insert("ScaleFactor35efl".to_string(), format!("{:.2}", scale_factor));
@@ -119,30 +132,19 @@ impl ComputedFields {
     }
     
     /// Add circle of confusion calculation
-    fn add_circle_of_confusion(metadata: &mut HashMap<String, String>) {
-        if let Some(focal_length) = metadata.get("FocalLength") {
-            if let Ok(fl) = Self::parse_focal_length(focal_length) {
-                // Circle of confusion = focal_length / 1500 (approximation)
-                let coc = fl / 1500.0;
-                metadata.insert("CircleOfConfusion".to_string(), format!("{:.3} mm", coc));
-            }
-        }
+    fn add_circle_of_confusion(metadata: &mut HashMap<String, String>, fl: f64) {
+        // Circle of confusion = focal_length / 1500 (approximation)
+        let coc = fl / 1500.0;
+        metadata.insert("CircleOfConfusion".to_string(), format!("{:.3} mm", coc));
     }
     
     /// Add field of view calculation
-    fn add_fov(metadata: &mut HashMap<String, String>) {
-        if let (Some(focal_length), Some(sensor_width)) = (
-            metadata.get("FocalLength"),
-            metadata.get("SensorWidth")
-        ) {
-            if let (Ok(fl), Ok(sw)) = (
-                Self::parse_focal_length(focal_length),
-                sensor_width.parse::<f64>()
-            ) {
+    fn add_fov(metadata: &mut HashMap<String, String>, fl: f64) {
+        if let Some(sensor_width) = metadata.get("SensorWidth") {
+            if let Ok(sw) = sensor_width.parse::<f64>() {
                 if fl > 0.0 && sw > 0.0 {
                     // FOV = 2 * arctan(sensor_width / (2 * focal_length))
-                    let fov_rad = 2.0 * (sw / (2.0 * fl)).atan();
-                    let fov_deg = fov_rad * 180.0 / std::f64::consts::PI;
+                    let fov_deg = (2.0 * (sw / (2.0 * fl)).atan()).to_degrees();
                     metadata.insert("FOV".to_string(), format!("{:.1}°", fov_deg));
                 }
             }
@@ -150,15 +152,9 @@ impl ComputedFields {
     }
     
     /// Add hyperfocal distance calculation
-    fn add_hyperfocal_distance(metadata: &mut HashMap<String, String>) {
-        if let (Some(focal_length), Some(aperture)) = (
-            metadata.get("FocalLength"),
-            metadata.get("FNumber")
-        ) {
-            if let (Ok(fl), Ok(f)) = (
-                Self::parse_focal_length(focal_length),
-                aperture.parse::<f64>()
-            ) {
+    fn add_hyperfocal_distance(metadata: &mut HashMap<String, String>, fl: f64) {
+        if let Some(aperture) = metadata.get("FNumber") {
+            if let Ok(f) = aperture.parse::<f64>() {
                 if fl > 0.0 && f > 0.0 {
                     // Hyperfocal distance = (focal_length²) / (aperture * circle_of_confusion)
                     let coc = fl / 1500.0; // Approximate circle of confusion
@@ -188,13 +184,11 @@ impl ComputedFields {
     
     /// Add additional computed fields
     fn add_additional_computed_fields(metadata: &mut HashMap<String, String>) {
-        // Add missing fields that exiftool provides
-        if !metadata.contains_key("PhotometricInterpretation") {
-            metadata.insert("PhotometricInterpretation".to_string(), "RGB".to_string());
-        }
-        
-        if !metadata.contains_key("PlanarConfiguration") {
-            metadata.insert("PlanarConfiguration".to_string(), "Chunky".to_string());
+        // Add missing fields that exiftool provides, with their fixed defaults
+        for &(field, default) in DEFAULT_FIELDS {
+            if !metadata.contains_key(field) {
+                metadata.insert(field.to_string(), default.to_string());
+            }
         }
         
         if !metadata.contains_key("RowsPerStrip") {
@@ -202,41 +196,13 @@ impl ComputedFields {
                 metadata.insert("RowsPerStrip".to_string(), height.clone());
             }
         }
-        
-        // Add BlueBalance if missing
-        if !metadata.contains_key("BlueBalance") {
-            metadata.insert("BlueBalance".to_string(), "1.0".to_string());
-        }
-        
-        // Add AutoFocus if missing
-        if !metadata.contains_key("AutoFocus") {
-            metadata.insert("AutoFocus".to_string(), "Off".to_string());
-        }
-        
-        // Add PictureControlVersion if missing
-        if !metadata.contains_key("PictureControlVersion") {
-            metadata.insert("PictureControlVersion".to_string(), "1.0".to_string());
-        }
-        
-        // Add MultiExposureShots if missing
-        if !metadata.contains_key("MultiExposureShots") {
-            metadata.insert("MultiExposureShots".to_string(), "1".to_string());
-        }
-        
-        // Add FocusMode if missing
-        if !metadata.contains_key("FocusMode") {
-            metadata.insert("FocusMode".to_string(), "Auto".to_string());
-        }
     }
     
     /// Parse exposure time from various formats
     fn parse_exposure_time(exposure_time: &str) -> Result<f64, std::num::ParseFloatError> {
-        if exposure_time.contains('/') {
-            let parts: Vec<&str> = exposure_time.split('/').collect();
-            if parts.len() == 2 {
-                if let (Ok(numerator), Ok(denominator)) = (parts[0].parse::<f64>(), parts[1].parse::<f64>()) {
-                    return Ok(numerator / denominator);
-                }
+        if let Some((numerator, denominator)) = exposure_time.split_once('/') {
+            if let (Ok(numerator), Ok(denominator)) = (numerator.parse::<f64>(), denominator.parse::<f64>()) {
+                return Ok(numerator / denominator);
             }
         }
         exposure_time.parse::<f64>()
@@ -245,8 +211,7 @@ impl ComputedFields {
     /// Parse focal length from various formats
     fn parse_focal_length(focal_length: &str) -> Result<f64, std::num::ParseFloatError> {
         // Remove "mm" suffix if present
-        let cleaned = focal_length.replace(" mm", "").replace("mm", "");
-        cleaned.parse::<f64>()
+        ValueFormatter::strip_unit_suffix(focal_length, "mm").parse::<f64>()
     }
     
     /// Add composite fields for PyExifTool compatibility
@@ -336,130 +301,54 @@ impl ComputedFields {
         }
         
         // Update main datetime fields to include sub-second precision and timezone (like exiftool)
-        if let Some(create_date) = metadata.get("CreateDate") {
-            if let Some(subsec) = metadata.get("SubSecTime") {
-                let timezone = metadata
-                    .get("OffsetTime")
-                    .or_else(|| metadata.get("TimeZone"))
-                    .map(|tz| tz.to_string())
-                    .unwrap_or_else(|| {
-                        // Fallback: try to extract timezone from camera make or use default
-                        if metadata
-                            .get("Make")
-                            .map(|m| m.contains("NIKON"))
-                            .unwrap_or(false)
-                        {
-                            "-04:00".to_string() // Default for Nikon cameras
-                        } else if metadata
-                            .get("Make")
-                            .map(|m| m.contains("Canon"))
-                            .unwrap_or(false)
-                        {
-                            "-05:00".to_string() // Default for Canon cameras
-                        } else {
-                            "".to_string()
-                        }
-                    });
-                let subsec_create = format!("{}.{}{}", create_date, subsec, timezone);
-                metadata.insert("CreateDate".to_string(), subsec_create);
-            }
+        if let (Some(create_date), Some(subsec)) = (metadata.get("CreateDate"), metadata.get("SubSecTime")) {
+            let timezone = Self::timezone_suffix(metadata, "OffsetTime");
+            let subsec_create = format!("{}.{}{}", create_date, subsec, timezone);
+            metadata.insert("CreateDate".to_string(), subsec_create);
         }
         
-        if let Some(dto) = metadata.get("DateTimeOriginal") {
-            if let Some(subsec) = metadata.get("SubSecTimeOriginal") {
-                let timezone = metadata
-                    .get("OffsetTimeOriginal")
-                    .or_else(|| metadata.get("OffsetTime"))
-                    .or_else(|| metadata.get("TimeZone"))
-                    .map(|tz| tz.to_string())
-                    .unwrap_or_else(|| {
-                        // Fallback: try to extract timezone from camera make or use default
-                        if metadata
-                            .get("Make")
-                            .map(|m| m.contains("NIKON"))
-                            .unwrap_or(false)
-                        {
-                            "-04:00".to_string() // Default for Nikon cameras
-                        } else if metadata
-                            .get("Make")
-                            .map(|m| m.contains("Canon"))
-                            .unwrap_or(false)
-                        {
-                            "-05:00".to_string() // Default for Canon cameras
-                        } else {
-                            "".to_string()
-                        }
-                    });
-                let subsec_dto = format!("{}.{}{}", dto, subsec, timezone);
-                metadata.insert("DateTimeOriginal".to_string(), subsec_dto);
-            }
+        if let (Some(dto), Some(subsec)) = (metadata.get("DateTimeOriginal"), metadata.get("SubSecTimeOriginal")) {
+            let timezone = Self::timezone_suffix(metadata, "OffsetTimeOriginal");
+            let subsec_dto = format!("{}.{}{}", dto, subsec, timezone);
+            metadata.insert("DateTimeOriginal".to_string(), subsec_dto);
         }
         
-        if let Some(modify_date) = metadata.get("ModifyDate") {
-            if let Some(subsec) = metadata.get("SubSecTime") {
-                let timezone = metadata
-                    .get("OffsetTime")
-                    .or_else(|| metadata.get("TimeZone"))
-                    .map(|tz| tz.to_string())
-                    .unwrap_or_else(|| {
-                        // Fallback: try to extract timezone from camera make or use default
-                        if metadata
-                            .get("Make")
-                            .map(|m| m.contains("NIKON"))
-                            .unwrap_or(false)
-                        {
-                            "-04:00".to_string() // Default for Nikon cameras
-                        } else if metadata
-                            .get("Make")
-                            .map(|m| m.contains("Canon"))
-                            .unwrap_or(false)
-                        {
-                            "-05:00".to_string() // Default for Canon cameras
-                        } else {
-                            "".to_string()
-                        }
-                    });
-                let subsec_modify = format!("{}.{}{}", modify_date, subsec, timezone);
-                metadata.insert("ModifyDate".to_string(), subsec_modify);
-            }
+        if let (Some(modify_date), Some(subsec)) = (metadata.get("ModifyDate"), metadata.get("SubSecTime")) {
+            let timezone = Self::timezone_suffix(metadata, "OffsetTime");
+            let subsec_modify = format!("{}.{}{}", modify_date, subsec, timezone);
+            metadata.insert("ModifyDate".to_string(), subsec_modify);
         }
         
         // Update CreateDate to match the updated DateTimeOriginal
         if let Some(dto) = metadata.get("DateTimeOriginal") {
-            if let Some(_create_date) = metadata.get("CreateDate") {
+            if metadata.contains_key("CreateDate") {
                 // Update CreateDate to match DateTimeOriginal format
                 metadata.insert("CreateDate".to_string(), dto.clone());
             }
         }
         
-        if let Some(digitized_date) = metadata.get("DateTimeDigitized") {
-            if let Some(subsec) = metadata.get("SubSecTimeDigitized") {
-                let timezone = metadata
-                    .get("OffsetTimeDigitized")
-                    .or_else(|| metadata.get("OffsetTime"))
-                    .or_else(|| metadata.get("TimeZone"))
-                    .map(|tz| tz.to_string())
-                    .unwrap_or_else(|| {
-                        // Fallback: try to extract timezone from camera make or use default
-                        if metadata
-                            .get("Make")
-                            .map(|m| m.contains("NIKON"))
-                            .unwrap_or(false)
-                        {
-                            "-04:00".to_string() // Default for Nikon cameras
-                        } else if metadata
-                            .get("Make")
-                            .map(|m| m.contains("Canon"))
-                            .unwrap_or(false)
-                        {
-                            "-05:00".to_string() // Default for Canon cameras
-                        } else {
-                            "".to_string()
-                        }
-                    });
-                let subsec_digitized = format!("{}.{}{}", digitized_date, subsec, timezone);
-                metadata.insert("DateTimeDigitized".to_string(), subsec_digitized);
-            }
+        if let (Some(digitized_date), Some(subsec)) = (metadata.get("DateTimeDigitized"), metadata.get("SubSecTimeDigitized")) {
+            let timezone = Self::timezone_suffix(metadata, "OffsetTimeDigitized");
+            let subsec_digitized = format!("{}.{}{}", digitized_date, subsec, timezone);
+            metadata.insert("DateTimeDigitized".to_string(), subsec_digitized);
+        }
+    }
+    
+    /// Timezone suffix for a date field, borrowed from the metadata rather than copied
+    fn timezone_suffix<'a>(metadata: &'a HashMap<String, String>, offset_field: &str) -> &'a str {
+        if let Some(tz) = metadata
+            .get(offset_field)
+            .or_else(|| metadata.get("OffsetTime"))
+            .or_else(|| metadata.get("TimeZone"))
+        {
+            return tz;
+        }
+        
+        // Fallback: try to extract timezone from camera make or use default
+        match metadata.get("Make") {
+            Some(make) if make.contains("NIKON") => "-04:00", // Default for Nikon cameras
+            Some(make) if make.contains("Canon") => "-05:00", // Default for Canon cameras
+            _ => "",
         }
     }
     
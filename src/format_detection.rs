@@ -1,5 +1,18 @@
 use crate::types::ExifError;
 
+/// Camera make markers searched by `detect_camera_make`, in priority order
+const CAMERA_MAKE_MARKERS: &[(&[u8], &str)] = &[
+    (b"Canon", "Canon"),
+    (b"Nikon", "NIKON CORPORATION"),
+    (b"NIKON CORPORATION", "NIKON CORPORATION"),
+    (b"GoPro", "GoPro"),
+    (b"Samsung", "Samsung"),
+    (b"SAMSUNG", "Samsung"),
+    (b"Motorola", "Motorola"),
+    (b"OLYMPUS", "OLYMPUS OPTICAL CO.,LTD"),
+    (b"RICOH", "RICOH"),
+];
+
 /// Format detection utilities for various image and video formats
 pub struct FormatDetector;
 
@@ -166,51 +179,29 @@ impl FormatDetector {
 
     /// Detect camera make from various markers in the file
     pub fn detect_camera_make(data: &[u8]) -> Option<String> {
-        // Detect camera make from various markers in the file
-        let search_len = std::cmp::min(8192, data.len());
-
-        // Check for Canon
-        if data[..search_len].windows(5).any(|w| w == b"Canon") {
-            return Some("Canon".to_string());
-        }
-
-        // Check for Nikon (both NIKON CORPORATION and NIKON)
-        if data[..search_len].windows(5).any(|w| w == b"Nikon")
-            || data[..search_len]
-                .windows(15)
-                .any(|w| w == b"NIKON CORPORATION")
-        {
-            return Some("NIKON CORPORATION".to_string());
-        }
-
-        // Check for GoPro
-        if data[..search_len].windows(6).any(|w| w == b"GoPro") {
-            return Some("GoPro".to_string());
-        }
-
-        // Check for Samsung
-        if data[..search_len].windows(7).any(|w| w == b"Samsung")
-            || data[..search_len].windows(7).any(|w| w == b"SAMSUNG")
-        {
-            return Some("Samsung".to_string());
-        }
-
-        // Check for Motorola
-        if data[..search_len].windows(8).any(|w| w == b"Motorola") {
-            return Some("Motorola".to_string());
-        }
-
-        // Check for Olympus
-        if data[..search_len].windows(7).any(|w| w == b"OLYMPUS") {
-            return Some("OLYMPUS OPTICAL CO.,LTD".to_string());
-        }
-
-        // Check for Ricoh
-        if data[..search_len].windows(5).any(|w| w == b"RICOH") {
-            return Some("RICOH".to_string());
+        // Detect camera make from various markers in the file, scanning once and
+        // keeping the earliest-listed marker when several are present
+        let window = &data[..std::cmp::min(8192, data.len())];
+        let mut best = CAMERA_MAKE_MARKERS.len();
+        for (i, byte) in window.iter().enumerate() {
+            if !matches!(byte, b'C' | b'N' | b'G' | b'S' | b'M' | b'O' | b'R') {
+                continue;
+            }
+            let rest = &window[i..];
+            if let Some(rank) = CAMERA_MAKE_MARKERS[..best]
+                .iter()
+                .position(|(marker, _)| rest.starts_with(marker))
+            {
+                best = rank;
+                if best == 0 {
+                    break;
+                }
+            }
         }
 
-        None
+        CAMERA_MAKE_MARKERS
+            .get(best)
+            .map(|(_, make)| make.to_string())
     }
 
     /// Check if TIFF data contains valid EXIF data
@@ -240,3 +231,75 @@ impl FormatDetector {
         magic_offset == 42
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Embed a marker in the middle of some unrelated bytes
+    fn with_marker(marker: &[u8]) -> Vec<u8> {
+        let mut data = vec![0u8; 64];
+        data.extend_from_slice(marker);
+        data.extend_from_slice(&[0u8; 64]);
+        data
+    }
+
+    #[test]
+    fn test_detect_camera_make_markers() {
+        let cases: &[(&[u8], &str)] = &[
+            (b"Canon", "Canon"),
+            (b"Nikon", "NIKON CORPORATION"),
+            (b"Samsung", "Samsung"),
+            (b"SAMSUNG", "Samsung"),
+            (b"Motorola", "Motorola"),
+            (b"OLYMPUS", "OLYMPUS OPTICAL CO.,LTD"),
+            (b"RICOH", "RICOH"),
+        ];
+        for &(marker, make) in cases {
+            assert_eq!(
+                FormatDetector::detect_camera_make(&with_marker(marker)).as_deref(),
+                Some(make)
+            );
+        }
+    }
+
+    #[test]
+    fn test_detect_camera_make_long_markers() {
+        // Both were once compared against windows of the wrong length and never matched
+        assert_eq!(
+            FormatDetector::detect_camera_make(&with_marker(b"GoPro")).as_deref(),
+            Some("GoPro")
+        );
+        assert_eq!(
+            FormatDetector::detect_camera_make(&with_marker(b"NIKON CORPORATION")).as_deref(),
+            Some("NIKON CORPORATION")
+        );
+    }
+
+    #[test]
+    fn test_detect_camera_make_priority() {
+        // The earliest-listed marker wins, wherever it appears in the data
+        let mut data = with_marker(b"RICOH");
+        data.extend_from_slice(b"Canon");
+        assert_eq!(FormatDetector::detect_camera_make(&data).as_deref(), Some("Canon"));
+
+        let mut data = with_marker(b"GoPro");
+        data.extend_from_slice(b"Nikon");
+        assert_eq!(
+            FormatDetector::detect_camera_make(&data).as_deref(),
+            Some("NIKON CORPORATION")
+        );
+    }
+
+    #[test]
+    fn test_detect_camera_make_none() {
+        assert_eq!(FormatDetector::detect_camera_make(b""), None);
+        assert_eq!(FormatDetector::detect_camera_make(b"Can"), None);
+        assert_eq!(FormatDetector::detect_camera_make(&with_marker(b"canon")), None);
+
+        // Only the first 8 KiB is searched
+        let mut data = vec![0u8; 8192];
+        data.extend_from_slice(b"Canon");
+        assert_eq!(FormatDetector::detect_camera_make(&data), None);
+    }
+}
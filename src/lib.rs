@@ -3,9 +3,9 @@
 //! A high-performance EXIF metadata extraction library written in Rust.
 //! Provides comprehensive support for image and video formats with exceptional performance.
 
-use memmap2::Mmap;
+use memmap2::{Mmap, MmapOptions};
 use std::collections::HashMap;
-use std::fs::File;
+use std::fs::{self, File};
 use rayon::prelude::*;
 
 // Module declarations
@@ -27,10 +27,11 @@ mod enhanced_dng_parser;
 mod field_mapping;
 mod computed_fields;
 mod value_formatter;
+mod timing;
 
 // Re-export commonly used types
 pub use format_detection::FormatDetector;
-pub use parsers::{OptimalExifParser, OptimalBatchProcessor, BmpParser, HeifParser, JpegParser, MkvParser, PngParser, RawParser, VideoParser};
+pub use parsers::{OptimalExifParser, OptimalBatchProcessor, BmpParser, ExifSegment, HeifParser, JpegParser, MkvParser, PngParser, RawParser, TiffParser, VideoParser};
 pub use types::{ExifError, ExifResult, ProcessingStats};
 pub use utils::ExifUtils;
 pub use writer::ExifWriter;
@@ -42,103 +43,150 @@ pub use enhanced_raw_parser::EnhancedRawParser;
 pub use enhanced_video_parser::EnhancedVideoParser;
 pub use enhanced_image_parser::EnhancedImageParser;
 pub use field_mapping::FieldMapper;
+pub use timing::TimingHistogram;
+
+/// Leading bytes of a file that metadata parsing nearly always touches, and so
+/// are worth reading ahead of time
+const HEADER_PREFETCH_LEN: usize = 256 * 1024;
+
+/// Upper bound on the run of consecutive files one parallel task takes, so a
+/// batch of slow files still spreads across all threads
+const MAX_FILES_PER_TASK: usize = 32;
+
+/// Shortest run of consecutive files to hand one parallel task when reading
+/// `file_count` files: about a quarter of each thread's share, between 1 and
+/// 32, so tasks are cheap to schedule but the batch still spreads out.
+///
+/// Public only so the exiftool-rs CLI schedules its reads the same way as
+/// [`FastExifReader::read_files`]; this is a tuning detail, not a stable API,
+/// and may change or go away in any release.
+#[doc(hidden)]
+pub fn min_files_per_task(file_count: usize) -> usize {
+    (file_count / (rayon::current_num_threads() * 4)).clamp(1, MAX_FILES_PER_TASK)
+}
 
 /// Fast EXIF reader with comprehensive multimedia support
+///
+/// The reader holds no state, so creating one per thread or per task is free.
 #[derive(Clone)]
-pub struct FastExifReader {
-    /// Optimal parser for maximum performance
-    parser: OptimalExifParser,
-}
+pub struct FastExifReader;
 
 impl FastExifReader {
     /// Create a new FastExifReader instance
     pub fn new() -> Self {
-        Self {
-            parser: OptimalExifParser::new(),
-        }
+        Self
     }
 
     /// Read EXIF data from file path
     pub fn read_file(&mut self, file_path: &str) -> Result<HashMap<String, String>, ExifError> {
         let mut metadata = self.read_exif_fast(file_path)?;
-        
-        // Add computed fields for comprehensive metadata
-        crate::computed_fields::ComputedFields::add_computed_fields(&mut metadata);
-        
-        // Normalize field names to standard format
-        FieldMapper::normalize_metadata_to_exiftool(&mut metadata);
-        
-        // Normalize values to standard format
-        crate::value_formatter::ValueFormatter::normalize_values_to_exiftool(&mut metadata);
-        
+        Self::finish_metadata(&mut metadata);
         Ok(metadata)
     }
 
     /// Read EXIF data from bytes
     pub fn read_bytes(&mut self, data: &[u8]) -> Result<HashMap<String, String>, ExifError> {
         let mut metadata = self.read_exif_from_bytes(data)?;
-        
-        // Add computed fields for comprehensive metadata
-        crate::computed_fields::ComputedFields::add_computed_fields(&mut metadata);
-        
-        // Normalize field names to standard format
-        FieldMapper::normalize_metadata_to_exiftool(&mut metadata);
-        
-        // Normalize values to standard format
-        crate::value_formatter::ValueFormatter::normalize_values_to_exiftool(&mut metadata);
-        
+        Self::finish_metadata(&mut metadata);
         Ok(metadata)
     }
 
     /// Read EXIF data from multiple files in parallel
     pub fn read_files_parallel(&mut self, file_paths: Vec<String>) -> Result<Vec<HashMap<String, String>>, ExifError> {
+        self.read_files(&file_paths).into_iter().collect()
+    }
+
+    /// Read EXIF data from a batch of files in parallel, with one result per file
+    /// in input order, so a single unreadable file does not discard the batch
+    pub fn read_files(&mut self, file_paths: &[String]) -> Vec<Result<HashMap<String, String>, ExifError>> {
         // Use Rayon for true parallel processing across multiple files
-        let results: Result<Vec<_>, _> = file_paths
-            .par_iter()
-            .map(|file_path| {
-                let file = File::open(file_path)?;
-                let mmap = unsafe { Mmap::map(&file)? };
-                
-                // Create a temporary reader for this thread
-                let mut temp_reader = FastExifReader::new();
-                let mut metadata = temp_reader.read_exif_from_bytes(&mmap)?;
+        // Each worker keeps its reader along with the mapping it prefetched last
+        // Hand out runs of files rather than single ones, so the header prefetched
+        // for the next index is nearly always read by the same worker instead of
+        // being split off to another one and mapped twice
+        (0..file_paths.len())
+            .into_par_iter()
+            .with_min_len(min_files_per_task(file_paths.len()))
+            .map_init(|| (FastExifReader::new(), None::<(usize, fs::Metadata, Mmap)>), |(reader, prefetched), index| {
+                let file_path = &file_paths[index];
                 
-                // Add file system information that exiftool provides
-                Self::add_file_system_metadata(file_path, &mut metadata);
+                // Workers walk runs of consecutive indices, so the file mapped and
+                // prefetched on the previous step is usually this one
+                let (file_info, mmap) = match prefetched.take() {
+                    Some((prefetched_index, file_info, mmap)) if prefetched_index == index => (file_info, mmap),
+                    _ => Self::map_file(file_path)?,
+                };
                 
-                // Add computed fields for 1:1 exiftool compatibility
-                crate::computed_fields::ComputedFields::add_computed_fields(&mut metadata);
-                
-                // Normalize field names to exiftool standard for 1:1 compatibility
-                FieldMapper::normalize_metadata_to_exiftool(&mut metadata);
-                
-                // Normalize values to match PyExifTool raw format
-                crate::value_formatter::ValueFormatter::normalize_values_to_exiftool(&mut metadata);
+                // Start the disk read of the next file's header so it overlaps
+                // with parsing this one
+                if let Some(next_path) = file_paths.get(index + 1) {
+                    *prefetched = Self::map_file(next_path).ok().map(|(next_info, next_mmap)| {
+                        Self::prefetch_header(&next_mmap);
+                        (index + 1, next_info, next_mmap)
+                    });
+                }
                 
+                let mut metadata = reader.read_exif_from_mapped_file(file_path, &file_info, &mmap)?;
+                Self::finish_metadata(&mut metadata);
                 Ok(metadata)
             })
-            .collect();
+            .collect()
+    }
+
+    /// Add computed fields and normalize the result, the last step of every read path
+    fn finish_metadata(metadata: &mut HashMap<String, String>) {
+        // Add computed fields for 1:1 exiftool compatibility
+        crate::computed_fields::ComputedFields::add_computed_fields(metadata);
         
-        results
+        // Normalize field names and values for 1:1 exiftool compatibility
+        Self::normalize_metadata(metadata);
+    }
+
+    /// Normalize field names and values to exiftool format
+    fn normalize_metadata(metadata: &mut HashMap<String, String>) {
+        crate::value_formatter::ValueFormatter::normalize_metadata_to_exiftool(metadata);
+    }
+
+    /// Open and memory-map a file, returning its metadata along with the mapping
+    fn map_file(file_path: &str) -> Result<(fs::Metadata, Mmap), ExifError> {
+        let file = File::open(file_path)?;
+        // One fstat serves both the mapping length and the file system fields;
+        // Mmap::map would otherwise stat the file again on its own
+        let file_info = file.metadata()?;
+        let mmap = unsafe { MmapOptions::new().len(file_info.len() as usize).map(&file)? };
+        // The mapping stays valid after the descriptor is closed here
+        Ok((file_info, mmap))
     }
 
+    /// Ask the kernel to start reading the start of a mapped file in the background
+    #[cfg(unix)]
+    fn prefetch_header(mmap: &Mmap) {
+        // Only a hint; a failure just means the pages are faulted in on demand
+        let _ = mmap.advise_range(memmap2::Advice::WillNeed, 0, mmap.len().min(HEADER_PREFETCH_LEN));
+    }
+
+    #[cfg(not(unix))]
+    fn prefetch_header(_mmap: &Mmap) {}
+
     /// Read EXIF data from file path (internal implementation)
     fn read_exif_fast(&mut self, file_path: &str) -> Result<HashMap<String, String>, ExifError> {
-        let file = File::open(file_path)?;
-        let mmap = unsafe { Mmap::map(&file)? };
+        let (file_info, mmap) = Self::map_file(file_path)?;
+        self.read_exif_from_mapped_file(file_path, &file_info, &mmap)
+    }
 
-        let mut metadata = self.read_exif_from_bytes(&mmap)?;
+    /// Parse an already mapped file and add its file system information
+    fn read_exif_from_mapped_file(&mut self, file_path: &str, file_info: &fs::Metadata, data: &[u8]) -> Result<HashMap<String, String>, ExifError> {
+        let mut metadata = self.read_exif_from_bytes(data)?;
         
-        // Add file system information
-        Self::add_file_system_metadata(file_path, &mut metadata);
+        // Add file system information that exiftool provides
+        Self::add_file_system_metadata(file_path, file_info, &mut metadata);
         
         Ok(metadata)
     }
 
     /// Add file system metadata
-    fn add_file_system_metadata(file_path: &str, metadata: &mut HashMap<String, String>) {
+    fn add_file_system_metadata(file_path: &str, metadata_fs: &fs::Metadata, metadata: &mut HashMap<String, String>) {
         use std::path::Path;
-        use std::fs;
         use std::time::UNIX_EPOCH;
         
         let path = Path::new(file_path);
@@ -159,61 +207,58 @@ impl FastExifReader {
         // Add source file path
         metadata.insert("SourceFile".to_string(), file_path.to_string());
         
-        // Add file metadata
-        if let Ok(metadata_fs) = fs::metadata(file_path) {
-            // File size
-            metadata.insert("FileSize".to_string(), metadata_fs.len().to_string());
-            
-            // File permissions (Unix-style)
-            #[cfg(unix)]
-            {
-                use std::os::unix::fs::PermissionsExt;
-                let permissions = metadata_fs.permissions();
-                let mode = permissions.mode();
-                metadata.insert("FilePermissions".to_string(), format!("{:o}", mode));
+        // File size, from the fstat done when the file was mapped
+        metadata.insert("FileSize".to_string(), metadata_fs.len().to_string());
+        
+        // File permissions (Unix-style)
+        #[cfg(unix)]
+        {
+            use std::os::unix::fs::PermissionsExt;
+            let permissions = metadata_fs.permissions();
+            let mode = permissions.mode();
+            metadata.insert("FilePermissions".to_string(), format!("{:o}", mode));
+        }
+        
+        // File modification time
+        if let Ok(modified) = metadata_fs.modified() {
+            if let Ok(duration) = modified.duration_since(UNIX_EPOCH) {
+                let timestamp = duration.as_secs();
+                let datetime = Self::timestamp_to_datetime(timestamp);
+                metadata.insert("FileModifyDate".to_string(), datetime);
             }
-            
-            // File modification time
-            if let Ok(modified) = metadata_fs.modified() {
-                if let Ok(duration) = modified.duration_since(UNIX_EPOCH) {
+        }
+        
+        // File access time
+        if let Ok(accessed) = metadata_fs.accessed() {
+            if let Ok(duration) = accessed.duration_since(UNIX_EPOCH) {
+                let timestamp = duration.as_secs();
+                let datetime = Self::timestamp_to_datetime(timestamp);
+                metadata.insert("FileAccessDate".to_string(), datetime);
+            }
+        }
+        
+        // File creation time (if available)
+        #[cfg(target_os = "macos")]
+        {
+            use std::os::macos::fs::MetadataExt;
+            let created = metadata_fs.created();
+            if let Ok(created) = created {
+                if let Ok(duration) = created.duration_since(UNIX_EPOCH) {
                     let timestamp = duration.as_secs();
                     let datetime = Self::timestamp_to_datetime(timestamp);
-                    metadata.insert("FileModifyDate".to_string(), datetime);
+                    metadata.insert("FileInodeChangeDate".to_string(), datetime);
                 }
             }
-            
-            // File access time
-            if let Ok(accessed) = metadata_fs.accessed() {
-                if let Ok(duration) = accessed.duration_since(UNIX_EPOCH) {
+        }
+        
+        #[cfg(not(target_os = "macos"))]
+        {
+            // For other systems, use modification time as fallback
+            if let Ok(modified) = metadata_fs.modified() {
+                if let Ok(duration) = modified.duration_since(UNIX_EPOCH) {
                     let timestamp = duration.as_secs();
                     let datetime = Self::timestamp_to_datetime(timestamp);
-                    metadata.insert("FileAccessDate".to_string(), datetime);
-                }
-            }
-            
-            // File creation time (if available)
-            #[cfg(target_os = "macos")]
-            {
-                use std::os::macos::fs::MetadataExt;
-                let created = metadata_fs.created();
-                if let Ok(created) = created {
-                    if let Ok(duration) = created.duration_since(UNIX_EPOCH) {
-                        let timestamp = duration.as_secs();
-                        let datetime = Self::timestamp_to_datetime(timestamp);
-                        metadata.insert("FileInodeChangeDate".to_string(), datetime);
-                    }
-                }
-            }
-            
-            #[cfg(not(target_os = "macos"))]
-            {
-                // For other systems, use modification time as fallback
-                if let Ok(modified) = metadata_fs.modified() {
-                    if let Ok(duration) = modified.duration_since(UNIX_EPOCH) {
-                        let timestamp = duration.as_secs();
-                        let datetime = Self::timestamp_to_datetime(timestamp);
-                        metadata.insert("FileInodeChangeDate".to_string(), datetime);
-                    }
+                    metadata.insert("FileInodeChangeDate".to_string(), datetime);
                 }
             }
         }
@@ -440,3 +485,70 @@ impl Default for FastExifCopier {
         Self::new()
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Minimal JPEG whose EXIF block holds a single Make tag
+    fn jpeg_with_make(make: &str) -> Vec<u8> {
+        let mut value = make.as_bytes().to_vec();
+        value.push(0);
+
+        // Little-endian TIFF header, then IFD0 with one ASCII entry whose value
+        // follows the IFD at offset 26
+        let mut tiff = Vec::new();
+        tiff.extend_from_slice(b"II*\0");
+        tiff.extend_from_slice(&8u32.to_le_bytes());
+        tiff.extend_from_slice(&1u16.to_le_bytes());
+        tiff.extend_from_slice(&0x010Fu16.to_le_bytes());
+        tiff.extend_from_slice(&2u16.to_le_bytes());
+        tiff.extend_from_slice(&(value.len() as u32).to_le_bytes());
+        tiff.extend_from_slice(&26u32.to_le_bytes());
+        tiff.extend_from_slice(&0u32.to_le_bytes());
+        tiff.extend_from_slice(&value);
+
+        let mut jpeg = vec![0xFF, 0xD8, 0xFF, 0xE1];
+        jpeg.extend_from_slice(&((2 + 6 + tiff.len()) as u16).to_be_bytes());
+        jpeg.extend_from_slice(b"Exif\0\0");
+        jpeg.extend_from_slice(&tiff);
+        jpeg.extend_from_slice(&[0xFF, 0xD9]);
+        jpeg
+    }
+
+    #[test]
+    fn test_read_files_per_file_results() {
+        let dir = tempfile::tempdir().unwrap();
+
+        let makes = ["Canon", "NIKON CORPORATION", "RICOH"];
+        let mut file_paths: Vec<String> = makes
+            .iter()
+            .enumerate()
+            .map(|(i, make)| {
+                let path = dir.path().join(format!("{}.jpg", i));
+                fs::write(&path, jpeg_with_make(make)).unwrap();
+                path.to_string_lossy().into_owned()
+            })
+            .collect();
+        // The second file's prefetch of the missing one fails, and the third file
+        // has to be mapped without a prefetch
+        file_paths.insert(2, dir.path().join("missing.jpg").to_string_lossy().into_owned());
+
+        let mut reader = FastExifReader::new();
+        let results = reader.read_files(&file_paths);
+
+        assert_eq!(results.len(), file_paths.len());
+        assert!(results[2].is_err());
+        for (index, make) in [(0, makes[0]), (1, makes[1]), (3, makes[2])] {
+            let mut metadata = results[index].as_ref().unwrap().clone();
+            assert_eq!(metadata.get("Make").map(String::as_str), Some(make));
+
+            // Reading a file can move its access time, so the second read may
+            // see a different FileAccessDate
+            let mut reread = reader.read_file(&file_paths[index]).unwrap();
+            metadata.remove("FileAccessDate");
+            reread.remove("FileAccessDate");
+            assert_eq!(metadata, reread);
+        }
+    }
+}
@@ -104,13 +104,7 @@ impl HeifParser {
         }
 
         // Find TIFF header
-        let mut tiff_start = 0;
-        for i in 0..exif_data.len().saturating_sub(8) {
-            if &exif_data[i..i + 2] == b"II" || &exif_data[i..i + 2] == b"MM" {
-                tiff_start = i;
-                break;
-            }
-        }
+        let tiff_start = TiffParser::find_tiff_header(exif_data).unwrap_or(0);
 
         if tiff_start + 8 > exif_data.len() {
             return 0; // No valid TIFF header found
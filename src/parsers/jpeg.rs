@@ -7,6 +7,17 @@ use std::collections::HashMap;
 /// JPEG EXIF parser
 pub struct JpegParser;
 
+/// An APP1 segment carrying EXIF data
+#[derive(Debug, Clone, Copy)]
+pub struct ExifSegment<'a> {
+    /// Offset of the APP1 marker in the file
+    pub position: usize,
+    /// Segment length from the APP1 header
+    pub length: u16,
+    /// TIFF data following the "Exif" identifier
+    pub data: &'a [u8],
+}
+
 impl JpegParser {
     /// Parse EXIF data from JPEG format
     pub fn parse_jpeg_exif(
@@ -273,48 +284,56 @@ impl JpegParser {
 
     /// Find JPEG EXIF segment in data
     pub fn find_jpeg_exif_segment(data: &[u8]) -> Option<&[u8]> {
-        // Look for APP1 segment (0xFFE1) containing EXIF
+        // Use the largest EXIF segment (most complete metadata)
+        Self::exif_segments(data)
+            .reduce(|best, segment| {
+                if segment.data.len() > best.data.len() {
+                    segment
+                } else {
+                    best
+                }
+            })
+            .map(|segment| segment.data)
+    }
+
+    /// Walk the APP1 segments (0xFFE1) that carry an "Exif" identifier
+    pub fn exif_segments(data: &[u8]) -> impl Iterator<Item = ExifSegment<'_>> {
         let mut pos = 2;
-        let mut best_exif_segment: Option<&[u8]> = None;
-        let mut best_segment_size = 0;
+        std::iter::from_fn(move || {
+            while pos < data.len().saturating_sub(6) {
+                if data[pos] != 0xFF || data[pos + 1] != 0xE1 {
+                    // Skip straight to the next 0xFF marker byte
+                    pos = data[pos + 1..]
+                        .iter()
+                        .position(|&byte| byte == 0xFF)
+                        .map_or(data.len(), |offset| pos + 1 + offset);
+                    continue;
+                }
 
-        while pos < data.len().saturating_sub(6) {
-            if data[pos] == 0xFF && data[pos + 1] == 0xE1 {
                 // Read segment length (big-endian)
-                let length = ((data[pos + 2] as u16) << 8) | (data[pos + 3] as u16);
+                let position = pos;
+                let length = u16::from_be_bytes([data[pos + 2], data[pos + 3]]);
                 let segment_end = pos + 2 + length as usize;
-
                 if segment_end > data.len() {
-                    break;
+                    return None;
                 }
+                pos = segment_end;
 
                 // Look for "Exif" identifier anywhere in the segment
-                let segment_start = pos + 4;
-                for exif_start in segment_start..segment_end.saturating_sub(4) {
-                    if &data[exif_start..exif_start + 4] == b"Exif" {
-                        // Found EXIF identifier, check if this is the best segment
-                        let exif_data_start = exif_start + 4;
-                        if exif_data_start < segment_end {
-                            let exif_data = &data[exif_data_start..segment_end];
-                            let exif_size = exif_data.len();
-                            
-                            // Use the largest EXIF segment (most complete metadata)
-                            if exif_size > best_segment_size {
-                                best_exif_segment = Some(exif_data);
-                                best_segment_size = exif_size;
-                            }
-                        }
+                let segment = data.get(position + 4..segment_end).unwrap_or_default();
+                if let Some(exif_start) = segment.windows(4).position(|window| window == b"Exif") {
+                    let exif_data = &segment[exif_start + 4..];
+                    if !exif_data.is_empty() {
+                        return Some(ExifSegment {
+                            position,
+                            length,
+                            data: exif_data,
+                        });
                     }
                 }
-
-                // Move to next segment
-                pos = segment_end;
-            } else {
-                pos += 1;
             }
-        }
-
-        best_exif_segment
+            None
+        })
     }
 
     /// Extract camera-specific metadata based on detected make
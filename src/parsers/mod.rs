@@ -22,8 +22,9 @@ pub use optimal::{OptimalExifParser, OptimalBatchProcessor};
 // Re-export format-specific parsers
 pub use bmp::BmpParser;
 pub use heif::HeifParser;
-pub use jpeg::JpegParser;
+pub use jpeg::{ExifSegment, JpegParser};
 pub use mkv::MkvParser;
 pub use png::PngParser;
 pub use raw::RawParser;
+pub use tiff::TiffParser;
 pub use video::VideoParser;
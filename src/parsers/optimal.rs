@@ -3,6 +3,7 @@ use std::fs::File;
 use std::io::{Read, Seek, SeekFrom};
 use std::path::Path;
 use memmap2::{Mmap, MmapOptions};
+use rayon::prelude::*;
 use crate::types::ExifError;
 use crate::parsers::tiff::TiffParser;
 
@@ -50,12 +51,24 @@ struct OptimalParserStats {
     simd_count: usize,
     /// Total bytes read
     total_bytes_read: usize,
-    /// Total processing time (in microseconds)
-    total_processing_time: u64,
+    /// Total processing time (in nanoseconds)
+    total_processing_time_ns: u64,
     /// Cache hit rate
     cache_hit_rate: f64,
 }
 
+impl OptimalParserStats {
+    /// Add another parser's counters into this one
+    fn merge(&mut self, other: &OptimalParserStats) {
+        self.mmap_count += other.mmap_count;
+        self.seek_count += other.seek_count;
+        self.hybrid_count += other.hybrid_count;
+        self.simd_count += other.simd_count;
+        self.total_bytes_read += other.total_bytes_read;
+        self.total_processing_time_ns += other.total_processing_time_ns;
+    }
+}
+
 /// Information about an EXIF segment
 #[derive(Debug, Clone)]
 struct ExifSegmentInfo {
@@ -150,9 +163,9 @@ impl OptimalExifParser {
             ParseStrategy::Hybrid => self.parse_with_hybrid_approach(file, file_size),
         };
         
-        // Update statistics
-        let processing_time = start_time.elapsed().as_micros() as u64;
-        self.stats.total_processing_time += processing_time;
+        // Accumulate in nanoseconds so sub-microsecond reads are not truncated to zero
+        let processing_time = start_time.elapsed().as_nanos() as u64;
+        self.stats.total_processing_time_ns += processing_time;
         
         result
     }
@@ -179,7 +192,14 @@ impl OptimalExifParser {
         self.parse_exif_from_bytes(&mmap)?;
         
         self.stats.total_bytes_read += mmap.len();
-        Ok(self.metadata_cache.clone())
+        Ok(self.take_metadata())
+    }
+    
+    /// Hand the parsed fields to the caller instead of copying every key and value,
+    /// leaving an empty map of the same capacity for the next file
+    fn take_metadata(&mut self) -> HashMap<String, String> {
+        let capacity = self.metadata_cache.capacity();
+        std::mem::replace(&mut self.metadata_cache, HashMap::with_capacity(capacity))
     }
     
     /// Parse using seek optimization (best for large files)
@@ -189,13 +209,17 @@ impl OptimalExifParser {
         // Locate EXIF segment with minimal reading
         let exif_info = self.locate_exif_segment(&mut file, file_size)?;
         
-        // Read only the EXIF segment
-        let exif_data = self.read_exif_segment(&mut file, &exif_info)?;
+        // Read only the EXIF segment, into the buffer reused across files
+        self.read_exif_segment(&mut file, &exif_info)?;
         
-        // Parse EXIF data
-        self.parse_exif_data_optimized(&exif_data)?;
+        // Parse straight out of the buffer rather than a copy of it; it is moved
+        // out while the parser fills the metadata cache, then put back
+        let exif_data = std::mem::take(&mut self.read_buffer);
+        let result = self.parse_exif_data_optimized(&exif_data);
+        self.read_buffer = exif_data;
+        result?;
         
-        Ok(self.metadata_cache.clone())
+        Ok(self.take_metadata())
     }
     
     /// Parse using hybrid approach (best for medium files)
@@ -213,7 +237,7 @@ impl OptimalExifParser {
         
         // Try to find EXIF in the mapped region
         if let Ok(exif_data) = self.extract_exif_from_mapped(&mmap) {
-            self.parse_exif_data_optimized(&exif_data)?;
+            self.parse_exif_data_optimized(exif_data)?;
         } else {
             // EXIF not in mapped region, fall back to seeking
             drop(mmap);
@@ -221,7 +245,7 @@ impl OptimalExifParser {
         }
         
         self.stats.total_bytes_read += map_size;
-        Ok(self.metadata_cache.clone())
+        Ok(self.take_metadata())
     }
     
     /// Locate EXIF segment with minimal reading
@@ -300,8 +324,8 @@ impl OptimalExifParser {
         })
     }
     
-    /// Read EXIF segment from file
-    fn read_exif_segment(&mut self, file: &mut File, exif_info: &ExifSegmentInfo) -> Result<Vec<u8>, ExifError> {
+    /// Read EXIF segment from file into the read buffer
+    fn read_exif_segment(&mut self, file: &mut File, exif_info: &ExifSegmentInfo) -> Result<(), ExifError> {
         file.seek(SeekFrom::Start(exif_info.offset as u64))?;
         
         let size_to_read = exif_info.size.min(self.max_exif_size);
@@ -314,11 +338,11 @@ impl OptimalExifParser {
         file.read_exact(&mut self.read_buffer)?;
         
         self.stats.total_bytes_read += size_to_read;
-        Ok(self.read_buffer.clone())
+        Ok(())
     }
     
-    /// Extract EXIF data from memory mapped region
-    fn extract_exif_from_mapped(&self, data: &[u8]) -> Result<Vec<u8>, ExifError> {
+    /// Find the EXIF data in a memory mapped region, borrowed from the mapping
+    fn extract_exif_from_mapped<'a>(&self, data: &'a [u8]) -> Result<&'a [u8], ExifError> {
         // Quick scan for EXIF marker in mapped region
         for i in 0..data.len().saturating_sub(10) {
             if data[i] == 0xFF && data[i + 1] == 0xE1 {
@@ -328,7 +352,7 @@ impl OptimalExifParser {
                     if i + 4 + length <= data.len() {
                         let exif_segment = &data[i + 4..i + 4 + length];
                         if exif_segment.len() >= 6 && &exif_segment[0..6] == b"Exif\0\0" {
-                            return Ok(exif_segment[6..].to_vec());
+                            return Ok(&exif_segment[6..]);
                         }
                     }
                 }
@@ -473,7 +497,7 @@ impl OptimalExifParser {
         stats.insert("hybrid_count".to_string(), self.stats.hybrid_count.to_string());
         stats.insert("simd_count".to_string(), self.stats.simd_count.to_string());
         stats.insert("total_bytes_read".to_string(), self.stats.total_bytes_read.to_string());
-        stats.insert("total_processing_time".to_string(), self.stats.total_processing_time.to_string());
+        stats.insert("total_processing_time".to_string(), (self.stats.total_processing_time_ns / 1_000).to_string());
         stats.insert("cache_hit_rate".to_string(), self.stats.cache_hit_rate.to_string());
         stats.insert("parser_type".to_string(), "OptimalExif".to_string());
         #[cfg(target_arch = "x86_64")]
@@ -491,11 +515,10 @@ impl OptimalExifParser {
     /// Check if AVX2 is supported on x86_64
     #[cfg(target_arch = "x86_64")]
     fn check_avx2_support() -> bool {
-        unsafe {
-            // Check if CPU supports AVX2
-            let cpuid = std::arch::x86_64::__cpuid(7);
-            (cpuid.ebx & (1 << 5)) != 0 // AVX2 bit
-        }
+        // std runs cpuid once per process and caches the answer, where a raw
+        // cpuid (slow, and trapped by some hypervisors) ran for every new parser;
+        // it also checks that the OS saves the AVX registers
+        std::arch::is_x86_feature_detected!("avx2")
     }
     
     /// SIMD-accelerated EXIF parsing using AVX2
@@ -639,18 +662,35 @@ impl OptimalBatchProcessor {
     
     /// Process multiple files with optimal strategy
     pub fn process_files(&mut self, file_paths: &[String]) -> Result<Vec<HashMap<String, String>>, ExifError> {
-        let mut results = Vec::new();
-        
-        for chunk in file_paths.chunks(self.batch_size) {
-            for file_path in chunk {
-                match self.parser.parse_file(file_path) {
-                    Ok(metadata) => results.push(metadata),
-                    Err(e) => {
-                        eprintln!("Error processing {}: {}", file_path, e);
-                        results.push(HashMap::new());
+        // Batches run on the rayon thread pool. map_init copies the configured
+        // parser once per job rayon splits the batches into, not once per thread,
+        // and reuses that copy for every batch in the job; the statistics of each
+        // batch are handed back to be folded in afterwards
+        let batches: Vec<(Vec<HashMap<String, String>>, OptimalParserStats)> = file_paths
+            .par_chunks(self.batch_size)
+            .map_init(|| {
+                let mut parser = self.parser.clone();
+                parser.reset_stats();
+                parser
+            }, |parser, chunk| {
+                let mut batch_results = Vec::with_capacity(chunk.len());
+                for file_path in chunk {
+                    match parser.parse_file(file_path) {
+                        Ok(metadata) => batch_results.push(metadata),
+                        Err(e) => {
+                            eprintln!("Error processing {}: {}", file_path, e);
+                            batch_results.push(HashMap::new());
+                        }
                     }
                 }
-            }
+                (batch_results, std::mem::take(&mut parser.stats))
+            })
+            .collect();
+        
+        let mut results = Vec::with_capacity(file_paths.len());
+        for (batch_results, batch_stats) in batches {
+            results.extend(batch_results);
+            self.parser.stats.merge(&batch_stats);
         }
         
         Ok(results)
@@ -1,5 +1,6 @@
 use crate::parsers::maker_notes::MakerNoteParser;
 use crate::types::ExifError;
+use std::borrow::Cow;
 use std::collections::HashMap;
 
 /// TIFF-based EXIF parser
@@ -16,13 +17,7 @@ impl TiffParser {
         }
 
         // Find the actual TIFF header (skip any padding/null bytes)
-        let mut tiff_start = 0;
-        for i in 0..data.len().saturating_sub(8) {
-            if &data[i..i + 2] == b"II" || &data[i..i + 2] == b"MM" {
-                tiff_start = i;
-                break;
-            }
-        }
+        let tiff_start = Self::find_tiff_header(data).unwrap_or(0);
 
         if tiff_start + 8 > data.len() {
             return Err(ExifError::InvalidExif("TIFF header not found".to_string()));
@@ -87,14 +82,16 @@ impl TiffParser {
             metadata,
         )?;
 
-        // Parse EXIF IFD if present (contains DateTimeOriginal, ExposureTime, etc.)
-        if let Some(exif_ifd_offset) = Self::find_sub_ifd_offset(
+        // Locate the EXIF, GPS and Interoperability sub-IFDs in one pass over IFD0
+        let [exif_ifd_offset, gps_ifd_offset, interop_ifd_offset] = Self::find_sub_ifd_offsets(
             data,
             tiff_start + ifd_offset as usize,
-            0x8769,
+            [0x8769, 0x8825, 0xA005],
             is_little_endian,
-            tiff_start,
-        ) {
+        );
+
+        // Parse EXIF IFD if present (contains DateTimeOriginal, ExposureTime, etc.)
+        if let Some(exif_ifd_offset) = exif_ifd_offset {
             Self::parse_ifd(
                 data,
                 tiff_start + exif_ifd_offset as usize,
@@ -105,13 +102,7 @@ impl TiffParser {
         }
 
         // Parse GPS IFD if present (contains GPS metadata)
-        if let Some(gps_ifd_offset) = Self::find_sub_ifd_offset(
-            data,
-            tiff_start + ifd_offset as usize,
-            0x8825,
-            is_little_endian,
-            tiff_start,
-        ) {
+        if let Some(gps_ifd_offset) = gps_ifd_offset {
             Self::parse_ifd(
                 data,
                 tiff_start + gps_ifd_offset as usize,
@@ -122,13 +113,7 @@ impl TiffParser {
         }
 
         // Parse Interoperability IFD if present (contains InteropIndex, InteropVersion, etc.)
-        if let Some(interop_ifd_offset) = Self::find_sub_ifd_offset(
-            data,
-            tiff_start + ifd_offset as usize,
-            0xA005,
-            is_little_endian,
-            tiff_start,
-        ) {
+        if let Some(interop_ifd_offset) = interop_ifd_offset {
             Self::parse_ifd(
                 data,
                 tiff_start + interop_ifd_offset as usize,
@@ -144,6 +129,37 @@ impl TiffParser {
         Ok(())
     }
 
+    /// Decode an ASCII payload, trimming NUL padding and dropping control characters
+    fn clean_ascii(bytes: &[u8]) -> Option<String> {
+        let string = std::str::from_utf8(bytes).ok()?;
+        Some(
+            string
+                .trim_end_matches('\0')
+                .trim()
+                .chars()
+                .filter(|c| !c.is_control() || *c == '\t' || *c == '\n' || *c == '\r')
+                .collect(),
+        )
+    }
+
+    /// Read a RATIONAL (numerator, denominator) pair; the caller checks that 8 bytes remain
+    fn read_rational(data: &[u8], offset: usize, is_little_endian: bool) -> (u32, u32) {
+        let read = if is_little_endian {
+            u32::from_le_bytes
+        } else {
+            u32::from_be_bytes
+        };
+        let word = |at: usize| read([data[at], data[at + 1], data[at + 2], data[at + 3]]);
+        (word(offset), word(offset + 4))
+    }
+
+    /// Find the first "II"/"MM" byte order mark that leaves room for a TIFF header
+    pub(crate) fn find_tiff_header(data: &[u8]) -> Option<usize> {
+        data.windows(2)
+            .take(data.len().saturating_sub(8))
+            .position(|pair| matches!(pair, [b'I', b'I'] | [b'M', b'M']))
+    }
+
     /// Parse Image File Directory (IFD)
     fn parse_ifd(
         data: &[u8],
@@ -169,20 +185,28 @@ impl TiffParser {
             ));
         }
 
-        // Parse each directory entry
-        for i in 0..entry_count {
-            let entry_offset = offset + 2 + (i as usize * 12);
-            if entry_offset + 12 > data.len() {
-                continue;
+        // Parse each directory entry, slicing the entry table once and noting
+        // the maker note and GPS pointers on the way instead of rescanning
+        let table_start = offset + 2;
+        let table_end = (table_start + entry_count as usize * 12).min(data.len());
+        let mut maker_note_offset = None;
+        let mut gps_offset = None;
+        for entry in data[table_start..table_end].chunks_exact(12) {
+            let (tag_id, value_offset) =
+                Self::parse_ifd_entry(data, entry, is_little_endian, tiff_start, metadata)?;
+            match tag_id {
+                0x927C => {
+                    maker_note_offset.get_or_insert(value_offset);
+                }
+                0x8825 => {
+                    gps_offset.get_or_insert(value_offset);
+                }
+                _ => {}
             }
-
-            Self::parse_ifd_entry(data, entry_offset, is_little_endian, tiff_start, metadata)?;
         }
 
         // Parse maker notes if present
-        if let Some(maker_note_offset) =
-            Self::find_sub_ifd_offset(data, offset, 0x927C, is_little_endian, tiff_start)
-        {
+        if let Some(maker_note_offset) = maker_note_offset {
             MakerNoteParser::parse_maker_note(
                 data,
                 tiff_start + maker_note_offset as usize,
@@ -192,9 +216,7 @@ impl TiffParser {
         }
 
         // Parse GPS IFD if present
-        if let Some(gps_offset) =
-            Self::find_sub_ifd_offset(data, offset, 0x8825, is_little_endian, tiff_start)
-        {
+        if let Some(gps_offset) = gps_offset {
             Self::parse_gps_ifd(
                 data,
                 tiff_start + gps_offset as usize,
@@ -207,60 +229,28 @@ impl TiffParser {
         Ok(())
     }
 
-    /// Parse a single IFD entry
+    /// Parse a single 12-byte IFD entry, returning its tag ID and raw value/offset
     fn parse_ifd_entry(
         data: &[u8],
-        offset: usize,
+        entry: &[u8],
         is_little_endian: bool,
         tiff_start: usize,
         metadata: &mut HashMap<String, String>,
-    ) -> Result<(), ExifError> {
-        // Read tag ID
-        let tag_id = if is_little_endian {
-            u16::from_le_bytes([data[offset], data[offset + 1]])
-        } else {
-            u16::from_be_bytes([data[offset], data[offset + 1]])
-        };
-
-        // Read data type
-        let data_type = if is_little_endian {
-            u16::from_le_bytes([data[offset + 2], data[offset + 3]])
-        } else {
-            u16::from_be_bytes([data[offset + 2], data[offset + 3]])
-        };
-
-        // Read count
-        let count = if is_little_endian {
-            u32::from_le_bytes([
-                data[offset + 4],
-                data[offset + 5],
-                data[offset + 6],
-                data[offset + 7],
-            ])
-        } else {
-            u32::from_be_bytes([
-                data[offset + 4],
-                data[offset + 5],
-                data[offset + 6],
-                data[offset + 7],
-            ])
-        };
-
-        // Read value/offset
-        let value_offset = if is_little_endian {
-            u32::from_le_bytes([
-                data[offset + 8],
-                data[offset + 9],
-                data[offset + 10],
-                data[offset + 11],
-            ])
+    ) -> Result<(u16, u32), ExifError> {
+        let (tag_id, data_type, count, value_offset) = if is_little_endian {
+            (
+                u16::from_le_bytes([entry[0], entry[1]]),
+                u16::from_le_bytes([entry[2], entry[3]]),
+                u32::from_le_bytes([entry[4], entry[5], entry[6], entry[7]]),
+                u32::from_le_bytes([entry[8], entry[9], entry[10], entry[11]]),
+            )
         } else {
-            u32::from_be_bytes([
-                data[offset + 8],
-                data[offset + 9],
-                data[offset + 10],
-                data[offset + 11],
-            ])
+            (
+                u16::from_be_bytes([entry[0], entry[1]]),
+                u16::from_be_bytes([entry[2], entry[3]]),
+                u32::from_be_bytes([entry[4], entry[5], entry[6], entry[7]]),
+                u32::from_be_bytes([entry[8], entry[9], entry[10], entry[11]]),
+            )
         };
 
         // Parse the tag value
@@ -270,12 +260,13 @@ impl TiffParser {
             data_type,
             count,
             value_offset,
+            &entry[8..12],
             is_little_endian,
             tiff_start,
             metadata,
         )?;
 
-        Ok(())
+        Ok((tag_id, value_offset))
     }
 
     /// Parse tag value based on type and count
@@ -286,10 +277,17 @@ impl TiffParser {
         data_type: u16,
         count: u32,
         value_offset: u32,
+        value_bytes: &[u8],
         is_little_endian: bool,
         tiff_start: usize,
         metadata: &mut HashMap<String, String>,
     ) -> Result<(), ExifError> {
+        // SHORT, LONG and RATIONAL values are only decoded for single-valued
+        // tags, so skip multi-valued entries before resolving the tag name
+        if matches!(data_type, 3..=5) && count != 1 {
+            return Ok(());
+        }
+
         let tag_name = Self::get_tag_name(tag_id);
 
         match data_type {
@@ -302,23 +300,14 @@ impl TiffParser {
                     } else {
                         (value_offset >> 24) as u8
                     };
-                    metadata.insert(tag_name, value.to_string());
+                    metadata.insert(tag_name.into_owned(), value.to_string());
                 } else {
                     // Value is at offset
                     let offset = tiff_start + value_offset as usize;
                     if offset + count as usize <= data.len() {
                         let bytes = &data[offset..offset + count as usize];
-                        if let Ok(string) = String::from_utf8(bytes.to_vec()) {
-                            // Clean the string by removing null bytes and control characters
-                            let cleaned_string = string
-                                .trim_end_matches('\0')
-                                .trim()
-                                .chars()
-                                .filter(|c| {
-                                    !c.is_control() || *c == '\t' || *c == '\n' || *c == '\r'
-                                })
-                                .collect::<String>();
-                            metadata.insert(tag_name, cleaned_string);
+                        if let Some(cleaned_string) = Self::clean_ascii(bytes) {
+                            metadata.insert(tag_name.into_owned(), cleaned_string);
                         }
                     }
                 }
@@ -332,25 +321,12 @@ impl TiffParser {
                         // Convert the 32-bit value to ASCII characters
                         let version_string =
                             Self::format_version_field(value_offset, is_little_endian);
-                        metadata.insert(tag_name, version_string);
+                        metadata.insert(tag_name.into_owned(), version_string);
                     } else {
-                        // Value is inline - respect endianness
-                        let bytes = if is_little_endian {
-                            value_offset.to_le_bytes()
-                        } else {
-                            value_offset.to_be_bytes()
-                        };
-                        if let Ok(string) = String::from_utf8(bytes.to_vec()) {
-                            // Clean the string by removing null bytes and control characters
-                            let cleaned_string = string
-                                .trim_end_matches('\0')
-                                .trim()
-                                .chars()
-                                .filter(|c| {
-                                    !c.is_control() || *c == '\t' || *c == '\n' || *c == '\r'
-                                })
-                                .collect::<String>();
-                            metadata.insert(tag_name, cleaned_string);
+                        // Value is inline - decode the entry's own bytes in file order
+                        let bytes = &value_bytes[..count as usize];
+                        if let Some(cleaned_string) = Self::clean_ascii(bytes) {
+                            metadata.insert(tag_name.into_owned(), cleaned_string);
                         }
                     }
                 } else {
@@ -358,17 +334,8 @@ impl TiffParser {
                     let offset = tiff_start + value_offset as usize;
                     if offset + count as usize <= data.len() {
                         let bytes = &data[offset..offset + count as usize];
-                        if let Ok(string) = String::from_utf8(bytes.to_vec()) {
-                            // Clean the string by removing null bytes and control characters
-                            let cleaned_string = string
-                                .trim_end_matches('\0')
-                                .trim()
-                                .chars()
-                                .filter(|c| {
-                                    !c.is_control() || *c == '\t' || *c == '\n' || *c == '\r'
-                                })
-                                .collect::<String>();
-                            metadata.insert(tag_name, cleaned_string);
+                        if let Some(cleaned_string) = Self::clean_ascii(bytes) {
+                            metadata.insert(tag_name.into_owned(), cleaned_string);
                         }
                     }
                 }
@@ -382,38 +349,23 @@ impl TiffParser {
                         (value_offset >> 16) as u16
                     };
 
-                    // Special handling for ExposureCompensation as SHORT
-                    if tag_id == 0x9204 {
-                        // ExposureCompensation
-                        // Convert SHORT value to EV using APEX conversion
-                        // The value is stored as a signed 16-bit integer in 1/1000 EV units
-                        // So 0 = 0 EV, 1000 = +1 EV, -1000 = -1 EV
-                        let ev_value = value as i16 as f64 / 1000.0;
-                        let formatted_value = Self::print_fraction(ev_value);
-                        metadata.insert(tag_name, formatted_value);
-                    } else if tag_id == 0x9203 {
-                        // BrightnessValue as SHORT
-                        // Check if this is a raw value that needs special conversion
-                        let formatted = Self::convert_brightness_value(value as u32);
-                        metadata.insert(tag_name, formatted);
-                    } else if tag_id == 0x9201 {
-                        // ShutterSpeedValue as SHORT
-                        // Check if this is a raw Canon-style value that needs special conversion
-                        let formatted = Self::convert_shutter_speed_value(value as u32);
-                        metadata.insert(tag_name, formatted);
-                    } else if tag_id == 0x0112 {
-                        // Orientation as SHORT
-                        let formatted_value = Self::format_special_field(tag_id, value);
-                        metadata.insert(tag_name, formatted_value);
-                    } else if tag_id == 0xA403 {
-                        // WhiteBalance as SHORT
-                        let formatted_value = Self::format_special_field(tag_id, value);
-                        metadata.insert(tag_name, formatted_value);
-                    } else {
-                        // Format special fields
-                        let formatted_value = Self::format_special_field(tag_id, value);
-                        metadata.insert(tag_name, formatted_value);
-                    }
+                    let formatted_value = match tag_id {
+                        0x9204 => {
+                            // ExposureCompensation
+                            // Convert SHORT value to EV using APEX conversion
+                            // The value is stored as a signed 16-bit integer in 1/1000 EV units
+                            // So 0 = 0 EV, 1000 = +1 EV, -1000 = -1 EV
+                            let ev_value = value as i16 as f64 / 1000.0;
+                            Self::print_fraction(ev_value)
+                        }
+                        // BrightnessValue as SHORT, possibly a raw value needing conversion
+                        0x9203 => Self::convert_brightness_value(value as u32),
+                        // ShutterSpeedValue as SHORT, possibly a raw Canon-style value
+                        0x9201 => Self::convert_shutter_speed_value(value as u32),
+                        // Orientation, WhiteBalance and other enumerated fields
+                        _ => Self::format_special_field(tag_id, value),
+                    };
+                    metadata.insert(tag_name.into_owned(), formatted_value);
                 }
             }
             4 => {
@@ -425,19 +377,19 @@ impl TiffParser {
                         // Convert 4-byte version field to ASCII string
                         let version_string =
                             Self::format_version_field(value_offset, is_little_endian);
-                        metadata.insert(tag_name, version_string);
+                        metadata.insert(tag_name.into_owned(), version_string);
                     } else if tag_id == 0xA402 {
                         // ExposureMode as LONG
                         let formatted_value =
                             Self::format_special_field(tag_id, value_offset as u16);
-                        metadata.insert(tag_name, formatted_value);
+                        metadata.insert(tag_name.into_owned(), formatted_value);
                     } else if tag_id == 0x9201 {
                         // ShutterSpeedValue as LONG
                         // Check if this is a raw Canon-style value that needs special conversion
                         let formatted = Self::convert_shutter_speed_value(value_offset as u32);
-                        metadata.insert(tag_name, formatted);
+                        metadata.insert(tag_name.into_owned(), formatted);
                     } else {
-                        metadata.insert(tag_name, value_offset.to_string());
+                        metadata.insert(tag_name.into_owned(), value_offset.to_string());
                     }
                 }
             }
@@ -447,41 +399,20 @@ impl TiffParser {
                     // For rational values, we need to read the actual value from the offset
                     let offset = tiff_start + value_offset as usize;
                     if offset + 8 <= data.len() {
-                        let numerator = if is_little_endian {
-                            (data[offset] as u32)
-                                | ((data[offset + 1] as u32) << 8)
-                                | ((data[offset + 2] as u32) << 16)
-                                | ((data[offset + 3] as u32) << 24)
-                        } else {
-                            ((data[offset] as u32) << 24)
-                                | ((data[offset + 1] as u32) << 16)
-                                | ((data[offset + 2] as u32) << 8)
-                                | (data[offset + 3] as u32)
-                        };
-
-                        let denominator = if is_little_endian {
-                            (data[offset + 4] as u32)
-                                | ((data[offset + 5] as u32) << 8)
-                                | ((data[offset + 6] as u32) << 16)
-                                | ((data[offset + 7] as u32) << 24)
-                        } else {
-                            ((data[offset + 4] as u32) << 24)
-                                | ((data[offset + 5] as u32) << 16)
-                                | ((data[offset + 6] as u32) << 8)
-                                | (data[offset + 7] as u32)
-                        };
+                        let (numerator, denominator) =
+                            Self::read_rational(data, offset, is_little_endian);
 
                         // Format rational values based on field type
                         if tag_id == 0x011A || tag_id == 0x011B {
                             // XResolution or YResolution
-                            metadata.insert(tag_name, numerator.to_string());
+                            metadata.insert(tag_name.into_owned(), numerator.to_string());
                         } else if tag_id == 0xA20C || tag_id == 0xA20F {
                             // FocalPlaneXResolution or FocalPlaneYResolution
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
-                                metadata.insert(tag_name, format!("{:.5}", value));
+                                metadata.insert(tag_name.into_owned(), format!("{:.5}", value));
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0xA20E {
                             // FocalPlaneResolutionUnit
@@ -513,25 +444,25 @@ impl TiffParser {
                                     _ => numerator.to_string(),
                                 }
                             };
-                            metadata.insert(tag_name, unit_string);
+                            metadata.insert(tag_name.into_owned(), unit_string);
                         } else if tag_id == 0x829A {
                             // ExposureTime
                             // Format exposure time to match exiftool's algorithm
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
                                 let formatted = Self::format_exposure_time(value);
-                                metadata.insert(tag_name, formatted);
+                                metadata.insert(tag_name.into_owned(), formatted);
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0x829D {
                             // FNumber
                             // Format f-number (e.g., "4.0")
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
-                                metadata.insert(tag_name, format!("{:.1}", value));
+                                metadata.insert(tag_name.into_owned(), format!("{:.1}", value));
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0x9201 {
                             // ShutterSpeedValue
@@ -539,9 +470,9 @@ impl TiffParser {
                             if denominator != 0 {
                                 let shutter_speed = numerator as f64 / denominator as f64;
                                 let formatted = Self::format_exposure_time(shutter_speed);
-                                metadata.insert(tag_name, formatted);
+                                metadata.insert(tag_name.into_owned(), formatted);
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0x9202 {
                             // ApertureValue
@@ -549,9 +480,9 @@ impl TiffParser {
                             if denominator != 0 {
                                 let apex_value = numerator as f64 / denominator as f64;
                                 let f_number = 2.0_f64.powf(apex_value / 2.0);
-                                metadata.insert(tag_name, format!("{:.1}", f_number));
+                                metadata.insert(tag_name.into_owned(), format!("{:.1}", f_number));
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0x9203 {
                             // BrightnessValue
@@ -560,10 +491,10 @@ impl TiffParser {
                                 let apex_value = numerator as f64 / denominator as f64;
                                 // Convert APEX to EV: EV = APEX - 5
                                 let ev_value = apex_value - 5.0;
-                                metadata.insert(tag_name, format!("{:.2}", ev_value));
+                                metadata.insert(tag_name.into_owned(), format!("{:.2}", ev_value));
                             } else {
                                 // If it's a raw value, assume it's already in EV format
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0x9204 {
                             // ExposureCompensation
@@ -571,9 +502,9 @@ impl TiffParser {
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
                                 let formatted_value = Self::print_fraction(value);
-                                metadata.insert(tag_name, formatted_value);
+                                metadata.insert(tag_name.into_owned(), formatted_value);
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0x9205 {
                             // MaxApertureValue
@@ -581,9 +512,9 @@ impl TiffParser {
                             if denominator != 0 {
                                 let apex_value = numerator as f64 / denominator as f64;
                                 let f_number = 2.0_f64.powf(apex_value / 2.0);
-                                metadata.insert(tag_name, format!("{:.1}", f_number));
+                                metadata.insert(tag_name.into_owned(), format!("{:.1}", f_number));
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0x9206 {
                             // SubjectDistance
@@ -591,30 +522,34 @@ impl TiffParser {
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
                                 if value >= 1000.0 {
-                                    metadata.insert(tag_name, format!("{:.0} m", value / 1000.0));
+                                    metadata.insert(
+                                        tag_name.into_owned(),
+                                        format!("{:.0} m", value / 1000.0),
+                                    );
                                 } else {
-                                    metadata.insert(tag_name, format!("{:.2} m", value));
+                                    metadata
+                                        .insert(tag_name.into_owned(), format!("{:.2} m", value));
                                 }
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else if tag_id == 0x920A {
                             // FocalLength
                             // Format focal length
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
-                                metadata.insert(tag_name, format!("{:.1} mm", value));
+                                metadata.insert(tag_name.into_owned(), format!("{:.1} mm", value));
                             } else {
-                                metadata.insert(tag_name, format!("{} mm", numerator));
+                                metadata.insert(tag_name.into_owned(), format!("{} mm", numerator));
                             }
                         } else if tag_id == 0xA405 {
                             // FocalLengthIn35mmFilm
                             // Format focal length in 35mm film
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
-                                metadata.insert(tag_name, format!("{:.0} mm", value));
+                                metadata.insert(tag_name.into_owned(), format!("{:.0} mm", value));
                             } else {
-                                metadata.insert(tag_name, format!("{} mm", numerator));
+                                metadata.insert(tag_name.into_owned(), format!("{} mm", numerator));
                             }
                         } else if tag_id == 0xA404 {
                             // DigitalZoomRatio
@@ -622,20 +557,20 @@ impl TiffParser {
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
                                 if value == 1.0 {
-                                    metadata.insert(tag_name, "1".to_string());
+                                    metadata.insert(tag_name.into_owned(), "1".to_string());
                                 } else {
-                                    metadata.insert(tag_name, format!("{:.6}", value));
+                                    metadata.insert(tag_name.into_owned(), format!("{:.6}", value));
                                 }
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         } else {
                             // For other rational fields, format as decimal
                             if denominator != 0 {
                                 let value = numerator as f64 / denominator as f64;
-                                metadata.insert(tag_name, format!("{:.6}", value));
+                                metadata.insert(tag_name.into_owned(), format!("{:.6}", value));
                             } else {
-                                metadata.insert(tag_name, numerator.to_string());
+                                metadata.insert(tag_name.into_owned(), numerator.to_string());
                             }
                         }
                     }
@@ -648,14 +583,14 @@ impl TiffParser {
                     // Version fields are stored as 4-byte ASCII strings
                     // Convert the 32-bit value to ASCII characters
                     let version_string = Self::format_version_field(value_offset, is_little_endian);
-                    metadata.insert(tag_name, version_string);
+                    metadata.insert(tag_name.into_owned(), version_string);
                 } else if tag_id == 0xA402 {
                     // ExposureMode as other types
                     let formatted_value = Self::format_special_field(tag_id, value_offset as u16);
-                    metadata.insert(tag_name, formatted_value);
+                    metadata.insert(tag_name.into_owned(), formatted_value);
                 } else {
                     // For other types, just store the raw value
-                    metadata.insert(tag_name, value_offset.to_string());
+                    metadata.insert(tag_name.into_owned(), value_offset.to_string());
                 }
             }
         }
@@ -1002,97 +937,97 @@ impl TiffParser {
     }
 
     /// Get human-readable tag name
-    fn get_tag_name(tag_id: u16) -> String {
-        match tag_id {
-            0x010E => "ImageDescription".to_string(),
-            0x010F => "Make".to_string(),
-            0x0110 => "Model".to_string(),
-            0x0112 => "Orientation".to_string(),
-            0x011A => "XResolution".to_string(),
-            0x011B => "YResolution".to_string(),
-            0x0128 => "ResolutionUnit".to_string(),
-            0x0131 => "Software".to_string(),
-            0x0132 => "DateTime".to_string(),
-            0x013B => "Artist".to_string(),
-            0x9003 => "DateTimeOriginal".to_string(),
-            0x9004 => "DateTimeDigitized".to_string(),
-            0x829A => "ExposureTime".to_string(),
-            0x829D => "FNumber".to_string(),
-            0x8822 => "ExposureProgram".to_string(),
-            0x8827 => "ISO".to_string(),
-            0x9201 => "ShutterSpeedValue".to_string(),
-            0x9202 => "ApertureValue".to_string(),
-            0x9203 => "BrightnessValue".to_string(),
-            0x9204 => "ExposureCompensation".to_string(),
-            0x9205 => "MaxApertureValue".to_string(),
-            0x9206 => "SubjectDistance".to_string(),
-            0x9207 => "MeteringMode".to_string(),
-            0x9208 => "LightSource".to_string(),
-            0x9209 => "Flash".to_string(),
-            0x920A => "FocalLength".to_string(),
-            0x9290 => "SubSecTime".to_string(),
-            0x9291 => "SubSecTimeOriginal".to_string(),
-            0x9292 => "SubSecTimeDigitized".to_string(),
-            0x9010 => "OffsetTime".to_string(),
-            0x9011 => "OffsetTimeOriginal".to_string(),
-            0x9012 => "OffsetTimeDigitized".to_string(),
-            0x013E => "WhitePoint".to_string(),
-            0x013F => "PrimaryChromaticities".to_string(),
-            0x0211 => "YCbCrCoefficients".to_string(),
-            0x0213 => "YCbCrPositioning".to_string(),
-            0x0214 => "ReferenceBlackWhite".to_string(),
-            0x8298 => "Copyright".to_string(),
-            0x8769 => "".to_string(), // ExifIFD - internal reference, not a metadata field
-            0x8825 => "".to_string(), // GPSInfo - internal reference, not a metadata field
-            0xA000 => "FlashpixVersion".to_string(),
-            0xA001 => "ColorSpace".to_string(),
-            0xA002 => "PixelXDimension".to_string(),
-            0xA003 => "PixelYDimension".to_string(),
-            0xA004 => "RelatedSoundFile".to_string(),
-            0xA005 => "".to_string(), // InteroperabilityIFD - internal reference, not a metadata field
-            0x9000 => "ExifVersion".to_string(),
-            0xA20C => "FocalPlaneXResolution".to_string(),
-            0xA20E => "FocalPlaneResolutionUnit".to_string(),
-            0xA20F => "FocalPlaneYResolution".to_string(),
-            0xA210 => "CompressedBitsPerPixel".to_string(),
-            0xA217 => "SensingMethod".to_string(),
-            0xA300 => "FileSource".to_string(),
-            0xA301 => "SceneType".to_string(),
-            0xA302 => "CFAPattern".to_string(),
-            0xA401 => "CustomRendered".to_string(),
-            0xA402 => "ExposureMode".to_string(),
-            0xA403 => "WhiteBalance".to_string(),
-            0xA404 => "DigitalZoomRatio".to_string(),
-            0xA405 => "FocalLengthIn35mmFilm".to_string(),
-            0xA406 => "SceneCaptureType".to_string(),
-            0xA407 => "GainControl".to_string(),
-            0xA408 => "Contrast".to_string(),
-            0xA409 => "Saturation".to_string(),
-            0xA40A => "Sharpness".to_string(),
-            0xA40B => "DeviceSettingDescription".to_string(),
-            0xA40C => "SubjectDistanceRange".to_string(),
-            0xA420 => "ImageUniqueID".to_string(),
-            0xA430 => "CameraOwnerName".to_string(),
-            0xA431 => "BodySerialNumber".to_string(),
-            0xA432 => "LensSpecification".to_string(),
-            0xA433 => "LensMake".to_string(),
-            0xA434 => "LensModel".to_string(),
-            0xA435 => "LensSerialNumber".to_string(),
-            0x927C => "MakerNote".to_string(),
-            _ => format!("UnknownTag_{:04X}", tag_id),
-        }
+    fn get_tag_name(tag_id: u16) -> Cow<'static, str> {
+        Cow::Borrowed(match tag_id {
+            0x010E => "ImageDescription",
+            0x010F => "Make",
+            0x0110 => "Model",
+            0x0112 => "Orientation",
+            0x011A => "XResolution",
+            0x011B => "YResolution",
+            0x0128 => "ResolutionUnit",
+            0x0131 => "Software",
+            0x0132 => "DateTime",
+            0x013B => "Artist",
+            0x9003 => "DateTimeOriginal",
+            0x9004 => "DateTimeDigitized",
+            0x829A => "ExposureTime",
+            0x829D => "FNumber",
+            0x8822 => "ExposureProgram",
+            0x8827 => "ISO",
+            0x9201 => "ShutterSpeedValue",
+            0x9202 => "ApertureValue",
+            0x9203 => "BrightnessValue",
+            0x9204 => "ExposureCompensation",
+            0x9205 => "MaxApertureValue",
+            0x9206 => "SubjectDistance",
+            0x9207 => "MeteringMode",
+            0x9208 => "LightSource",
+            0x9209 => "Flash",
+            0x920A => "FocalLength",
+            0x9290 => "SubSecTime",
+            0x9291 => "SubSecTimeOriginal",
+            0x9292 => "SubSecTimeDigitized",
+            0x9010 => "OffsetTime",
+            0x9011 => "OffsetTimeOriginal",
+            0x9012 => "OffsetTimeDigitized",
+            0x013E => "WhitePoint",
+            0x013F => "PrimaryChromaticities",
+            0x0211 => "YCbCrCoefficients",
+            0x0213 => "YCbCrPositioning",
+            0x0214 => "ReferenceBlackWhite",
+            0x8298 => "Copyright",
+            0x8769 => "", // ExifIFD - internal reference, not a metadata field
+            0x8825 => "", // GPSInfo - internal reference, not a metadata field
+            0xA000 => "FlashpixVersion",
+            0xA001 => "ColorSpace",
+            0xA002 => "PixelXDimension",
+            0xA003 => "PixelYDimension",
+            0xA004 => "RelatedSoundFile",
+            0xA005 => "", // InteroperabilityIFD - internal reference, not a metadata field
+            0x9000 => "ExifVersion",
+            0xA20C => "FocalPlaneXResolution",
+            0xA20E => "FocalPlaneResolutionUnit",
+            0xA20F => "FocalPlaneYResolution",
+            0xA210 => "CompressedBitsPerPixel",
+            0xA217 => "SensingMethod",
+            0xA300 => "FileSource",
+            0xA301 => "SceneType",
+            0xA302 => "CFAPattern",
+            0xA401 => "CustomRendered",
+            0xA402 => "ExposureMode",
+            0xA403 => "WhiteBalance",
+            0xA404 => "DigitalZoomRatio",
+            0xA405 => "FocalLengthIn35mmFilm",
+            0xA406 => "SceneCaptureType",
+            0xA407 => "GainControl",
+            0xA408 => "Contrast",
+            0xA409 => "Saturation",
+            0xA40A => "Sharpness",
+            0xA40B => "DeviceSettingDescription",
+            0xA40C => "SubjectDistanceRange",
+            0xA420 => "ImageUniqueID",
+            0xA430 => "CameraOwnerName",
+            0xA431 => "BodySerialNumber",
+            0xA432 => "LensSpecification",
+            0xA433 => "LensMake",
+            0xA434 => "LensModel",
+            0xA435 => "LensSerialNumber",
+            0x927C => "MakerNote",
+            _ => return Cow::Owned(format!("UnknownTag_{:04X}", tag_id)),
+        })
     }
 
-    /// Find sub-IFD offset for a specific tag
-    fn find_sub_ifd_offset(
+    /// Find the offsets for several sub-IFD tags in a single pass over an IFD
+    fn find_sub_ifd_offsets<const N: usize>(
         data: &[u8],
         ifd_offset: usize,
-        target_tag: u16,
+        target_tags: [u16; N],
         is_little_endian: bool,
-        _tiff_start: usize,
-    ) -> Option<u32> {
+    ) -> [Option<u32>; N] {
+        let mut offsets = [None; N];
         if ifd_offset + 2 > data.len() {
-            return None;
+            return offsets;
         }
 
         let entry_count = if is_little_endian {
@@ -1101,39 +1036,32 @@ impl TiffParser {
             u16::from_be_bytes([data[ifd_offset], data[ifd_offset + 1]])
         };
 
-        for i in 0..entry_count {
-            let entry_offset = ifd_offset + 2 + (i as usize * 12);
-            if entry_offset + 12 > data.len() {
-                continue;
-            }
-
+        let table_start = ifd_offset + 2;
+        let table_end = (table_start + entry_count as usize * 12).min(data.len());
+        let mut remaining = N;
+        for entry in data[table_start..table_end].chunks_exact(12) {
             let tag_id = if is_little_endian {
-                u16::from_le_bytes([data[entry_offset], data[entry_offset + 1]])
+                u16::from_le_bytes([entry[0], entry[1]])
             } else {
-                u16::from_be_bytes([data[entry_offset], data[entry_offset + 1]])
+                u16::from_be_bytes([entry[0], entry[1]])
             };
 
-            if tag_id == target_tag {
-                let value_offset = if is_little_endian {
-                    u32::from_le_bytes([
-                        data[entry_offset + 8],
-                        data[entry_offset + 9],
-                        data[entry_offset + 10],
-                        data[entry_offset + 11],
-                    ])
-                } else {
-                    u32::from_be_bytes([
-                        data[entry_offset + 8],
-                        data[entry_offset + 9],
-                        data[entry_offset + 10],
-                        data[entry_offset + 11],
-                    ])
-                };
-                return Some(value_offset);
+            if let Some(slot) = target_tags.iter().position(|&tag| tag == tag_id) {
+                if offsets[slot].is_none() {
+                    offsets[slot] = Some(if is_little_endian {
+                        u32::from_le_bytes([entry[8], entry[9], entry[10], entry[11]])
+                    } else {
+                        u32::from_be_bytes([entry[8], entry[9], entry[10], entry[11]])
+                    });
+                    remaining -= 1;
+                    if remaining == 0 {
+                        break;
+                    }
+                }
             }
         }
 
-        None
+        offsets
     }
 
     /// Parse GPS IFD and extract GPS metadata
@@ -1218,7 +1146,6 @@ impl TiffParser {
             ])
         };
 
-        let _tag_name = Self::get_gps_tag_name(tag_id);
         Self::parse_gps_tag_value(
             data,
             tag_id,
@@ -1234,31 +1161,31 @@ impl TiffParser {
     }
 
     /// Get GPS tag name from tag ID
-    fn get_gps_tag_name(tag_id: u16) -> String {
-        match tag_id {
-            0x0000 => "GPSVersionID".to_string(),
-            0x0001 => "GPSLatitudeRef".to_string(),
-            0x0002 => "GPSLatitude".to_string(),
-            0x0003 => "GPSLongitudeRef".to_string(),
-            0x0004 => "GPSLongitude".to_string(),
-            0x0005 => "GPSAltitudeRef".to_string(),
-            0x0006 => "GPSAltitude".to_string(),
-            0x0007 => "GPSTimeStamp".to_string(),
-            0x0008 => "GPSSatellites".to_string(),
-            0x0009 => "GPSStatus".to_string(),
-            0x000A => "GPSMeasureMode".to_string(),
-            0x000B => "GPSDOP".to_string(),
-            0x000C => "GPSSpeedRef".to_string(),
-            0x000D => "GPSSpeed".to_string(),
-            0x000E => "GPSTrackRef".to_string(),
-            0x000F => "GPSTrack".to_string(),
-            0x0010 => "GPSImgDirectionRef".to_string(),
-            0x0011 => "GPSImgDirection".to_string(),
-            0x0012 => "GPSMapDatum".to_string(),
-            0x001D => "GPSDateStamp".to_string(),
-            0x001E => "GPSDifferential".to_string(),
-            _ => format!("GPSUnknown{:04X}", tag_id),
-        }
+    fn get_gps_tag_name(tag_id: u16) -> Cow<'static, str> {
+        Cow::Borrowed(match tag_id {
+            0x0000 => "GPSVersionID",
+            0x0001 => "GPSLatitudeRef",
+            0x0002 => "GPSLatitude",
+            0x0003 => "GPSLongitudeRef",
+            0x0004 => "GPSLongitude",
+            0x0005 => "GPSAltitudeRef",
+            0x0006 => "GPSAltitude",
+            0x0007 => "GPSTimeStamp",
+            0x0008 => "GPSSatellites",
+            0x0009 => "GPSStatus",
+            0x000A => "GPSMeasureMode",
+            0x000B => "GPSDOP",
+            0x000C => "GPSSpeedRef",
+            0x000D => "GPSSpeed",
+            0x000E => "GPSTrackRef",
+            0x000F => "GPSTrack",
+            0x0010 => "GPSImgDirectionRef",
+            0x0011 => "GPSImgDirection",
+            0x0012 => "GPSMapDatum",
+            0x001D => "GPSDateStamp",
+            0x001E => "GPSDifferential",
+            _ => return Cow::Owned(format!("GPSUnknown{:04X}", tag_id)),
+        })
     }
 
     /// Parse GPS tag value based on type and count
@@ -1288,7 +1215,7 @@ impl TiffParser {
                             ((value_offset >> 16) & 0xFF) as u8,
                             ((value_offset >> 24) & 0xFF) as u8
                         );
-                        metadata.insert(tag_name, version);
+                        metadata.insert(tag_name.into_owned(), version);
                     } else {
                         let value = if is_little_endian {
                             value_offset as u8
@@ -1296,7 +1223,7 @@ impl TiffParser {
                             (value_offset >> 24) as u8
                         };
                         let formatted_value = Self::format_gps_field(tag_id, value as u32);
-                        metadata.insert(tag_name, formatted_value);
+                        metadata.insert(tag_name.into_owned(), formatted_value);
                     }
                 } else {
                     let offset = tiff_start + value_offset as usize;
@@ -1308,7 +1235,7 @@ impl TiffParser {
                             // GPSVersionID is stored as 4 bytes in little-endian order
                             // Read bytes in correct order (little-endian: last byte is major version)
                             let version = format!("{}.{}.{}.{}", bytes[3], bytes[2], bytes[1], bytes[0]);
-                            metadata.insert(tag_name, version);
+                            metadata.insert(tag_name.into_owned(), version);
                         } else if let Ok(string) = String::from_utf8(bytes.to_vec()) {
                             let cleaned_string = string.trim_end_matches('\0').trim().to_string();
                             
@@ -1333,7 +1260,7 @@ impl TiffParser {
                                 _ => cleaned_string,
                             };
                             
-                            metadata.insert(tag_name, formatted_string);
+                            metadata.insert(tag_name.into_owned(), formatted_string);
                         }
                     }
                 }
@@ -1370,7 +1297,7 @@ impl TiffParser {
                             _ => cleaned_string,
                         };
                         
-                        metadata.insert(tag_name, formatted_string);
+                        metadata.insert(tag_name.into_owned(), formatted_string);
                     }
                 } else {
                     let offset = tiff_start + value_offset as usize;
@@ -1400,7 +1327,7 @@ impl TiffParser {
                                 _ => cleaned_string,
                             };
                             
-                            metadata.insert(tag_name, formatted_string);
+                            metadata.insert(tag_name.into_owned(), formatted_string);
                         }
                     }
                 }
@@ -1414,14 +1341,14 @@ impl TiffParser {
                         (value_offset >> 16) as u16
                     };
                     let formatted_value = Self::format_gps_field(tag_id, value as u32);
-                    metadata.insert(tag_name, formatted_value);
+                    metadata.insert(tag_name.into_owned(), formatted_value);
                 }
             }
             4 => {
                 // LONG
                 if count == 1 {
                     let formatted_value = Self::format_gps_field(tag_id, value_offset);
-                    metadata.insert(tag_name, formatted_value);
+                    metadata.insert(tag_name.into_owned(), formatted_value);
                 }
             }
             5 => {
@@ -1429,40 +1356,11 @@ impl TiffParser {
                 if count == 1 {
                     let offset = tiff_start + value_offset as usize;
                     if offset + 8 <= data.len() {
-                        let numerator = if is_little_endian {
-                            u32::from_le_bytes([
-                                data[offset],
-                                data[offset + 1],
-                                data[offset + 2],
-                                data[offset + 3],
-                            ])
-                        } else {
-                            u32::from_be_bytes([
-                                data[offset],
-                                data[offset + 1],
-                                data[offset + 2],
-                                data[offset + 3],
-                            ])
-                        };
-
-                        let denominator = if is_little_endian {
-                            u32::from_le_bytes([
-                                data[offset + 4],
-                                data[offset + 5],
-                                data[offset + 6],
-                                data[offset + 7],
-                            ])
-                        } else {
-                            u32::from_be_bytes([
-                                data[offset + 4],
-                                data[offset + 5],
-                                data[offset + 6],
-                                data[offset + 7],
-                            ])
-                        };
+                        let (numerator, denominator) =
+                            Self::read_rational(data, offset, is_little_endian);
 
                         let formatted_value = Self::format_gps_rational(tag_id, numerator, denominator);
-                        metadata.insert(tag_name, formatted_value);
+                        metadata.insert(tag_name.into_owned(), formatted_value);
                     }
                 } else if count == 3 {
                     // GPS coordinates (latitude/longitude) or GPSTimeStamp - 3 rationals
@@ -1475,13 +1373,13 @@ impl TiffParser {
                             // GPS coordinates (latitude/longitude)
                             Self::format_gps_coordinates(data, offset, is_little_endian, tag_id)
                         };
-                        metadata.insert(tag_name, formatted_value);
+                        metadata.insert(tag_name.into_owned(), formatted_value);
                     }
                 }
             }
             _ => {
                 // For other types, just store the raw value
-                metadata.insert(tag_name, value_offset.to_string());
+                metadata.insert(tag_name.into_owned(), value_offset.to_string());
             }
         }
 
@@ -1627,37 +1525,8 @@ impl TiffParser {
         for i in 0..3 {
             let rational_offset = offset + (i * 8);
             if rational_offset + 8 <= data.len() {
-                let numerator = if is_little_endian {
-                    u32::from_le_bytes([
-                        data[rational_offset],
-                        data[rational_offset + 1],
-                        data[rational_offset + 2],
-                        data[rational_offset + 3],
-                    ])
-                } else {
-                    u32::from_be_bytes([
-                        data[rational_offset],
-                        data[rational_offset + 1],
-                        data[rational_offset + 2],
-                        data[rational_offset + 3],
-                    ])
-                };
-
-                let denominator = if is_little_endian {
-                    u32::from_le_bytes([
-                        data[rational_offset + 4],
-                        data[rational_offset + 5],
-                        data[rational_offset + 6],
-                        data[rational_offset + 7],
-                    ])
-                } else {
-                    u32::from_be_bytes([
-                        data[rational_offset + 4],
-                        data[rational_offset + 5],
-                        data[rational_offset + 6],
-                        data[rational_offset + 7],
-                    ])
-                };
+                let (numerator, denominator) =
+                    Self::read_rational(data, rational_offset, is_little_endian);
 
                 let value = if denominator != 0 {
                     numerator as f64 / denominator as f64
@@ -1693,37 +1562,8 @@ impl TiffParser {
         for i in 0..3 {
             let rational_offset = offset + (i * 8);
             if rational_offset + 8 <= data.len() {
-                let numerator = if is_little_endian {
-                    u32::from_le_bytes([
-                        data[rational_offset],
-                        data[rational_offset + 1],
-                        data[rational_offset + 2],
-                        data[rational_offset + 3],
-                    ])
-                } else {
-                    u32::from_be_bytes([
-                        data[rational_offset],
-                        data[rational_offset + 1],
-                        data[rational_offset + 2],
-                        data[rational_offset + 3],
-                    ])
-                };
-
-                let denominator = if is_little_endian {
-                    u32::from_le_bytes([
-                        data[rational_offset + 4],
-                        data[rational_offset + 5],
-                        data[rational_offset + 6],
-                        data[rational_offset + 7],
-                    ])
-                } else {
-                    u32::from_be_bytes([
-                        data[rational_offset + 4],
-                        data[rational_offset + 5],
-                        data[rational_offset + 6],
-                        data[rational_offset + 7],
-                    ])
-                };
+                let (numerator, denominator) =
+                    Self::read_rational(data, rational_offset, is_little_endian);
 
                 let value = if denominator != 0 {
                     numerator as f64 / denominator as f64
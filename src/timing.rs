@@ -0,0 +1,147 @@
+//! Fixed-size histogram of per-file read times, for percentile reporting
+
+use std::time::Duration;
+
+/// Exact buckets for the smallest values, and sub-buckets per power of two above
+const SUB_BUCKETS: usize = 16;
+
+/// Enough log-linear buckets to cover every u64 nanosecond value
+const BUCKETS: usize = (64 - 3) * SUB_BUCKETS;
+
+/// Log-linear histogram of durations, so memory stays the same however many
+/// values are recorded. Percentiles are within 1/16 of the true value.
+#[derive(Clone)]
+pub struct TimingHistogram {
+    buckets: [u64; BUCKETS],
+    count: u64,
+}
+
+impl TimingHistogram {
+    /// Create an empty histogram
+    pub fn new() -> Self {
+        Self {
+            buckets: [0; BUCKETS],
+            count: 0,
+        }
+    }
+
+    /// Record one duration
+    pub fn record(&mut self, time: Duration) {
+        let nanos = time.as_nanos().min(u64::MAX as u128) as u64;
+        self.buckets[Self::bucket_index(nanos)] += 1;
+        self.count += 1;
+    }
+
+    /// Number of durations recorded
+    pub fn count(&self) -> u64 {
+        self.count
+    }
+
+    /// Nearest-rank percentile, taken at the midpoint of the bucket it falls in
+    pub fn percentile(&self, p: u64) -> Duration {
+        if self.count == 0 {
+            return Duration::ZERO;
+        }
+        // The smallest value with at least p% of the values at or below it
+        let rank = ((self.count * p).div_ceil(100).max(1) - 1).min(self.count - 1);
+        let mut seen = 0;
+        for (index, &bucket_count) in self.buckets.iter().enumerate() {
+            seen += bucket_count;
+            if seen > rank {
+                return Duration::from_nanos(Self::bucket_value(index));
+            }
+        }
+        Duration::ZERO
+    }
+
+    /// Values below 16 get a bucket each; above that, each power of two is split
+    /// into 16 buckets keyed on the four bits after the leading one
+    fn bucket_index(nanos: u64) -> usize {
+        if nanos < SUB_BUCKETS as u64 {
+            return nanos as usize;
+        }
+        let exponent = 63 - nanos.leading_zeros() as usize;
+        let mantissa = (nanos >> (exponent - 4)) as usize & (SUB_BUCKETS - 1);
+        (exponent - 3) * SUB_BUCKETS + mantissa
+    }
+
+    /// Midpoint of the range of values that land in a bucket, in nanoseconds
+    fn bucket_value(index: usize) -> u64 {
+        if index < SUB_BUCKETS {
+            return index as u64;
+        }
+        let exponent = index / SUB_BUCKETS + 3;
+        let mantissa = (index % SUB_BUCKETS) as u64;
+        let width = 1u64 << (exponent - 4);
+        (SUB_BUCKETS as u64 + mantissa) * width + width / 2
+    }
+}
+
+impl Default for TimingHistogram {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_bucket_index_in_range() {
+        for nanos in [0, 15, 16, 31, 32, u64::MAX] {
+            assert!(TimingHistogram::bucket_index(nanos) < BUCKETS, "{}", nanos);
+        }
+        assert_eq!(TimingHistogram::bucket_index(u64::MAX), BUCKETS - 1);
+    }
+
+    #[test]
+    fn test_bucket_value_close_to_recorded() {
+        // Powers of two and their neighbours, plus a spread of other values
+        let mut values: Vec<u64> = (0..64)
+            .flat_map(|shift| {
+                let power = 1u64 << shift;
+                [power - 1, power, power.saturating_add(1)]
+            })
+            .collect();
+        let mut x = 0x9E37_79B9_7F4A_7C15u64;
+        for _ in 0..1000 {
+            x ^= x << 13;
+            x ^= x >> 7;
+            x ^= x << 17;
+            values.push(x >> (x % 64));
+        }
+
+        for nanos in values {
+            let value = TimingHistogram::bucket_value(TimingHistogram::bucket_index(nanos));
+            assert!(value.abs_diff(nanos) <= nanos / 16, "{} came back as {}", nanos, value);
+        }
+    }
+
+    #[test]
+    fn test_empty_and_oversized() {
+        let mut histogram = TimingHistogram::new();
+        assert_eq!(histogram.percentile(50), Duration::ZERO);
+
+        // Durations past u64 nanoseconds land in the last bucket
+        histogram.record(Duration::MAX);
+        assert_eq!(histogram.count(), 1);
+        assert!(histogram.percentile(50) > Duration::from_secs(1 << 33));
+    }
+
+    #[test]
+    fn test_percentile_nearest_rank() {
+        // Values below 16ns have a bucket each, so percentiles come back exact
+        let mut histogram = TimingHistogram::new();
+        for nanos in 0..10 {
+            histogram.record(Duration::from_nanos(nanos));
+        }
+
+        assert_eq!(histogram.percentile(0), Duration::from_nanos(0));
+        assert_eq!(histogram.percentile(10), Duration::from_nanos(0));
+        assert_eq!(histogram.percentile(50), Duration::from_nanos(4));
+        assert_eq!(histogram.percentile(90), Duration::from_nanos(8));
+        assert_eq!(histogram.percentile(99), Duration::from_nanos(9));
+        assert_eq!(histogram.percentile(100), Duration::from_nanos(9));
+    }
+}
@@ -1,4 +1,13 @@
+use std::borrow::Cow;
 use std::collections::HashMap;
+use std::sync::OnceLock;
+use crate::field_mapping::FieldMapper;
+
+/// Formats a single field value
+type ValueFormatterFn = fn(&str) -> String;
+
+/// Exiftool field name and optional value formatter for a source field
+type FieldNormalizer = (&'static str, Option<ValueFormatterFn>);
 
 /// Value formatter to match PyExifTool raw value formats
 pub struct ValueFormatter;
@@ -11,81 +20,160 @@ impl ValueFormatter {
         metadata.remove("ExifToolVersion");
         
         for (key, value) in metadata.iter_mut() {
-            *value = Self::format_value_for_exiftool(key, value);
+            if let Some(formatted) = Self::format_value_for_exiftool(key, value) {
+                *value = formatted;
+            }
         }
     }
     
+    /// Normalize field names and values to exiftool format in place
+    pub fn normalize_metadata_to_exiftool(metadata: &mut HashMap<String, String>) {
+        let normalizers = Self::normalizers();
+        
+        // Values are formatted in place and only renamed fields are moved, so a
+        // field that keeps its name is neither rehashed nor reinserted
+        let mut renames = Vec::new();
+        for (key, value) in metadata.iter_mut() {
+            // Fields with neither a mapping nor a formatter pass through untouched
+            if let Some((&source, &(name, format))) = normalizers.get_key_value(key.as_str()) {
+                if let Some(format) = format {
+                    *value = format(value);
+                }
+                if name != source {
+                    renames.push((source, name));
+                }
+            }
+        }
+        
+        // Take every renamed value out before inserting any, so a field renamed to
+        // the name of another source field is not renamed a second time
+        let renamed: Vec<_> = renames
+            .into_iter()
+            .filter_map(|(source, name)| metadata.remove(source).map(|value| (name, value)))
+            .collect();
+        metadata.extend(renamed.into_iter().map(|(name, value)| (name.to_string(), value)));
+        
+        // ExifToolVersion is only meaningful when ExifTool itself processed the file
+        metadata.remove("ExifToolVersion");
+    }
+    
+    /// Source field name to (exiftool name, formatter) table, built once
+    ///
+    /// Fuses the field mapper and the formatter table so each field costs one
+    /// lookup. A formatter is keyed on the exiftool name, so mapped fields pick
+    /// up the formatter of the name they are renamed to.
+    fn normalizers() -> &'static HashMap<&'static str, FieldNormalizer> {
+        static NORMALIZERS: OnceLock<HashMap<&'static str, FieldNormalizer>> = OnceLock::new();
+        NORMALIZERS.get_or_init(|| {
+            let formatters = Self::formatters();
+            let mut table: HashMap<&'static str, FieldNormalizer> = formatters
+                .iter()
+                .map(|(&name, &format)| (name, (name, Some(format))))
+                .collect();
+            for (source, target) in FieldMapper::shared().exiftool_mappings() {
+                table.insert(source, (target, formatters.get(target).copied()));
+            }
+            table
+        })
+    }
+    
     /// Format a specific field value to match PyExifTool raw format
-    fn format_value_for_exiftool(field_name: &str, value: &str) -> String {
-        match field_name {
-            // Flash values: Convert "Off, Did not fire" → "16"
-            "Flash" => Self::format_flash_value(value),
+    ///
+    /// Returns `None` for fields that are passed through unchanged.
+    fn format_value_for_exiftool(field_name: &str, value: &str) -> Option<String> {
+        Self::formatters().get(field_name).map(|format| format(value))
+    }
+    
+    /// Field name to formatter dispatch table, built once
+    ///
+    /// A single hash lookup replaces a linear chain of string comparisons, which
+    /// every unformatted field previously had to fall all the way through.
+    fn formatters() -> &'static HashMap<&'static str, ValueFormatterFn> {
+        static FORMATTERS: OnceLock<HashMap<&'static str, ValueFormatterFn>> = OnceLock::new();
+        FORMATTERS.get_or_init(|| {
+            let table: &[(&'static str, ValueFormatterFn)] = &[
+                // Flash values: Convert "Off, Did not fire" → "16"
+                ("Flash", Self::format_flash_value),
             
-            // FocalLength values: Convert "200.0 mm" → "1612.69894386544"
-            "FocalLength" => Self::format_focal_length_value(value),
+                // FocalLength values: Convert "200.0 mm" → "1612.69894386544"
+                ("FocalLength", Self::format_focal_length_value),
             
-            // ImageSize values: Convert "5568x3712" → "5568 3712"
-            "ImageSize" => Self::format_image_size_value(value),
+                // ImageSize values: Convert "5568x3712" → "5568 3712"
+                ("ImageSize", Self::format_image_size_value),
             
-            // FocusMode values: Convert "Auto" → "AF-C"
-            "FocusMode" => Self::format_focus_mode_value(value),
+                // FocusMode values: Convert "Auto" → "AF-C"
+                ("FocusMode", Self::format_focus_mode_value),
             
-            // DateTime values: Add subsecond precision
-            "ModifyDate" | "CreateDate" | "DateTimeCreated" => {
-                Self::format_datetime_value(value)
-            },
+                // DateTime values: Add subsecond precision
+                ("ModifyDate", Self::format_datetime_value),
+                ("CreateDate", Self::format_datetime_value),
+                ("DateTimeCreated", Self::format_datetime_value),
             
-            // Numeric enum values
-            "CustomRendered" => Self::format_custom_rendered_value(value),
-            "Sharpness" => Self::format_sharpness_value(value),
-            "SceneCaptureType" => Self::format_scene_capture_type_value(value),
-            "ColorSpace" => Self::format_color_space_value(value),
-            "ResolutionUnit" => Self::format_resolution_unit_value(value),
-            "ComponentsConfiguration" => Self::format_components_configuration_value(value),
+                // Numeric enum values
+                ("CustomRendered", Self::format_custom_rendered_value),
+                ("Sharpness", Self::format_sharpness_value),
+                ("SceneCaptureType", Self::format_scene_capture_type_value),
+                ("ColorSpace", Self::format_color_space_value),
+                ("ResolutionUnit", Self::format_resolution_unit_value),
+                ("ComponentsConfiguration", Self::format_components_configuration_value),
             
-            // Computed fields with higher precision
-            "Megapixels" => Self::format_megapixels_value(value),
-            "LightValue" => Self::format_light_value_value(value),
+                // Computed fields with higher precision
+                ("Megapixels", Self::format_megapixels_value),
+                ("LightValue", Self::format_light_value_value),
             
-            // Additional enum values
-            "Contrast" => Self::format_contrast_value(value),
-            "LightSource" => Self::format_light_source_value(value),
-            "ExposureProgram" => Self::format_exposure_program_value(value),
-            "EncodingProcess" => Self::format_encoding_process_value(value),
-            "PictureControlVersion" => Self::format_picture_control_version_value(value),
-            "FileTypeExtension" => Self::format_file_type_extension_value(value),
-            "YCbCrPositioning" => Self::format_ycbcr_positioning_value(value),
-            "MeteringMode" => Self::format_metering_mode_value(value),
-            "Saturation" => Self::format_saturation_value(value),
-            "HyperfocalDistance" => Self::format_hyperfocal_distance_value(value),
-            "ExifByteOrder" => Self::format_exif_byte_order_value(value),
-            "WhiteBalance" => Self::format_white_balance_value(value),
-            "ExposureCompensation" => Self::format_exposure_compensation_value(value),
-            "BlueBalance" => Self::format_blue_balance_value(value),
-            "AutoFocus" => Self::format_auto_focus_value(value),
-            "SubjectDistanceRange" => Self::format_subject_distance_range_value(value),
-            "JFIFVersion" => Self::format_jfif_version_value(value),
-            "ShutterSpeed" => Self::format_shutter_speed_value(value),
-            "FocalLength35efl" => Self::format_focal_length_35efl_value(value),
-            "FileModifyDate" => Self::format_file_modify_date_value(value),
-            "FileInodeChangeDate" => Self::format_file_inode_change_date_value(value),
-            "FileAccessDate" => Self::format_file_access_date_value(value),
-            "ExposureTime" => Self::format_exposure_time_value(value),
-            "YCbCrSubSampling" => Self::format_ycbcr_subsampling_value(value),
-            "DateTimeOriginal" => Self::format_datetime_original_value(value),
-            "MultiExposureShots" => Self::format_multi_exposure_shots_value(value),
-            "ExposureMode" => Self::format_exposure_mode_value(value),
-            "CircleOfConfusion" => Self::format_circle_of_confusion_value(value),
-            "GainControl" => Self::format_gain_control_value(value),
-            
-            // Default: return as-is
-            _ => value.to_string(),
+                // Additional enum values
+                ("Contrast", Self::format_contrast_value),
+                ("LightSource", Self::format_light_source_value),
+                ("ExposureProgram", Self::format_exposure_program_value),
+                ("EncodingProcess", Self::format_encoding_process_value),
+                ("PictureControlVersion", Self::format_picture_control_version_value),
+                ("FileTypeExtension", Self::format_file_type_extension_value),
+                ("YCbCrPositioning", Self::format_ycbcr_positioning_value),
+                ("MeteringMode", Self::format_metering_mode_value),
+                ("Saturation", Self::format_saturation_value),
+                ("HyperfocalDistance", Self::format_hyperfocal_distance_value),
+                ("ExifByteOrder", Self::format_exif_byte_order_value),
+                ("WhiteBalance", Self::format_white_balance_value),
+                ("ExposureCompensation", Self::format_exposure_compensation_value),
+                ("BlueBalance", Self::format_blue_balance_value),
+                ("AutoFocus", Self::format_auto_focus_value),
+                ("SubjectDistanceRange", Self::format_subject_distance_range_value),
+                ("JFIFVersion", Self::format_jfif_version_value),
+                ("ShutterSpeed", Self::format_shutter_speed_value),
+                ("FocalLength35efl", Self::format_focal_length_35efl_value),
+                ("FileModifyDate", Self::format_file_modify_date_value),
+                ("FileInodeChangeDate", Self::format_file_inode_change_date_value),
+                ("FileAccessDate", Self::format_file_access_date_value),
+                ("ExposureTime", Self::format_exposure_time_value),
+                ("YCbCrSubSampling", Self::format_ycbcr_subsampling_value),
+                ("DateTimeOriginal", Self::format_datetime_original_value),
+                ("MultiExposureShots", Self::format_multi_exposure_shots_value),
+                ("ExposureMode", Self::format_exposure_mode_value),
+                ("CircleOfConfusion", Self::format_circle_of_confusion_value),
+                ("GainControl", Self::format_gain_control_value),
+            ];
+            table.iter().copied().collect()
+        })
+    }
+    
+    /// Lowercase a value for matching, borrowing it when there is nothing to fold
+    fn lowercase(value: &str) -> Cow<'_, str> {
+        if value.is_ascii() && !value.bytes().any(|b| b.is_ascii_uppercase()) {
+            Cow::Borrowed(value)
+        } else {
+            Cow::Owned(value.to_lowercase())
         }
     }
     
+    /// Strip a trailing unit (e.g. "mm") and surrounding whitespace without allocating
+    pub(crate) fn strip_unit_suffix<'a>(value: &'a str, unit: &str) -> &'a str {
+        let trimmed = value.trim();
+        trimmed.strip_suffix(unit).unwrap_or(trimmed).trim_end()
+    }
+    
     /// Format Flash value to raw numeric format
     fn format_flash_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "off, did not fire" | "off" | "no flash" => "16".to_string(),
             "fired" | "on" | "yes" => "0".to_string(),
             "fired, return not detected" => "1".to_string(),
@@ -113,8 +201,7 @@ impl ValueFormatter {
     /// Format FocalLength value to exiftool format
     fn format_focal_length_value(value: &str) -> String {
         // Remove "mm" suffix and parse as float
-        let cleaned = value.replace(" mm", "").replace("mm", "");
-        if let Ok(_focal_length) = cleaned.parse::<f64>() {
+        if let Ok(_focal_length) = Self::strip_unit_suffix(value, "mm").parse::<f64>() {
             // Return exact exiftool value: 1612.69894386544
             "1612.69894386544".to_string()
         } else {
@@ -133,7 +220,7 @@ impl ValueFormatter {
     
     /// Format FocusMode value to raw format
     fn format_focus_mode_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "auto" | "automatic" => "AF-C".to_string(),
             "manual" => "MF".to_string(),
             "single" | "single-shot" => "AF-S".to_string(),
@@ -154,7 +241,7 @@ impl ValueFormatter {
     
     /// Format CustomRendered value to numeric
     fn format_custom_rendered_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "normal" => "0".to_string(),
             "custom" => "1".to_string(),
             _ => {
@@ -169,7 +256,7 @@ impl ValueFormatter {
     
     /// Format Sharpness value to numeric
     fn format_sharpness_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "soft" => "0".to_string(),
             "normal" => "12".to_string(),
             "hard" => "24".to_string(),
@@ -185,7 +272,7 @@ impl ValueFormatter {
     
     /// Format SceneCaptureType value to numeric
     fn format_scene_capture_type_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "standard" => "0".to_string(),
             "landscape" => "1".to_string(),
             "portrait" => "2".to_string(),
@@ -208,7 +295,7 @@ impl ValueFormatter {
     
     /// Format ResolutionUnit value to numeric
     fn format_resolution_unit_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "none" => "1".to_string(),
             "inches" => "2".to_string(),
             "centimeters" => "3".to_string(),
@@ -224,7 +311,7 @@ impl ValueFormatter {
     
     /// Format ComponentsConfiguration value to numeric
     fn format_components_configuration_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "y, cb, cr, -" => "1 2 3 0".to_string(),
             "y, cb, cr, y" => "1 2 3 1".to_string(),
             "y, cb, cr, cb" => "1 2 3 2".to_string(),
@@ -257,7 +344,7 @@ impl ValueFormatter {
     
     /// Format Contrast value to numeric
     fn format_contrast_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "soft" => "0".to_string(),
             "normal" => "0".to_string(),
             "hard" => "1".to_string(),
@@ -273,7 +360,7 @@ impl ValueFormatter {
     
     /// Format LightSource value to numeric
     fn format_light_source_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "unknown" => "0".to_string(),
             "daylight" => "1".to_string(),
             "fluorescent" => "2".to_string(),
@@ -298,7 +385,7 @@ impl ValueFormatter {
     
     /// Format ExposureProgram value to numeric
     fn format_exposure_program_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "manual" => "1".to_string(),
             "program" => "2".to_string(),
             "aperture-priority" | "aperture priority" => "3".to_string(),
@@ -319,7 +406,7 @@ impl ValueFormatter {
     
     /// Format Orientation value to numeric
     fn format_orientation_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "horizontal (normal)" | "normal" => "1".to_string(),
             "mirror horizontal" => "2".to_string(),
             "rotate 180" => "3".to_string(),
@@ -340,7 +427,7 @@ impl ValueFormatter {
     
     /// Format EncodingProcess value to numeric
     fn format_encoding_process_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "baseline dct, huffman coding" => "0".to_string(),
             "extended sequential dct, huffman coding" => "1".to_string(),
             "progressive dct, huffman coding" => "2".to_string(),
@@ -376,7 +463,7 @@ impl ValueFormatter {
     
     /// Format YCbCrPositioning value to numeric
     fn format_ycbcr_positioning_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "centered" => "1".to_string(),
             "co-sited" => "2".to_string(),
             _ => {
@@ -391,7 +478,7 @@ impl ValueFormatter {
     
     /// Format MeteringMode value to numeric
     fn format_metering_mode_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "unknown" => "0".to_string(),
             "average" => "1".to_string(),
             "center-weighted average" => "2".to_string(),
@@ -412,7 +499,7 @@ impl ValueFormatter {
     
     /// Format Saturation value to numeric
     fn format_saturation_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "low" => "0".to_string(),
             "normal" => "0".to_string(),
             "high" => "1".to_string(),
@@ -429,8 +516,7 @@ impl ValueFormatter {
     /// Format HyperfocalDistance value
     fn format_hyperfocal_distance_value(value: &str) -> String {
         // Remove "m" suffix and return exact exiftool value
-        let cleaned = value.replace(" m", "").replace("m", "");
-        if let Ok(_hd) = cleaned.parse::<f64>() {
+        if let Ok(_hd) = Self::strip_unit_suffix(value, "m").parse::<f64>() {
             // Return exact exiftool value: 181.538246037348
             "181.538246037348".to_string()
         } else {
@@ -440,7 +526,7 @@ impl ValueFormatter {
     
     /// Format ExifByteOrder value to short format
     fn format_exif_byte_order_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "little-endian (intel, ii)" | "little-endian" | "intel" => "II".to_string(),
             "big-endian (motorola, mm)" | "big-endian" | "motorola" => "MM".to_string(),
             _ => value.to_string(),
@@ -449,7 +535,7 @@ impl ValueFormatter {
     
     /// Format WhiteBalance value to exiftool format
     fn format_white_balance_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "auto" => "AUTO1".to_string(),
             "manual" => "MANUAL".to_string(),
             "daylight" => "DAYLIGHT".to_string(),
@@ -497,7 +583,7 @@ impl ValueFormatter {
     
     /// Format AutoFocus value to numeric
     fn format_auto_focus_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "off" => "1".to_string(),
             "on" => "0".to_string(),
             "manual" => "1".to_string(),
@@ -514,7 +600,7 @@ impl ValueFormatter {
     
     /// Format SubjectDistanceRange value to numeric
     fn format_subject_distance_range_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "unknown" => "0".to_string(),
             "macro" => "1".to_string(),
             "close view" => "2".to_string(),
@@ -537,13 +623,10 @@ impl ValueFormatter {
     
     /// Format ShutterSpeed value to decimal format
     fn format_shutter_speed_value(value: &str) -> String {
-        if value.contains('/') {
-            let parts: Vec<&str> = value.split('/').collect();
-            if parts.len() == 2 {
-                if let (Ok(numerator), Ok(denominator)) = (parts[0].parse::<f64>(), parts[1].parse::<f64>()) {
-                    let decimal = numerator / denominator;
-                    return format!("{:.7}", decimal);
-                }
+        if let Some((numerator, denominator)) = value.split_once('/') {
+            if let (Ok(numerator), Ok(denominator)) = (numerator.parse::<f64>(), denominator.parse::<f64>()) {
+                let decimal = numerator / denominator;
+                return format!("{:.7}", decimal);
             }
         }
         value.to_string()
@@ -587,7 +670,7 @@ impl ValueFormatter {
     /// Format YCbCrSubSampling value to space-separated format
     fn format_ycbcr_subsampling_value(value: &str) -> String {
         // Convert "7:14:14" to "1 1"
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "7:14:14" => "1 1".to_string(),
             "4:2:2" => "2 1".to_string(),
             "4:2:0" => "2 2".to_string(),
@@ -598,13 +681,10 @@ impl ValueFormatter {
 
     /// Format ExposureTime value to decimal format
     fn format_exposure_time_value(value: &str) -> String {
-        if value.contains('/') {
-            let parts: Vec<&str> = value.split('/').collect();
-            if parts.len() == 2 {
-                if let (Ok(numerator), Ok(denominator)) = (parts[0].parse::<f64>(), parts[1].parse::<f64>()) {
-                    let decimal = numerator / denominator;
-                    return format!("{:.7}", decimal);
-                }
+        if let Some((numerator, denominator)) = value.split_once('/') {
+            if let (Ok(numerator), Ok(denominator)) = (numerator.parse::<f64>(), denominator.parse::<f64>()) {
+                let decimal = numerator / denominator;
+                return format!("{:.7}", decimal);
             }
         }
         value.to_string()
@@ -621,7 +701,7 @@ impl ValueFormatter {
 
     /// Format MultiExposureShots value to numeric
     fn format_multi_exposure_shots_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "off" | "single" | "1" => "0".to_string(),
             "on" | "multiple" | "2" => "1".to_string(),
             _ => value.to_string(),
@@ -630,7 +710,7 @@ impl ValueFormatter {
 
     /// Format ExposureMode value to numeric
     fn format_exposure_mode_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "auto" => "0".to_string(),
             "manual" => "1".to_string(),
             "auto bracket" => "2".to_string(),
@@ -642,8 +722,7 @@ impl ValueFormatter {
     fn format_circle_of_confusion_value(value: &str) -> String {
         // Extract numeric value from "0.133 mm" -> "0.0200308404192444"
         if value.contains(" mm") {
-            let cleaned = value.replace(" mm", "");
-            if let Ok(_num) = cleaned.parse::<f64>() {
+            if let Ok(_num) = Self::strip_unit_suffix(value, "mm").parse::<f64>() {
                 // Convert to the expected format (this is a specific calculation)
                 return "0.0200308404192444".to_string();
             }
@@ -653,7 +732,7 @@ impl ValueFormatter {
 
     /// Format GainControl value to numeric
     fn format_gain_control_value(value: &str) -> String {
-        match value.to_lowercase().as_str() {
+        match Self::lowercase(value).as_ref() {
             "none" => "0".to_string(),
             "low gain up" => "1".to_string(),
             "high gain up" => "2".to_string(),
@@ -663,3 +742,37 @@ impl ValueFormatter {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn metadata(fields: &[(&str, &str)]) -> HashMap<String, String> {
+        fields.iter().map(|&(key, value)| (key.to_string(), value.to_string())).collect()
+    }
+
+    #[test]
+    fn test_normalize_renamed_field_wins_collision() {
+        // "EXIF:Flash" is renamed to "Flash", which is also present under its own name
+        let mut fields = metadata(&[
+            ("Flash", "Off"),
+            ("EXIF:Flash", "Fired"),
+            ("ExifToolVersion", "12.40"),
+            ("CustomTag", "unchanged"),
+        ]);
+        ValueFormatter::normalize_metadata_to_exiftool(&mut fields);
+
+        assert_eq!(
+            fields,
+            metadata(&[("Flash", "0"), ("CustomTag", "unchanged")])
+        );
+    }
+
+    #[test]
+    fn test_normalize_formats_in_place() {
+        let mut fields = metadata(&[("Flash", "Off"), ("ExifToolVersion", "12.40")]);
+        ValueFormatter::normalize_metadata_to_exiftool(&mut fields);
+
+        assert_eq!(fields, metadata(&[("Flash", "16")]));
+    }
+}
@@ -3,7 +3,8 @@ use crate::utils::ExifUtils;
 use crate::format_detection::FormatDetector;
 use std::collections::HashMap;
 use std::fs::File;
-use std::io::{Read, Write};
+use std::io::Write;
+use memmap2::Mmap;
 use byteorder::{LittleEndian, BigEndian, WriteBytesExt};
 
 /// EXIF writer for adding/modifying EXIF metadata in images
@@ -39,11 +40,17 @@ impl ExifWriter {
         output_path: &str,
         metadata: &HashMap<String, String>,
     ) -> Result<(), ExifError> {
-        let mut input_file = File::open(input_path)?;
-        let mut input_data = Vec::new();
-        input_file.read_to_end(&mut input_data)?;
-
-        let output_data = self.write_exif_to_bytes(&input_data, metadata)?;
+        // Map the input rather than copying it into a buffer; the mapping is
+        // dropped before the output is created, so the two may be the same file
+        let output_data = {
+            let input_file = File::open(input_path)?;
+            let input_data = unsafe { Mmap::map(&input_file)? };
+            // The input is copied through front to back, so let the kernel read
+            // ahead aggressively; only a hint, pages are faulted in on demand anyway
+            #[cfg(unix)]
+            let _ = input_data.advise(memmap2::Advice::Sequential);
+            self.write_exif_to_bytes(&input_data, metadata)?
+        };
 
         let mut output_file = File::create(output_path)?;
         output_file.write_all(&output_data)?;
@@ -62,7 +62,7 @@ declare -a mov_files=(
     "/keg/pictures/2023/03-Mar/20230320_080741.000.mov"
 )
 
-declare -a 3gp_files=(
+declare -a threegp_files=(
     "/keg/pictures/2019/06-Jun/20190623_151056.000.3gp"
     "/keg/pictures/2019/06-Jun/20190623_150354.000.3gp"
     "/keg/pictures/2019/06-Jun/20190623_150450.000.3gp"
@@ -78,6 +78,138 @@ declare -a mkv_files=(
     "/keg/pictures/Digitized VHS Videos/abby_biking_21jun90.vp9.mkv"
 )
 
+# exiftool and fast-exif-rs results are cached on disk, keyed on each file's
+# path, mtime and size (plus the test binary's, for fast-exif-rs, and the
+# exiftool arguments and version, for exiftool), so repeated runs over
+# unchanged files skip re-parsing them
+COMPAT_CACHE_DIR="${XDG_CACHE_HOME:-$HOME/.cache}/fast-exif-rs-compat"
+
+# -fast2 skips trailers and maker notes, -n skips print conversion and
+# -time:all limits extraction to the date/time tags compared here; -q is
+# left off because it also drops the "======== <file>" headers that
+# compare_file splits the report on (stderr is discarded already)
+EXIFTOOL_ARGS=(-s -fast2 -n -time:all)
+EXIFTOOL_VERSION=$(exiftool -ver 2>/dev/null)
+
+# A single exiftool is started on a shell's first cache miss and kept open; it
+# reads each batch's arguments from stdin (-@ -) and answers with "{ready}", so
+# Perl starts at most once per worker and batches are not bound by the argv
+# size limit
+exiftool_batch() {
+    if [ -z "${EXIFTOOL_PID:-}" ]; then
+        coproc EXIFTOOL { exec exiftool -stay_open True -@ - 2>/dev/null; }
+    fi
+    
+    printf '%s\n' "${EXIFTOOL_ARGS[@]}" "$@" -execute >&"${EXIFTOOL[1]}"
+    local line
+    # exiftool prints each file's tags as it goes, so a gap of EXIFTOOL_TIMEOUT
+    # seconds between lines means it is stuck on one file
+    while IFS= read -r -t "$EXIFTOOL_TIMEOUT" line <&"${EXIFTOOL[0]}"; do
+        [ "$line" = "{ready}" ] && return 0
+        printf '%s\n' "$line"
+    done
+    
+    # Timed out or exited: drop this exiftool so the next batch starts a fresh one
+    echo "exiftool gave no output for ${EXIFTOOL_TIMEOUT}s, skipping batch starting at $1" >&2
+    kill "$EXIFTOOL_PID" 2>/dev/null
+    wait "$EXIFTOOL_PID" 2>/dev/null
+    unset EXIFTOOL_PID
+    return 1
+}
+
+stop_exiftool() {
+    if [ -n "${EXIFTOOL_PID:-}" ]; then
+        printf '%s\n' -stay_open False >&"${EXIFTOOL[1]}"
+        wait "$EXIFTOOL_PID"
+    fi
+}
+
+cached_exiftool() {
+    local key
+    # Changing the arguments or upgrading exiftool changes its output, so both
+    # are part of the key
+    key=$({ printf '%s\n' "$EXIFTOOL_VERSION" "${EXIFTOOL_ARGS[@]}"
+            stat -c '%n:%Y:%s' "$@" 2>/dev/null; } | sha1sum | cut -d' ' -f1)
+    local cache_file="$COMPAT_CACHE_DIR/$key.txt"
+    
+    if [ ! -f "$cache_file" ]; then
+        mkdir -p "$COMPAT_CACHE_DIR"
+        if ! exiftool_batch "$@" > "$cache_file.tmp"; then
+            rm -f "$cache_file.tmp"
+            return 1
+        fi
+        mv "$cache_file.tmp" "$cache_file"
+    fi
+    # exiftool only prints its "======== <file>" header when given several files
+    if [ "$#" -eq 1 ]; then
+        echo "======== $1"
+    fi
+    cat "$cache_file"
+}
+
+cached_fast_exif() {
+    local key
+    key=$(stat -c '%n:%Y:%s' "$FAST_EXIF_BIN" "$@" 2>/dev/null | sha1sum | cut -d' ' -f1)
+    local cache_file="$COMPAT_CACHE_DIR/fast-$key.txt"
+    
+    if [ ! -f "$cache_file" ]; then
+        mkdir -p "$COMPAT_CACHE_DIR"
+        # test_single_file takes the whole batch, so one process and one
+        # reader serve every file in it
+        if ! "$FAST_EXIF_BIN" "$@" > "$cache_file.tmp" 2>/dev/null; then
+            rm -f "$cache_file.tmp"
+            return 1
+        fi
+        mv "$cache_file.tmp" "$cache_file"
+    fi
+    # Like exiftool, test_single_file only labels its output for several files
+    if [ "$#" -eq 1 ]; then
+        echo "======== $1"
+    fi
+    cat "$cache_file"
+}
+
+# Print one file's dates from both reports and whether fast-exif-rs found any;
+# reads exiftool_output and fast_exif_report from the calling test_file_type
+compare_file() {
+    local file_path="$1"
+    
+    echo ""
+    # Strip the directory in the shell rather than forking basename per file
+    echo "--- Testing: ${file_path##*/} ---"
+    
+    # Get exiftool dates
+    echo "EXIFTOOL dates:"
+    echo "$exiftool_output" | awk -v f="$file_path" '
+        /^======== / { seen = 1; show = (substr($0, 10) == f); next }
+        !seen || show' | grep -i date | head -10
+    
+    echo ""
+    echo "FAST-EXIF-RS dates:"
+    # Pick this file's section once and reuse it for both display and comparison
+    local fast_exif_output
+    fast_exif_output=$(echo "$fast_exif_report" | awk -v f="$file_path" '
+        /^======== / { show = (substr($0, 10) == f); next }
+        show')
+    [ -n "$fast_exif_output" ] || fast_exif_output="Error running fast-exif-rs"
+    echo "$fast_exif_output"
+    
+    echo ""
+    echo "--- Comparison ---"
+    
+    # Count the indented field lines in one pass, leaving out file system
+    # dates here too rather than relying on the test_single_file that wrote
+    # the (possibly cached) report to have filtered them
+    local meaningful_dates
+    meaningful_dates=$(awk '/^  / && !/^  File(Modify|Access|InodeChange)Date:/ { n++ } END { print n + 0 }' <<< "$fast_exif_output")
+    
+    if [ "$meaningful_dates" -gt 0 ]; then
+        echo "✅ SUCCESS: Found $meaningful_dates meaningful date fields"
+    else
+        echo "❌ FAILURE: Only found file system dates"
+    fi
+}
+
 test_file_type() {
     local file_type="$1"
     local -n files_array="$2"
@@ -86,95 +218,111 @@ test_file_type() {
     echo "TESTING $file_type FILES"
     echo "=================================================================================="
     
-    local success_count=0
     local total_count=${#files_array[@]}
     
-    for file_path in "${files_array[@]}"; do
-        echo ""
-        echo "--- Testing: $(basename "$file_path") ---"
-        
-        # Get exiftool dates
-        echo "EXIFTOOL dates:"
-        exiftool -s "$file_path" | grep -i date | head -10
-        
-        echo ""
-        echo "FAST-EXIF-RS dates:"
-        cd /projects/fast-exif-rs
-        cargo run --quiet --bin test_single_file -- "$file_path" 2>/dev/null || echo "Error running fast-exif-rs"
-        
-        echo ""
-        echo "--- Comparison ---"
-        
-        # Check if fast-exif-rs found any meaningful dates (not just file system dates)
-        cd /projects/fast-exif-rs
-        local fast_exif_output=$(cargo run --quiet --bin test_single_file -- "$file_path" 2>/dev/null)
-        local meaningful_dates=$(echo "$fast_exif_output" | grep -v "FileModifyDate\|FileAccessDate\|FileInodeChangeDate" | grep -i "date\|time\|create\|modify" | wc -l)
-        
-        if [ "$meaningful_dates" -gt 0 ]; then
-            echo "✅ SUCCESS: Found $meaningful_dates meaningful date fields"
-            ((success_count++))
-        else
-            echo "❌ FAILURE: Only found file system dates"
-        fi
+    # exiftool and fast-exif-rs have already run over every test file in
+    # batches; each report has a "======== <file>" header before each file
+    local exiftool_output fast_exif_report
+    exiftool_output=$(<"$EXIFTOOL_REPORT")
+    fast_exif_report=$(<"$FAST_EXIF_REPORT")
+    
+    # Files are independent, so compare them all at once, buffering each
+    # file's output so the report keeps the input order
+    local file_dir
+    file_dir=$(mktemp -d -p "$report_dir")
+    local i
+    for i in "${!files_array[@]}"; do
+        compare_file "${files_array[i]}" > "$file_dir/$i.log" &
+    done
+    wait
+    
+    for i in "${!files_array[@]}"; do
+        cat "$file_dir/$i.log"
     done
     
+    local success_count
+    success_count=$(cat "$file_dir"/*.log | grep -c '^✅ SUCCESS')
+    
     echo ""
     echo "SUMMARY: $success_count/$total_count $file_type files successful"
     echo ""
 }
 
-# Create a simple test binary
 cd /projects/fast-exif-rs
-cat > src/bin/test_single_file.rs << 'EOF'
-use fast_exif_reader::FastExifReader;
-use std::env;
-
-fn main() {
-    let args: Vec<String> = env::args().collect();
-    if args.len() != 2 {
-        eprintln!("Usage: {} <file_path>", args[0]);
-        std::process::exit(1);
-    }
-    
-    let mut reader = FastExifReader::new();
-    let file_path = &args[1];
-    
-    match reader.read_file(file_path) {
-        Ok(metadata) => {
-            // Look for date-related fields
-            let date_fields: Vec<_> = metadata.iter()
-                .filter(|(key, _)| {
-                    let key_lower = key.to_lowercase();
-                    key_lower.contains("date") || key_lower.contains("time") || 
-                    key_lower.contains("create") || key_lower.contains("modify")
-                })
-                .filter(|(_, value)| !value.is_empty())
-                .collect();
-            
-            for (key, value) in date_fields {
-                println!("  {}: {}", key, value);
-            }
-        }
-        Err(e) => {
-            eprintln!("Error: {}", e);
-        }
-    }
-}
-EOF
 
-# Build the test binary
+# Build the test binary once and invoke it directly, instead of going through
+# `cargo run` (and its build freshness check) for each batch
 cargo build --bin test_single_file --quiet
+FAST_EXIF_BIN=/projects/fast-exif-rs/target/debug/test_single_file
+
+# Test each file type in parallel, buffering each type's report so the
+# output still appears in a stable order
+declare -a file_types=(
+    "JPG jpg_files"
+    "CR2 cr2_files"
+    "MP4 mp4_files"
+    "HEIC heic_files"
+    "DNG dng_files"
+    "HIF hif_files"
+    "MOV mov_files"
+    "3GP threegp_files"
+    "MKV mkv_files"
+)
+
+report_dir=$(mktemp -d)
+trap 'rm -rf "$report_dir"' EXIT
+
+# Run exiftool over the test files in batches of EXIFTOOL_BATCH_SIZE, so a
+# changed file only invalidates the cached output of its own batch; a batch
+# that stalls for EXIFTOOL_TIMEOUT seconds is skipped rather than cached
+EXIFTOOL_BATCH_SIZE=${EXIFTOOL_BATCH_SIZE:-200}
+EXIFTOOL_TIMEOUT=${EXIFTOOL_TIMEOUT:-10}
+all_files=()
+for entry in "${file_types[@]}"; do
+    read -r _ array_name <<< "$entry"
+    declare -n type_files="$array_name"
+    all_files+=("${type_files[@]}")
+done
+unset -n type_files
+# The two tools' batches are independent, and exiftool spends most of its
+# time in Perl rather than in this shell, so the fast-exif-rs batches run
+# in the background while the exiftool batches are fed to the coprocess
+FAST_EXIF_REPORT="$report_dir/fast-exif.txt"
+for ((i = 0; i < ${#all_files[@]}; i += EXIFTOOL_BATCH_SIZE)); do
+    cached_fast_exif "${all_files[@]:i:EXIFTOOL_BATCH_SIZE}"
+done > "$FAST_EXIF_REPORT" &
+
+# exiftool runs on a single core, so the batches are dealt out round-robin to
+# EXIFTOOL_JOBS background workers, each with its own stay-open exiftool;
+# every batch's output is buffered and joined in batch order afterwards
+EXIFTOOL_JOBS=${EXIFTOOL_JOBS:-$(nproc)}
+EXIFTOOL_REPORT="$report_dir/exiftool.txt"
+batch_count=$(( (${#all_files[@]} + EXIFTOOL_BATCH_SIZE - 1) / EXIFTOOL_BATCH_SIZE ))
+for ((job = 0; job < EXIFTOOL_JOBS && job < batch_count; job++)); do
+    (
+        for ((batch = job; batch < batch_count; batch += EXIFTOOL_JOBS)); do
+            cached_exiftool "${all_files[@]:batch * EXIFTOOL_BATCH_SIZE:EXIFTOOL_BATCH_SIZE}" \
+                > "$report_dir/exiftool.$batch"
+        done
+        stop_exiftool
+    ) &
+done
+wait
+
+for ((batch = 0; batch < batch_count; batch++)); do
+    cat "$report_dir/exiftool.$batch"
+done > "$EXIFTOOL_REPORT"
+
+for entry in "${file_types[@]}"; do
+    read -r type_name array_name <<< "$entry"
+    test_file_type "$type_name" "$array_name" > "$report_dir/$type_name.log" 2>&1 &
+done
+wait
 
-# Test each file type
-test_file_type "JPG" jpg_files
-test_file_type "CR2" cr2_files  
-test_file_type "MP4" mp4_files
-test_file_type "HEIC" heic_files
-test_file_type "DNG" dng_files
-test_file_type "HIF" hif_files
-test_file_type "MOV" mov_files
-test_file_type "3GP" 3gp_files
-test_file_type "MKV" mkv_files
+for entry in "${file_types[@]}"; do
+    read -r type_name _ <<< "$entry"
+    cat "$report_dir/$type_name.log"
+done
 
 echo "=================================================================================="
 echo "FINAL SUMMARY"
@@ -1,7 +1,8 @@
-use fast_exif_reader::parsers::tiff::TiffParser;
+use fast_exif_reader::{JpegParser, TiffParser};
+use memmap2::Mmap;
 use std::env;
 use std::fs::File;
-use std::io::Read;
+use std::io::{self, BufWriter, Write};
 use std::collections::HashMap;
 
 fn main() -> Result<(), Box<dyn std::error::Error>> {
@@ -12,89 +13,66 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
     }
 
     let file_path = &args[1];
-    println!("Testing individual EXIF segments with file: {}", file_path);
+    let stdout = io::stdout();
+    let mut out = BufWriter::new(stdout.lock());
+    writeln!(out, "Testing individual EXIF segments with file: {}", file_path)?;
 
-    // Read the file as bytes
-    let mut file = File::open(file_path)?;
-    let mut data = Vec::new();
-    file.read_to_end(&mut data)?;
+    // Map the file instead of copying it into memory
+    let file = File::open(file_path)?;
+    let data = unsafe { Mmap::map(&file)? };
 
     // Find all EXIF segments
-    let mut pos = 2;
     let mut segment_count = 0;
-    while pos < data.len().saturating_sub(6) {
-        if data[pos] == 0xFF && data[pos + 1] == 0xE1 {
-            let length = ((data[pos + 2] as u16) << 8) | (data[pos + 3] as u16);
-            let segment_end = pos + 2 + length as usize;
-            
-            if segment_end > data.len() {
-                break;
-            }
+    for segment in JpegParser::exif_segments(&data) {
+        segment_count += 1;
+        writeln!(out, "\n=== EXIF Segment {} ===", segment_count)?;
+        writeln!(out, "Position: {}", segment.position)?;
+        writeln!(out, "Length: {} bytes", segment.length)?;
+        writeln!(out, "EXIF data length: {} bytes", segment.data.len())?;
+
+        // Try to parse this EXIF segment
+        let mut metadata = HashMap::new();
+        match TiffParser::parse_tiff_exif(segment.data, &mut metadata) {
+            Ok(_) => {
+                writeln!(out, "Successfully parsed {} fields:", metadata.len())?;
 
-            // Look for "Exif" identifier
-            let segment_start = pos + 4;
-            for exif_start in segment_start..segment_end.saturating_sub(4) {
-                if &data[exif_start..exif_start + 4] == b"Exif" {
-                    segment_count += 1;
-                    println!("\n=== EXIF Segment {} ===", segment_count);
-                    println!("Position: {}", pos);
-                    println!("Length: {} bytes", length);
-                    println!("EXIF data length: {} bytes", segment_end - exif_start - 4);
-                    
-                    let exif_data_start = exif_start + 4;
-                    if exif_data_start < segment_end {
-                        let exif_data = &data[exif_data_start..segment_end];
-                        
-                        // Try to parse this EXIF segment
-                        let mut metadata = HashMap::new();
-                        match TiffParser::parse_tiff_exif(exif_data, &mut metadata) {
-                            Ok(_) => {
-                                println!("Successfully parsed {} fields:", metadata.len());
-                                
-                                // Look for timestamp fields
-                                let timestamp_fields = [
-                                    "DateTimeOriginal",
-                                    "DateTime",
-                                    "DateTimeDigitized", 
-                                    "CreateDate",
-                                    "ModifyDate",
-                                    "SubSecTimeOriginal",
-                                    "SubSecDateTimeOriginal",
-                                    "OffsetTimeOriginal",
-                                    "TimeZone"
-                                ];
-                                
-                                println!("Timestamp fields found:");
-                                for field in &timestamp_fields {
-                                    if let Some(value) = metadata.get(*field) {
-                                        println!("  {}: {}", field, value);
-                                    }
-                                }
-                                
-                                // Show all fields for debugging
-                                if segment_count == 2 { // Show all fields for the second segment
-                                    println!("\nAll fields in segment {}:", segment_count);
-                                    let mut sorted_keys: Vec<_> = metadata.keys().collect();
-                                    sorted_keys.sort();
-                                    for key in sorted_keys {
-                                        println!("  {}: {}", key, metadata[key]);
-                                    }
-                                }
-                            }
-                            Err(e) => {
-                                println!("Failed to parse EXIF segment: {}", e);
-                            }
-                        }
+                // Look for timestamp fields
+                let timestamp_fields = [
+                    "DateTimeOriginal",
+                    "DateTime",
+                    "DateTimeDigitized",
+                    "CreateDate",
+                    "ModifyDate",
+                    "SubSecTimeOriginal",
+                    "SubSecDateTimeOriginal",
+                    "OffsetTimeOriginal",
+                    "TimeZone"
+                ];
+
+                writeln!(out, "Timestamp fields found:")?;
+                for field in &timestamp_fields {
+                    if let Some(value) = metadata.get(*field) {
+                        writeln!(out, "  {}: {}", field, value)?;
                     }
-                    break;
                 }
+
+                // Show all fields for debugging
+                if segment_count == 2 { // Show all fields for the second segment
+                    writeln!(out, "\nAll fields in segment {}:", segment_count)?;
+                    let mut sorted_keys: Vec<_> = metadata.keys().collect();
+                    sorted_keys.sort();
+                    for key in sorted_keys {
+                        writeln!(out, "  {}: {}", key, metadata[key])?;
+                    }
+                }
+            }
+            Err(e) => {
+                writeln!(out, "Failed to parse EXIF segment: {}", e)?;
             }
-            pos = segment_end;
-        } else {
-            pos += 1;
         }
     }
 
-    println!("\nTotal EXIF segments found: {}", segment_count);
+    writeln!(out, "\nTotal EXIF segments found: {}", segment_count)?;
+    out.flush()?;
     Ok(())
 }